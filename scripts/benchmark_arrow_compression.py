@@ -0,0 +1,110 @@
+"""
+Compares Arrow IPC compression codecs for typical graph construction and export tables.
+
+Uploads and downloads run against a local Flight server, so the timings mostly reflect the encoding cost.
+The estimated transfer time adds the time needed to move the serialized bytes over a link of the given bandwidth,
+which is where compression pays off for remote sessions.
+
+Usage: python scripts/benchmark_arrow_compression.py [--rows 5000000] [--bandwidth-mbit 200]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from typing import Any
+
+import numpy as np
+import pyarrow as pa
+from pyarrow import flight, ipc
+
+from graphdatascience.arrow_client.authenticated_flight_client import AuthenticatedArrowClient, IpcCompression
+
+CODECS: list[IpcCompression | None] = [None, "lz4", "zstd"]
+
+
+class BenchmarkFlightServer(flight.FlightServerBase):  # type: ignore
+    def __init__(self, table: pa.Table) -> None:
+        super().__init__("grpc://localhost:0")
+        self._table = table
+        self.download_compression: IpcCompression | None = None
+
+    def do_put(self, context: Any, descriptor: Any, reader: Any, writer: Any) -> None:
+        reader.read_all()
+
+    def do_get(self, context: Any, ticket: flight.Ticket) -> flight.RecordBatchStream:
+        # the GDS server decides about the compression of results, here it mirrors the client setting
+        return flight.RecordBatchStream(self._table, options=ipc.IpcWriteOptions(compression=self.download_compression))
+
+
+def node_table(rows: int, rng: np.random.Generator) -> pa.Table:
+    return pa.table(
+        {
+            "nodeId": pa.array(np.arange(rows, dtype=np.int64)),
+            "labels": pa.array(rng.choice(["Person", "Company", "Product"], rows)),
+            "score": pa.array(rng.random(rows)),
+        }
+    )
+
+
+def relationship_table(rows: int, rng: np.random.Generator) -> pa.Table:
+    return pa.table(
+        {
+            "sourceNodeId": pa.array(rng.integers(0, rows // 10, rows, dtype=np.int64)),
+            "targetNodeId": pa.array(rng.integers(0, rows // 10, rows, dtype=np.int64)),
+            "relationshipType": pa.array(rng.choice(["KNOWS", "WORKS_AT", "BOUGHT"], rows)),
+        }
+    )
+
+
+def serialized_size(table: pa.Table, compression: IpcCompression | None, batch_size: int) -> int:
+    sink = pa.BufferOutputStream()
+    with ipc.new_stream(sink, table.schema, options=ipc.IpcWriteOptions(compression=compression)) as writer:
+        for batch in table.to_batches(batch_size):
+            writer.write_batch(batch)
+    return int(sink.getvalue().size)
+
+
+def benchmark(name: str, table: pa.Table, batch_size: int, bandwidth_mbit: float) -> None:
+    print(f"\n{name}: {table.num_rows:,} rows, {table.nbytes / 2**20:.1f} MiB in memory")
+    print(f"{'codec':>6} {'wire MiB':>9} {'ratio':>6} {'upload s':>9} {'download s':>11} {'est. upload s':>14}")
+
+    uncompressed_size = serialized_size(table, None, batch_size)
+    with BenchmarkFlightServer(table) as server:
+        for codec in CODECS:
+            server.download_compression = codec
+            wire_size = serialized_size(table, codec, batch_size)
+
+            with AuthenticatedArrowClient(("localhost", server.port), ipc_compression=codec) as client:
+                start = time.perf_counter()
+                put_stream, _ = client.do_put_with_retry(flight.FlightDescriptor.for_command(b"bench"), table.schema)
+                with put_stream:
+                    for batch in table.to_batches(batch_size):
+                        put_stream.write_batch(batch)
+                upload_time = time.perf_counter() - start
+
+                start = time.perf_counter()
+                client.get_stream(flight.Ticket(b"bench")).read_all()
+                download_time = time.perf_counter() - start
+
+            estimated_upload = upload_time + wire_size * 8 / (bandwidth_mbit * 10**6)
+            print(
+                f"{codec or 'none':>6} {wire_size / 2**20:>9.1f} {uncompressed_size / wire_size:>6.2f} "
+                f"{upload_time:>9.2f} {download_time:>11.2f} {estimated_upload:>14.2f}"
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=5_000_000)
+    parser.add_argument("--batch-size", type=int, default=100_000)
+    parser.add_argument("--bandwidth-mbit", type=float, default=200.0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(42)
+    benchmark("nodes", node_table(args.rows, rng), args.batch_size, args.bandwidth_mbit)
+    benchmark("relationships", relationship_table(args.rows, rng), args.batch_size, args.bandwidth_mbit)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Compares converting Bolt records to pandas via `neo4j.Result.to_df` and via the columnar `RecordColumnBuilder`.
+
+The records are created locally as `neo4j.Record` objects, shaped like the results of typical stream procedures,
+so the timings only reflect the conversion on the client and not the transfer from the database.
+
+Usage: python scripts/benchmark_bolt_conversion.py [--rows 2000000] [--repetitions 3]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from typing import Any, Callable
+
+import neo4j
+import numpy as np
+from pandas import DataFrame
+
+from graphdatascience.query_runner.record_columns import RecordColumnBuilder, records_to_pandas
+
+
+def node_property_records(rows: int, rng: np.random.Generator) -> tuple[list[str], list[neo4j.Record]]:
+    # shaped like gds.graph.nodeProperties.stream
+    keys = ["nodeId", "nodeProperty", "propertyValue"]
+    node_ids = np.arange(rows).tolist()
+    values = rng.random(rows).tolist()
+    return keys, [neo4j.Record(zip(keys, row)) for row in zip(node_ids, ["score"] * rows, values)]  # type: ignore[no-untyped-call]
+
+
+def relationship_records(rows: int, rng: np.random.Generator) -> tuple[list[str], list[neo4j.Record]]:
+    # shaped like gds.graph.relationships.stream
+    keys = ["sourceNodeId", "targetNodeId", "relationshipType"]
+    sources = rng.integers(0, rows // 10, rows).tolist()
+    targets = rng.integers(0, rows // 10, rows).tolist()
+    types = rng.choice(["KNOWS", "WORKS_AT", "BOUGHT"], rows).tolist()
+    return keys, [neo4j.Record(zip(keys, row)) for row in zip(sources, targets, types)]  # type: ignore[no-untyped-call]
+
+
+def embedding_records(rows: int, rng: np.random.Generator) -> tuple[list[str], list[neo4j.Record]]:
+    # shaped like the stream mode of node embedding algorithms
+    keys = ["nodeId", "embedding"]
+    embeddings = rng.random((rows, 16)).tolist()
+    return keys, [neo4j.Record(zip(keys, row)) for row in zip(range(rows), embeddings)]  # type: ignore[no-untyped-call]
+
+
+def to_df(keys: list[str], records: list[neo4j.Record]) -> DataFrame:
+    # what `neo4j.Result.to_df` does for the records of a result
+    return DataFrame([record.values() for record in records], columns=keys)
+
+
+def to_arrow(keys: list[str], records: list[neo4j.Record]) -> Any:
+    builder = RecordColumnBuilder(keys)
+    builder.extend(records)
+    return builder.to_arrow()
+
+
+def best_time(
+    convert: Callable[[list[str], list[neo4j.Record]], Any],
+    keys: list[str],
+    records: list[neo4j.Record],
+    repetitions: int,
+) -> float:
+    timings = []
+    for _ in range(repetitions):
+        start = time.perf_counter()
+        convert(keys, records)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def benchmark(name: str, keys: list[str], records: list[neo4j.Record], repetitions: int) -> None:
+    print(f"\n{name}: {len(records):,} records")
+    print(f"{'conversion':>22} {'seconds':>8} {'speedup':>8}")
+
+    baseline = best_time(to_df, keys, records, repetitions)
+    print(f"{'to_df':>22} {baseline:>8.2f} {1.0:>8.2f}")
+    for label, convert in [("columnar to pandas", records_to_pandas), ("columnar to arrow", to_arrow)]:
+        duration = best_time(convert, keys, records, repetitions)
+        print(f"{label:>22} {duration:>8.2f} {baseline / duration:>8.2f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=2_000_000)
+    parser.add_argument("--repetitions", type=int, default=3)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(42)
+    benchmark("node properties", *node_property_records(args.rows, rng), args.repetitions)
+    benchmark("relationships", *relationship_records(args.rows, rng), args.repetitions)
+    benchmark("embeddings", *embedding_records(args.rows // 10, rng), args.repetitions)
+
+
+if __name__ == "__main__":
+    main()
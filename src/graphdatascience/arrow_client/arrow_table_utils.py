@@ -1,9 +1,15 @@
 from __future__ import annotations
 
+from typing import Any, Callable, Literal, TypeAlias
+
+import numpy
 import pandas
 import pyarrow
 from pyarrow import types as pa_types
 
+OutputFormat: TypeAlias = Literal["pandas", "arrow", "numpy"]
+NumpyColumns: TypeAlias = dict[str, numpy.ndarray]
+
 
 def _downcast_type(data_type: pyarrow.DataType) -> pyarrow.DataType:
     """Map pyarrow "large" string/binary types back to their 32-bit variants.
@@ -36,3 +42,73 @@ def table_from_pandas(data: pandas.DataFrame) -> pyarrow.Table:
         metadata=table.schema.metadata,
     )
     return table.cast(new_schema)
+
+
+def table_to_pandas(table: pyarrow.Table, keep_dictionaries: bool = False) -> pandas.DataFrame:
+    """Convert a pyarrow Table to a DataFrame with Arrow-backed dtypes.
+
+    With ``keep_dictionaries``, dictionary-encoded columns of primitive or string values become ``pandas.Categorical``
+    columns, which store each distinct value only once and are grouped by their codes. Dictionaries of other values,
+    such as lists of node labels, are not hashable as categories and are decoded instead.
+    """
+    if not keep_dictionaries:
+        return table.to_pandas(types_mapper=pandas.ArrowDtype)  # type: ignore
+
+    table = _decode_dictionaries(table, lambda data_type: not _is_categorical(data_type))
+
+    def types_mapper(data_type: pyarrow.DataType) -> Any:
+        # returning None falls back to the default conversion, which maps dictionaries to Categorical
+        return None if pa_types.is_dictionary(data_type) else pandas.ArrowDtype(data_type)
+
+    return table.to_pandas(types_mapper=types_mapper)  # type: ignore
+
+
+def _is_categorical(data_type: pyarrow.DataType) -> bool:
+    if not pa_types.is_dictionary(data_type):
+        return False
+    value_type = data_type.value_type
+    return bool(
+        pa_types.is_primitive(value_type) or pa_types.is_string(value_type) or pa_types.is_large_string(value_type)
+    )
+
+
+def _decode_dictionaries(table: pyarrow.Table, should_decode: Callable[[pyarrow.DataType], bool]) -> pyarrow.Table:
+    for idx, field in enumerate(table.schema):
+        if pa_types.is_dictionary(field.type) and should_decode(field.type):
+            column = table.column(idx)
+            decoded = pyarrow.chunked_array(
+                [chunk.dictionary_decode() for chunk in column.chunks], type=field.type.value_type
+            )
+            table = table.set_column(idx, field.name, decoded)
+    return table
+
+
+def dictionary_encode_columns(table: pyarrow.Table, columns: list[str]) -> pyarrow.Table:
+    """Dictionary-encode the given columns of the table, if present and not encoded already."""
+    for column in columns:
+        idx = table.schema.get_field_index(column)
+        if idx == -1 or pa_types.is_dictionary(table.schema.field(idx).type):
+            continue
+        table = table.set_column(idx, column, table.column(idx).dictionary_encode())
+    return table
+
+
+def table_to_numpy(table: pyarrow.Table) -> NumpyColumns:
+    """Convert each column of the table to a NumPy array, keyed by column name.
+
+    Columns without a native NumPy representation, such as lists, become object arrays.
+    """
+    return {name: column.to_numpy() for name, column in zip(table.column_names, table.columns)}
+
+
+def convert_table(
+    table: pyarrow.Table, output_format: OutputFormat, keep_dictionaries: bool = False
+) -> pandas.DataFrame | pyarrow.Table | NumpyColumns:
+    """Convert an Arrow result table into the requested output format. Arrow tables always keep dictionary arrays."""
+    if output_format == "arrow":
+        return table
+    if output_format == "numpy":
+        return table_to_numpy(table)
+    if output_format == "pandas":
+        return table_to_pandas(table, keep_dictionaries)
+    raise ValueError(f"Unsupported output format '{output_format}'. Expected one of 'pandas', 'arrow' or 'numpy'.")
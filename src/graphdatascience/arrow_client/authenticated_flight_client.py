@@ -5,16 +5,15 @@ import logging
 import platform
 from dataclasses import dataclass
 from types import TracebackType
-from typing import Any, Callable, Iterator, Type, TypeVar
+from typing import Any, Callable, Iterator, Literal, Type, TypeVar
 
 import certifi
-from pyarrow import Schema, flight
+from pyarrow import Codec, Schema, flight, ipc
 from pyarrow import __version__ as arrow_version
 from pyarrow.flight import (
     Action,
     ActionType,
     FlightInternalError,
-    FlightStreamReader,
     FlightTimedOutError,
     FlightUnavailableError,
     Result,
@@ -27,11 +26,20 @@ from graphdatascience.retry_utils.retry_config import ExponentialWaitConfig, Ret
 
 from ..version import __version__
 from .arrow_client_options_util import TLS_ROOT_CERTS_OPTION, set_tls_root_certs
+from .flight_client_pool import (
+    ClientCheckout,
+    ClientLease,
+    FlightClientPool,
+    LeasedStreamReader,
+    LeasedStreamWriter,
+)
 from .middleware.auth_middleware import AuthFactory, AuthMiddleware
 from .middleware.user_agent_middleware import UserAgentFactory
 
 T = TypeVar("T")
 
+IpcCompression = Literal["lz4", "zstd"]
+
 
 class AuthenticatedArrowClient:
     def __init__(
@@ -44,6 +52,9 @@ class AuthenticatedArrowClient:
         advertised_listen_address: tuple[str, int] | None = None,
         retry_config: RetryConfigV2 | None = None,
         health_check: ServerHealthCheck | None = None,
+        ipc_compression: IpcCompression | None = None,
+        client_pool_size: int = 1,
+        client_checkout: ClientCheckout = "call",
     ):
         """Creates a new AuthenticatedArrowClient instance.
 
@@ -66,6 +77,14 @@ class AuthenticatedArrowClient:
         health_check
             Optional health check consulted when the server could not be reached, after all retries were
             exhausted. It is expected to raise a more descriptive error if it can explain the failure (such as out-of-memory error) and to return without raising otherwise.
+        ipc_compression
+            The codec (`lz4` or `zstd`) used to compress the record batches uploaded to the server (default is None, no compression).
+            Compressed record batches sent by the server are always decompressed, regardless of this setting.
+        client_pool_size
+            The maximum number of Flight clients, each with its own connection, used for concurrent requests (default is 1).
+            All clients share the same authentication token.
+        client_checkout
+            How clients are taken from the pool: `call` uses the least busy client for each request, `thread` binds each thread to one client (default is `call`).
         """
 
         if isinstance(connection_info, str):
@@ -74,6 +93,11 @@ class AuthenticatedArrowClient:
         else:
             host, port = connection_info
 
+        if ipc_compression is not None and not Codec.is_available(ipc_compression):
+            raise ValueError(
+                f"The compression codec '{ipc_compression}' is not available in this pyarrow installation."
+            )
+
         if retry_config is None:
             retry_config = RetryConfigV2(
                 retryable_exceptions=[
@@ -94,10 +118,13 @@ class AuthenticatedArrowClient:
         self._logger = logging.getLogger("gds_arrow_client")
         self._retry_config = retry_config
         self._health_check = health_check
+        self._ipc_compression = ipc_compression
         if auth:
             self._auth_middleware = AuthMiddleware(auth)
         self.advertised_listen_address = advertised_listen_address
-        self._flight_client: flight.FlightClient = self._instantiate_flight_client()
+        self._client_pool_size = client_pool_size
+        self._client_checkout = client_checkout
+        self._client_pool = self._create_client_pool()
 
     def connection_info(self) -> ConnectionInfo:
         """
@@ -137,14 +164,14 @@ class AuthenticatedArrowClient:
 
         @self._retry_config.decorator(operation_name="Request token", logger=self._logger)
         def auth_with_retry() -> None:
-            try:
-                client = self._flight_client
-                if self._auth:
-                    auth_pair = self._auth.auth_pair()
-                    client.authenticate_basic_token(auth_pair[0], auth_pair[1])
-            except (FlightTimedOutError, FlightUnavailableError, FlightInternalError):
-                self._reconnect()
-                raise
+            with self._client_pool.lease() as client:
+                try:
+                    if self._auth:
+                        auth_pair = self._auth.auth_pair()
+                        client.authenticate_basic_token(auth_pair[0], auth_pair[1])
+                except (FlightTimedOutError, FlightUnavailableError, FlightInternalError):
+                    self._client_pool.evict(client)
+                    raise
 
         if self._auth:
             self._diagnose_connection_failure(auth_with_retry)
@@ -152,43 +179,84 @@ class AuthenticatedArrowClient:
         else:
             return "IGNORED"
 
-    def get_stream(self, ticket: Ticket) -> FlightStreamReader:
-        return self._flight_client.do_get(ticket)
+    def get_stream(self, ticket: Ticket) -> LeasedStreamReader:
+        """Opens the stream of the ticket. Its client stays leased until the stream was read or closed."""
+        lease = self._client_pool.checkout()
+        try:
+            return LeasedStreamReader(lease.client.do_get(ticket, options=self._call_options()), lease)
+        except BaseException:
+            lease.release()
+            raise
 
     def do_action(self, endpoint: str, payload: bytes | dict[str, Any]) -> Iterator[Result]:
-        payload_bytes = payload if isinstance(payload, bytes) else json.dumps(payload).encode("utf-8")
+        lease = self._client_pool.checkout()
+        try:
+            results = self._do_action(lease.client, endpoint, payload)
+        except BaseException:
+            lease.release()
+            raise
+        return self._release_when_consumed(results, lease)
 
-        return self._flight_client.do_action(Action(endpoint, payload_bytes))  # type: ignore
+    @staticmethod
+    def _release_when_consumed(results: Iterator[Result], lease: ClientLease) -> Iterator[Result]:
+        try:
+            yield from results
+        finally:
+            lease.release()
 
     def do_action_with_retry(self, endpoint: str, payload: bytes | dict[str, Any]) -> list[Result]:
         @self._retry_config.decorator(operation_name="Send action", logger=self._logger)
         def run_with_retry() -> list[Result]:
-            try:
-                # the Flight response error code is only checked on iterator consumption
-                # we eagerly collect iterator here to trigger retry in case of an error
-                return list(self.do_action(endpoint, payload))
-            except (FlightTimedOutError, FlightUnavailableError, FlightInternalError):
-                self._reconnect()
-                raise
+            with self._client_pool.lease() as client:
+                try:
+                    # the Flight response error code is only checked on iterator consumption
+                    # we eagerly collect iterator here to trigger retry in case of an error
+                    return list(self._do_action(client, endpoint, payload))
+                except (FlightTimedOutError, FlightUnavailableError, FlightInternalError):
+                    self._client_pool.evict(client)
+                    raise
 
         return self._diagnose_connection_failure(run_with_retry)
 
+    @staticmethod
+    def _do_action(client: flight.FlightClient, endpoint: str, payload: bytes | dict[str, Any]) -> Iterator[Result]:
+        payload_bytes = payload if isinstance(payload, bytes) else json.dumps(payload).encode("utf-8")
+
+        return client.do_action(Action(endpoint, payload_bytes))  # type: ignore
+
     def list_actions(self) -> set[ActionType]:
-        return self._flight_client.list_actions()  # type: ignore
+        with self._client_pool.lease() as client:
+            return client.list_actions()  # type: ignore
 
     def do_put_with_retry(
         self, descriptor: flight.FlightDescriptor, schema: Schema
-    ) -> tuple[flight.FlightStreamWriter, flight.FlightMetadataReader]:
+    ) -> tuple[LeasedStreamWriter, flight.FlightMetadataReader]:
+        """Opens an upload stream. Its client stays leased until the writer is closed."""
+
         @self._retry_config.decorator(operation_name="Do put", logger=self._logger)
-        def run_with_retry() -> tuple[flight.FlightStreamWriter, flight.FlightMetadataReader]:
+        def run_with_retry() -> tuple[LeasedStreamWriter, flight.FlightMetadataReader]:
+            lease = self._client_pool.checkout()
             try:
-                return self._flight_client.do_put(descriptor, schema)  # type: ignore
+                writer, ack_stream = lease.client.do_put(descriptor, schema, options=self._call_options())
             except (FlightTimedOutError, FlightUnavailableError, FlightInternalError):
-                self._reconnect()
+                self._client_pool.evict(lease.client)
+                lease.release()
+                raise
+            except BaseException:
+                lease.release()
                 raise
+            return LeasedStreamWriter(writer, lease), ack_stream
 
         return self._diagnose_connection_failure(run_with_retry)
 
+    def _call_options(self) -> flight.FlightCallOptions:
+        return flight.FlightCallOptions(write_options=self._ipc_write_options())
+
+    def _ipc_write_options(self) -> ipc.IpcWriteOptions | None:
+        if self._ipc_compression is None:
+            return None
+        return ipc.IpcWriteOptions(compression=self._ipc_compression)
+
     def _diagnose_connection_failure(self, operation: Callable[[], T]) -> T:
         """
         Runs the given operation and, if the server could not be reached, gives the health check
@@ -213,8 +281,10 @@ class AuthenticatedArrowClient:
         self.close()
 
     def close(self) -> None:
-        if self._flight_client:
-            self._flight_client.close()
+        self._client_pool.close()
+
+    def _create_client_pool(self) -> FlightClientPool:
+        return FlightClientPool(self._instantiate_flight_client, self._client_pool_size, self._client_checkout)
 
     def _instantiate_flight_client(self) -> flight.FlightClient:
         location = (
@@ -243,23 +313,18 @@ class AuthenticatedArrowClient:
 
     def __getstate__(self) -> dict[str, Any]:
         state = self.__dict__.copy()
-        # Remove the FlightClient as it isn't serializable
-        if "_flight_client" in state:
-            del state["_flight_client"]
+        # Remove the FlightClients as they aren't serializable
+        if "_client_pool" in state:
+            del state["_client_pool"]
         return state
 
     def __setstate__(self, state: dict[str, Any]) -> None:
         self.__dict__.update(state)
         self.__dict__.setdefault("_health_check", None)
-        self._flight_client = self._instantiate_flight_client()
-
-    def _reconnect(self) -> None:
-        try:
-            self._flight_client.close()
-        except Exception:
-            pass
-
-        self._flight_client = self._instantiate_flight_client()
+        self.__dict__.setdefault("_ipc_compression", None)
+        self.__dict__.setdefault("_client_pool_size", 1)
+        self.__dict__.setdefault("_client_checkout", "call")
+        self._client_pool = self._create_client_pool()
 
 
 @dataclass
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Iterable, Iterator
+
+import pyarrow
+
+
+@dataclass(frozen=True, repr=True)
+class BatchByteBudget:
+    """
+    Sizes upload batches by their estimated size in bytes instead of a fixed number of rows.
+
+    Parameters
+    ----------
+    target_bytes
+        The size a single record batch should have.
+    target_ack_latency
+        If set, the byte budget is tuned during an upload, so that the server acknowledges a batch within this
+        number of seconds. The budget stays between `min_bytes` and `max_bytes`.
+    min_bytes
+        The lower bound for the tuned byte budget.
+    max_bytes
+        The upper bound for the tuned byte budget.
+    """
+
+    target_bytes: int = 8 * 2**20
+    target_ack_latency: float | None = None
+    min_bytes: int = 2**20
+    max_bytes: int = 64 * 2**20
+
+    def __post_init__(self) -> None:
+        if not 0 < self.min_bytes <= self.target_bytes <= self.max_bytes:
+            raise ValueError(
+                f"Expected 0 < min_bytes <= target_bytes <= max_bytes, "
+                f"but got {self.min_bytes}, {self.target_bytes} and {self.max_bytes}."
+            )
+
+
+class BatchSizer:
+    """Slices tables into upload batches of a fixed number of rows or of a byte budget."""
+
+    def __init__(self, batch_size: int | BatchByteBudget):
+        self._fixed_rows = batch_size if isinstance(batch_size, int) else None
+        self._byte_budget = batch_size if isinstance(batch_size, BatchByteBudget) else None
+        self._current_bytes = self._byte_budget.target_bytes if self._byte_budget else 0
+
+    def batches(self, table: pyarrow.Table) -> Iterator[pyarrow.RecordBatch]:
+        """
+        Yields the record batches of the table. The size of each batch is decided once the previous one was consumed,
+        so a tuned byte budget applies to the remaining rows.
+        """
+        if table.num_rows == 0:
+            return
+
+        # Table.nbytes covers the actually referenced buffers, so this includes variable sized data such as lists.
+        row_bytes = max(table.nbytes / table.num_rows, 1.0)
+        offset = 0
+        while offset < table.num_rows:
+            num_rows = self._rows_per_batch(row_bytes)
+            yield from table.slice(offset, num_rows).to_batches()
+            offset += num_rows
+
+    def rebatch(self, batches: Iterable[pyarrow.RecordBatch]) -> Iterator[pyarrow.RecordBatch]:
+        """Slices a stream of record batches, reading each batch only when the previous ones were consumed."""
+        for batch in batches:
+            yield from self.batches(pyarrow.Table.from_batches([batch]))
+
+    def acknowledged(self, latency: float) -> None:
+        """Tunes the byte budget from the time it took the server to acknowledge a batch."""
+        if self._byte_budget is None or self._byte_budget.target_ack_latency is None:
+            return
+
+        target_latency = self._byte_budget.target_ack_latency
+        if latency > target_latency:
+            self._current_bytes = max(self._byte_budget.min_bytes, self._current_bytes // 2)
+        elif latency < target_latency / 2:
+            self._current_bytes = min(self._byte_budget.max_bytes, self._current_bytes * 3 // 2)
+
+    def _rows_per_batch(self, row_bytes: float) -> int:
+        if self._fixed_rows is not None:
+            return self._fixed_rows
+        return max(1, int(self._current_bytes / row_bytes))
@@ -0,0 +1,279 @@
+from __future__ import annotations
+
+import threading
+import weakref
+from contextlib import contextmanager
+from types import TracebackType
+from typing import Any, Callable, Iterator, Literal, Type
+
+from pyarrow import RecordBatch, Table, flight
+
+ClientCheckout = Literal["call", "thread"]
+
+
+class FlightClientPool:
+    """
+    A bounded pool of Flight clients, each of which holds its own connection to the server.
+
+    With the "call" checkout, every call leases the client with the fewest ongoing calls, and a new client is created
+    while all of them are busy and the pool is not full. With the "thread" checkout, each thread keeps using the
+    client it leased first, so that concurrent transfers from different threads use different connections.
+    Once the pool is full, clients are shared.
+
+    A client counts as busy for as long as it is leased, which for streams is until the stream was read completely or
+    closed. Clients which failed with a connection error are evicted and replaced on the next checkout. An evicted
+    client is closed once its last lease was released, so that streams of other threads on it are not cut off.
+    """
+
+    def __init__(
+        self,
+        client_factory: Callable[[], flight.FlightClient],
+        max_size: int = 1,
+        checkout: ClientCheckout = "call",
+    ):
+        if max_size < 1:
+            raise ValueError(f"The size of the client pool must be at least 1, but got {max_size}.")
+        if checkout not in ("call", "thread"):
+            raise ValueError(f"Unsupported client checkout '{checkout}'. Expected 'call' or 'thread'.")
+
+        self._client_factory = client_factory
+        self._max_size = max_size
+        self._checkout = checkout
+        self._lock = threading.Lock()
+        self._clients: list[flight.FlightClient] = []
+        self._active_calls: dict[int, int] = {}
+        # keyed weakly by the thread, so that the binding of a thread ends with it
+        self._thread_clients: weakref.WeakKeyDictionary[threading.Thread, flight.FlightClient] = (
+            weakref.WeakKeyDictionary()
+        )
+        # evicted clients which are still leased, closed once their last lease is released
+        self._retired: dict[int, flight.FlightClient] = {}
+
+        # the first client is created up front, so that an invalid location or configuration fails early
+        self._clients.append(client_factory())
+        self._active_calls[id(self._clients[0])] = 0
+
+    def size(self) -> int:
+        """The number of clients currently in the pool."""
+        with self._lock:
+            return len(self._clients)
+
+    @contextmanager
+    def lease(self) -> Iterator[flight.FlightClient]:
+        """Checks out a client for the duration of a call."""
+        client_lease = self.checkout()
+        try:
+            yield client_lease.client
+        finally:
+            client_lease.release()
+
+    def checkout(self) -> ClientLease:
+        """Checks out a client until the returned lease is released, for example once a stream was read."""
+        return ClientLease(self, self._acquire())
+
+    def evict(self, client: flight.FlightClient) -> None:
+        """
+        Removes a client whose connection is broken, so that it is not leased again. Other clients stay untouched.
+
+        The client is closed right away if it is not leased, and otherwise once its last lease is released.
+        """
+        with self._lock:
+            if not any(pooled is client for pooled in self._clients):
+                return
+            self._clients = [pooled for pooled in self._clients if pooled is not client]
+            for thread, bound in list(self._thread_clients.items()):
+                if bound is client:
+                    del self._thread_clients[thread]
+            if self._active_calls[id(client)] > 0:
+                self._retired[id(client)] = client
+                return
+            del self._active_calls[id(client)]
+
+        self._close_quietly(client)
+
+    def close(self) -> None:
+        with self._lock:
+            clients = self._clients + list(self._retired.values())
+            self._clients = []
+            self._retired = {}
+            self._active_calls = {}
+            self._thread_clients.clear()
+
+        for client in clients:
+            client.close()
+
+    def _acquire(self) -> flight.FlightClient:
+        with self._lock:
+            thread = threading.current_thread()
+            client = self._thread_clients.get(thread) if self._checkout == "thread" else None
+            if client is None or id(client) not in self._active_calls:
+                client = self._least_busy_or_new()
+                if self._checkout == "thread":
+                    self._thread_clients[thread] = client
+
+            self._active_calls[id(client)] += 1
+            return client
+
+    def _release(self, client: flight.FlightClient) -> None:
+        with self._lock:
+            if id(client) not in self._active_calls:
+                return
+            self._active_calls[id(client)] -= 1
+            if id(client) not in self._retired or self._active_calls[id(client)] > 0:
+                return
+            del self._retired[id(client)]
+            del self._active_calls[id(client)]
+
+        self._close_quietly(client)
+
+    def _least_busy_or_new(self) -> flight.FlightClient:
+        bound = self._bound_to_live_threads()
+        least_busy = min(self._clients, key=lambda client: self._load(client, bound), default=None)
+        if least_busy is None or (len(self._clients) < self._max_size and self._load(least_busy, bound) > 0):
+            least_busy = self._client_factory()
+            self._clients.append(least_busy)
+            self._active_calls[id(least_busy)] = 0
+
+        return least_busy
+
+    def _bound_to_live_threads(self) -> set[int]:
+        # a thread which finished but is still referenced does not use its client anymore
+        return {id(client) for thread, client in list(self._thread_clients.items()) if thread.is_alive()}
+
+    def _load(self, client: flight.FlightClient, bound: set[int]) -> int:
+        # threads keep their client while they run, so a bound client counts as busy for the next thread
+        return self._active_calls[id(client)] + (1 if id(client) in bound else 0)
+
+    @staticmethod
+    def _close_quietly(client: flight.FlightClient) -> None:
+        try:
+            client.close()
+        except Exception:
+            pass
+
+
+class ClientLease:
+    """A client checked out of a `FlightClientPool`, which counts as busy until the lease is released."""
+
+    def __init__(self, pool: FlightClientPool, client: flight.FlightClient):
+        self.client = client
+        self._pool = pool
+        self._lock = threading.Lock()
+        self._released = False
+
+    def release(self) -> None:
+        """Returns the client to the pool. Releasing a lease more than once has no effect."""
+        with self._lock:
+            if self._released:
+                return
+            self._released = True
+        self._pool._release(self.client)
+
+
+class LeasedStreamReader:
+    """
+    A `FlightStreamReader` which holds the lease of its client while the stream is open.
+
+    The lease is released once the stream was read completely, failed, was cancelled or closed.
+    """
+
+    def __init__(self, reader: flight.FlightStreamReader, lease: ClientLease):
+        self._reader = reader
+        self._lease = lease
+
+    @property
+    def schema(self) -> Any:
+        return self._reader.schema
+
+    def read_chunk(self) -> flight.FlightStreamChunk:
+        try:
+            return self._reader.read_chunk()
+        except BaseException:
+            # also the StopIteration at the end of the stream
+            self._lease.release()
+            raise
+
+    def read_all(self) -> Table:
+        try:
+            return self._reader.read_all()
+        finally:
+            self._lease.release()
+
+    def read_pandas(self, **options: Any) -> Any:
+        try:
+            return self._reader.read_pandas(**options)
+        finally:
+            self._lease.release()
+
+    def __iter__(self) -> Iterator[flight.FlightStreamChunk]:
+        while True:
+            try:
+                yield self.read_chunk()
+            except StopIteration:
+                return
+
+    def cancel(self) -> None:
+        try:
+            self._reader.cancel()
+        finally:
+            self._lease.release()
+
+    def __enter__(self) -> LeasedStreamReader:
+        return self
+
+    def __exit__(
+        self,
+        exception_type: Type[BaseException] | None,
+        exception_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self._lease.release()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._reader, name)
+
+    def __del__(self) -> None:
+        # an abandoned stream must not keep its client busy
+        if "_lease" in self.__dict__:
+            self._lease.release()
+
+
+class LeasedStreamWriter:
+    """A `FlightStreamWriter` which holds the lease of its client until the writer is closed."""
+
+    def __init__(self, writer: flight.FlightStreamWriter, lease: ClientLease):
+        self._writer = writer
+        self._lease = lease
+
+    def write_batch(self, batch: RecordBatch) -> None:
+        self._writer.write_batch(batch)
+
+    def done_writing(self) -> None:
+        self._writer.done_writing()
+
+    def close(self) -> None:
+        try:
+            self._writer.close()
+        finally:
+            self._lease.release()
+
+    def __enter__(self) -> LeasedStreamWriter:
+        return self
+
+    def __exit__(
+        self,
+        exception_type: Type[BaseException] | None,
+        exception_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        try:
+            self._writer.__exit__(exception_type, exception_value, traceback)
+        finally:
+            self._lease.release()
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._writer, name)
+
+    def __del__(self) -> None:
+        if "_lease" in self.__dict__:
+            self._lease.release()
@@ -0,0 +1,213 @@
+from __future__ import annotations
+
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+import pyarrow
+from pyarrow import ipc
+
+from .authenticated_flight_client import AuthenticatedArrowClient
+
+DEFAULT_RESULT_CACHE_BYTES = 2**30
+
+ResultKey = tuple[str, str]
+
+
+@dataclass
+class _CachedResult:
+    table: pyarrow.Table | None
+    spill_path: str | None
+    nbytes: int
+
+
+class ResultCache:
+    """
+    Caches the streamed results and summaries of finished jobs on the client, keyed by graph name and job id.
+
+    Results of a job never change, so reading them again is served from the cache instead of starting another
+    export on the server. Results are kept in memory up to `max_bytes`, evicting the least recently used ones.
+    With a `spill_directory`, evicted results are written to Arrow IPC files there instead of being dropped, and
+    are memory-mapped when read again. Results of a graph should be invalidated once the graph was dropped.
+
+    Spilled results are written to a subdirectory of `spill_directory` owned by the cache. It is deleted when the
+    cache is closed, when it is detached from its last client, or at the latest when the process exits.
+
+    Parameters
+    ----------
+    max_bytes
+        The memory budget for results held in memory.
+    spill_directory
+        A directory for results evicted from memory. If None, evicted results are dropped.
+    """
+
+    _attached: weakref.WeakKeyDictionary[AuthenticatedArrowClient, ResultCache] = weakref.WeakKeyDictionary()
+    _attached_lock = threading.Lock()
+
+    def __init__(
+        self,
+        max_bytes: int = DEFAULT_RESULT_CACHE_BYTES,
+        spill_directory: str | os.PathLike[str] | None = None,
+    ):
+        if max_bytes < 0:
+            raise ValueError(f"The memory budget of the result cache must not be negative, but got {max_bytes}.")
+
+        self._max_bytes = max_bytes
+        self._spill_directory = os.fspath(spill_directory) if spill_directory is not None else None
+        self._spill_subdirectory: str | None = None
+        self._remove_spill_subdirectory: weakref.finalize[Any, Any] | None = None
+        self._lock = threading.Lock()
+        self._results: OrderedDict[ResultKey, _CachedResult] = OrderedDict()
+        self._summaries: dict[str, dict[str, Any]] = {}
+        self._memory_bytes = 0
+        self._logger = logging.getLogger("gds_arrow_client")
+
+    @staticmethod
+    def of(client: AuthenticatedArrowClient) -> ResultCache | None:
+        """The cache attached to the client, if any."""
+        with ResultCache._attached_lock:
+            return ResultCache._attached.get(client)
+
+    def attach(self, client: AuthenticatedArrowClient) -> None:
+        """Uses this cache for all results streamed through the client."""
+        with ResultCache._attached_lock:
+            ResultCache._attached[client] = self
+
+    @staticmethod
+    def detach(client: AuthenticatedArrowClient) -> None:
+        """Stops caching the results of the client. A cache which is no longer attached to any client is closed."""
+        with ResultCache._attached_lock:
+            cache = ResultCache._attached.pop(client, None)
+            still_attached = cache is not None and any(attached is cache for attached in ResultCache._attached.values())
+        if cache is not None and not still_attached:
+            cache.close()
+
+    def close(self) -> None:
+        """Drops all cached results and deletes the spilled ones. The cache can still be used afterwards."""
+        self.invalidate()
+        with self._lock:
+            if self._remove_spill_subdirectory is not None:
+                self._remove_spill_subdirectory()
+            self._spill_subdirectory = None
+            self._remove_spill_subdirectory = None
+
+    def get(self, graph_name: str, job_id: str) -> pyarrow.Table | None:
+        with self._lock:
+            entry = self._results.get((graph_name, job_id))
+            if entry is None:
+                return None
+            self._results.move_to_end((graph_name, job_id))
+            if entry.table is not None:
+                return entry.table
+
+            assert entry.spill_path is not None
+            # mapped while holding the lock, so that the file cannot be removed in between. Only the pages which are
+            # read are loaded, and the table stays readable after the file was removed.
+            with pyarrow.memory_map(entry.spill_path) as spill_file:
+                return ipc.open_file(spill_file).read_all()
+
+    def put(self, graph_name: str, job_id: str, table: pyarrow.Table) -> None:
+        key = (graph_name, job_id)
+        with self._lock:
+            self._remove(key)
+            self._results[key] = _CachedResult(table, None, table.nbytes)
+            self._memory_bytes += table.nbytes
+            self._evict()
+
+    def get_summary(self, job_id: str) -> dict[str, Any] | None:
+        with self._lock:
+            summary = self._summaries.get(job_id)
+            return dict(summary) if summary is not None else None
+
+    def put_summary(self, job_id: str, summary: dict[str, Any]) -> None:
+        with self._lock:
+            self._summaries[job_id] = dict(summary)
+
+    def invalidate(self, graph_name: str | None = None, job_id: str | None = None) -> None:
+        """
+        Removes the cached results matching the graph name and job id. Without arguments, the whole cache is cleared.
+        """
+        with self._lock:
+            matching = [
+                key
+                for key in self._results
+                if (graph_name is None or key[0] == graph_name) and (job_id is None or key[1] == job_id)
+            ]
+            for key in matching:
+                self._remove(key)
+
+            if graph_name is None and job_id is None:
+                self._summaries.clear()
+            elif job_id is not None:
+                self._summaries.pop(job_id, None)
+            else:
+                for _, matching_job_id in matching:
+                    self._summaries.pop(matching_job_id, None)
+
+    def clear(self) -> None:
+        self.invalidate()
+
+    def memory_bytes(self) -> int:
+        """The size of the results currently held in memory."""
+        with self._lock:
+            return self._memory_bytes
+
+    def __contains__(self, key: ResultKey) -> bool:
+        with self._lock:
+            return key in self._results
+
+    def _evict(self) -> None:
+        for key in list(self._results):
+            if self._memory_bytes <= self._max_bytes:
+                return
+
+            entry = self._results[key]
+            if entry.table is None:
+                continue
+
+            self._memory_bytes -= entry.nbytes
+            if self._spill_directory is None:
+                del self._results[key]
+                continue
+
+            try:
+                entry.spill_path = self._spill(entry.table)
+                entry.table = None
+            except OSError as e:
+                self._logger.warning(f"Could not spill the result of job '{key[1]}' to disk, dropping it: {e}")
+                del self._results[key]
+
+    def _spill(self, table: pyarrow.Table) -> str:
+        fd, path = tempfile.mkstemp(suffix=".arrow", prefix="gds-result-", dir=self._spill_path())
+        os.close(fd)
+        with ipc.new_file(path, table.schema) as writer:
+            writer.write_table(table)
+        return path
+
+    def _spill_path(self) -> str:
+        if self._spill_subdirectory is None:
+            assert self._spill_directory is not None
+            os.makedirs(self._spill_directory, exist_ok=True)
+            self._spill_subdirectory = tempfile.mkdtemp(prefix="gds-result-cache-", dir=self._spill_directory)
+            self._remove_spill_subdirectory = weakref.finalize(
+                self, shutil.rmtree, self._spill_subdirectory, ignore_errors=True
+            )
+        return self._spill_subdirectory
+
+    def _remove(self, key: ResultKey) -> None:
+        entry = self._results.pop(key, None)
+        if entry is None:
+            return
+        if entry.table is not None:
+            self._memory_bytes -= entry.nbytes
+        if entry.spill_path is not None:
+            try:
+                os.remove(entry.spill_path)
+            except OSError:
+                pass
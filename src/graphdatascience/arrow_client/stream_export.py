@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import os
+from typing import Callable, Iterator, Literal, TypeAlias
+
+import pyarrow
+import pyarrow.dataset
+import pyarrow.parquet
+from pyarrow import RecordBatch, RecordBatchReader
+
+ExportFormat: TypeAlias = Literal["parquet", "dataset", "ipc"]
+ExportPath: TypeAlias = str | os.PathLike[str]
+
+
+def export_stream(
+    reader: RecordBatchReader,
+    path: ExportPath,
+    file_format: ExportFormat = "parquet",
+    *,
+    partition_by: list[str] | None = None,
+) -> int:
+    """
+    Writes the record batches of a stream to disk as they are read, without materializing the stream.
+
+    Parameters
+    ----------
+    reader
+        The stream to export.
+    path
+        The target file, or the base directory for the "dataset" format.
+    file_format
+        "parquet" writes a single Parquet file with a row group per batch, "ipc" writes an Arrow IPC file which
+        can be memory-mapped, and "dataset" writes a directory of Parquet files.
+    partition_by
+        The columns by which the "dataset" format is partitioned into hive-style subdirectories.
+
+    Returns
+    -------
+    int
+        The number of rows written.
+    """
+    if partition_by and file_format != "dataset":
+        raise ValueError(f"Partitioning is only supported for the 'dataset' format, but got '{file_format}'.")
+
+    num_rows = 0
+
+    def counted_batches() -> Iterator[RecordBatch]:
+        nonlocal num_rows
+        for batch in reader:
+            num_rows += batch.num_rows
+            yield batch
+
+    if file_format == "parquet":
+        with pyarrow.parquet.ParquetWriter(path, reader.schema) as parquet_writer:
+            for batch in counted_batches():
+                parquet_writer.write_batch(batch)
+    elif file_format == "ipc":
+        with pyarrow.ipc.new_file(path, reader.schema) as ipc_writer:
+            for batch in counted_batches():
+                ipc_writer.write_batch(batch)
+    elif file_format == "dataset":
+        pyarrow.dataset.write_dataset(
+            RecordBatchReader.from_batches(reader.schema, counted_batches()),
+            path,
+            format="parquet",
+            partitioning=partition_by,
+            partitioning_flavor="hive" if partition_by else None,
+        )
+    else:
+        raise ValueError(f"Unsupported export format '{file_format}'. Expected one of 'parquet', 'dataset' or 'ipc'.")
+
+    return num_rows
+
+
+def map_stream(reader: RecordBatchReader, mapper: Callable[[pyarrow.Table], pyarrow.Table]) -> RecordBatchReader:
+    """Applies a table mapper to every batch of the stream. The mapper must not depend on rows of other batches."""
+    schema = mapper(reader.schema.empty_table()).schema
+
+    def mapped_batches() -> Iterator[RecordBatch]:
+        for batch in reader:
+            yield from mapper(pyarrow.Table.from_batches([batch])).to_batches()
+
+    return RecordBatchReader.from_batches(schema, mapped_batches())
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import time
+from collections import deque
+from typing import Callable
+
+from pyarrow import RecordBatch, flight
+
+from .progress_callback import ProgressCallback
+
+DEFAULT_MAX_IN_FLIGHT_BATCHES = 8
+
+
+class UploadAckWindow:
+    """
+    Tracks the batches written to a `do_put` stream which have not been acknowledged by the server yet.
+
+    Writing the next batch only blocks on an acknowledgement once `max_in_flight` batches are outstanding.
+    Progress is reported for a batch once its acknowledgement was read, in the order the batches were written.
+    The optional `ack_latency_callback` receives the seconds the server spent on each batch. That is the time from
+    writing the batch, or from reading the previous acknowledgement if that came later, to reading its
+    acknowledgement. Time spent queued behind the other batches of a full window is therefore not counted.
+    Unacknowledged batches are retained, so that they can be sent again if the stream breaks.
+    """
+
+    def __init__(
+        self,
+        ack_stream: flight.FlightMetadataReader,
+        max_in_flight: int,
+        progress_callback: ProgressCallback,
+        ack_latency_callback: Callable[[float], None] = lambda latency: None,
+    ):
+        if max_in_flight < 1:
+            raise ValueError(f"The number of in-flight batches must be at least 1, but got {max_in_flight}.")
+
+        self._ack_stream = ack_stream
+        self._max_in_flight = max_in_flight
+        self._progress_callback = progress_callback
+        self._ack_latency_callback = ack_latency_callback
+        self._in_flight: deque[tuple[RecordBatch, float]] = deque()
+        self._last_ack_at: float | None = None
+
+    def sent(self, batch: RecordBatch) -> None:
+        """Registers a written batch and consumes acknowledgements until there is room for the next one."""
+        self._in_flight.append((batch, time.monotonic()))
+        while len(self._in_flight) >= self._max_in_flight:
+            self._acknowledge_oldest()
+
+    def drain(self) -> None:
+        """Consumes the acknowledgements of all outstanding batches. Must be called before closing the put stream."""
+        while self._in_flight:
+            self._acknowledge_oldest()
+
+    def unacknowledged(self) -> list[RecordBatch]:
+        """The written batches whose acknowledgement has not been read, in the order they were written."""
+        return [batch for batch, _ in self._in_flight]
+
+    def _acknowledge_oldest(self) -> None:
+        self._ack_stream.read()
+        batch, sent_at = self._in_flight.popleft()
+        acked_at = time.monotonic()
+        # the server processes the batches in order, so it started on this one when it acknowledged the previous one
+        started_at = sent_at if self._last_ack_at is None else max(sent_at, self._last_ack_at)
+        self._last_ack_at = acked_at
+        self._ack_latency_callback(acked_at - started_at)
+        self._progress_callback(batch.num_rows)
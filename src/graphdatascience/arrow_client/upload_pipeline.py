@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import threading
+from queue import Empty, Full, Queue
+from typing import Any, Iterable, Iterator, TypeVar
+
+import pandas
+import pyarrow
+from pyarrow import RecordBatch
+
+from .arrow_table_utils import table_from_pandas
+from .batch_sizing import BatchSizer
+
+DEFAULT_CONVERSION_CHUNK_ROWS = 100_000
+DEFAULT_MAX_QUEUED_CHUNKS = 2
+
+T = TypeVar("T")
+
+_DONE = object()
+
+
+class _ProducerError:
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+def pandas_upload_batches(
+    df: pandas.DataFrame,
+    batch_sizer: BatchSizer,
+    chunk_rows: int = DEFAULT_CONVERSION_CHUNK_ROWS,
+    max_queued_chunks: int = DEFAULT_MAX_QUEUED_CHUNKS,
+) -> Iterator[RecordBatch]:
+    """
+    Yields the upload batches of a DataFrame, converting it to Arrow chunk by chunk on a background thread.
+
+    While the batches of one chunk are being sent, the next chunks are converted. At most `max_queued_chunks`
+    converted chunks wait to be sent, which bounds the memory used on top of the DataFrame. The chunks are sliced into
+    batches on the calling thread only as the batches are consumed, so that a byte budget tuned from the
+    acknowledgements of the previous batches applies to the next one.
+    """
+    for table in prefetch(pandas_chunks(df, chunk_rows), max_queued_chunks):
+        yield from batch_sizer.batches(table)
+
+
+def pandas_chunks(df: pandas.DataFrame, chunk_rows: int) -> Iterator[pyarrow.Table]:
+    """
+    Converts a DataFrame to Arrow tables of at most `chunk_rows` rows, which all share one schema.
+
+    The values of the first chunk do not always determine the type of a column, such as ints followed by floats in an
+    object column, or empty lists followed by lists of numbers. So the types of object columns and of columns with
+    null types are inferred from the whole column, as converting the DataFrame at once would do. If the first chunk
+    cannot be converted to these types, the DataFrame is converted at once instead.
+    """
+    if chunk_rows < 1:
+        raise ValueError(f"The number of rows per conversion chunk must be at least 1, but got {chunk_rows}.")
+
+    first_slice = df.iloc[:chunk_rows]
+    first = table_from_pandas(first_slice)
+    if len(df) <= chunk_rows:
+        yield first
+        return
+
+    schema = _whole_column_schema(df, first.schema)
+    try:
+        first = _convert_to_schema(first_slice, first, schema)
+    except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError, pyarrow.ArrowNotImplementedError):
+        yield table_from_pandas(df)
+        return
+
+    yield first
+    for offset in range(chunk_rows, len(df), chunk_rows):
+        df_slice = df.iloc[offset : offset + chunk_rows]
+        yield _convert_to_schema(df_slice, table_from_pandas(df_slice), schema)
+
+
+def _whole_column_schema(df: pandas.DataFrame, first_schema: pyarrow.Schema) -> pyarrow.Schema:
+    schema = first_schema
+    # the columns of the DataFrame come first, followed by the index columns
+    for index, (_, column) in enumerate(df.items()):
+        field = schema.field(index)
+        if column.dtype == object or _has_null_type(field.type):
+            inferred = pyarrow.infer_type(column.to_numpy(dtype=object), from_pandas=True)
+            if inferred != field.type:
+                schema = schema.set(index, field.with_type(inferred))
+    return schema
+
+
+def _has_null_type(data_type: pyarrow.DataType) -> bool:
+    if pyarrow.types.is_null(data_type):
+        return True
+    return any(_has_null_type(data_type.field(i).type) for i in range(data_type.num_fields))
+
+
+def _convert_to_schema(df_slice: pandas.DataFrame, table: pyarrow.Table, schema: pyarrow.Schema) -> pyarrow.Table:
+    if table.schema.equals(schema, check_metadata=True):
+        return table
+    try:
+        # the index metadata differs between slices as well
+        return table.cast(schema)
+    except (pyarrow.ArrowInvalid, pyarrow.ArrowNotImplementedError):
+        # such as floats in a column whose first values were inferred as ints
+        return pyarrow.Table.from_pandas(df_slice, schema=schema).replace_schema_metadata(schema.metadata)
+
+
+def prefetch(items: Iterable[T], max_queued: int) -> Iterator[T]:
+    """
+    Produces the items on a background thread, while the caller consumes the previous ones.
+
+    Errors of the producer are raised to the consumer. If the consumer stops early, the producer stops after the
+    item it is currently producing.
+    """
+    if max_queued < 1:
+        raise ValueError(f"The number of queued items must be at least 1, but got {max_queued}.")
+
+    queue: Queue[Any] = Queue(maxsize=max_queued)
+    stopped = threading.Event()
+
+    def put(entry: Any) -> bool:
+        while not stopped.is_set():
+            try:
+                queue.put(entry, timeout=0.1)
+                return True
+            except Full:
+                continue
+        return False
+
+    def produce() -> None:
+        try:
+            for item in items:
+                if not put(item):
+                    return
+            put(_DONE)
+        except BaseException as e:
+            put(_ProducerError(e))
+
+    producer = threading.Thread(target=produce, name="gds-arrow-upload-conversion", daemon=True)
+    producer.start()
+    try:
+        while True:
+            try:
+                entry = queue.get(timeout=0.1)
+            except Empty:
+                if not producer.is_alive() and queue.empty():
+                    raise RuntimeError("The producer of the upload batches stopped unexpectedly.")
+                continue
+
+            if entry is _DONE:
+                return
+            if isinstance(entry, _ProducerError):
+                raise entry.error
+            yield entry
+    finally:
+        stopped.set()
+        # free a slot in case the producer is blocked on a full queue
+        while not queue.empty():
+            queue.get_nowait()
+        producer.join()
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import itertools
 import json
 import logging
 from types import TracebackType
@@ -12,8 +13,11 @@ from pyarrow.types import is_dictionary
 from pydantic import BaseModel
 
 from graphdatascience.arrow_client.arrow_endpoint_version import ArrowEndpointVersion
-from graphdatascience.arrow_client.arrow_table_utils import table_from_pandas
+from graphdatascience.arrow_client.arrow_table_utils import table_to_pandas
 from graphdatascience.arrow_client.authenticated_flight_client import AuthenticatedArrowClient, ConnectionInfo
+from graphdatascience.arrow_client.batch_sizing import BatchByteBudget, BatchSizer
+from graphdatascience.arrow_client.upload_ack_window import DEFAULT_MAX_IN_FLIGHT_BATCHES, UploadAckWindow
+from graphdatascience.arrow_client.upload_pipeline import pandas_upload_batches
 from graphdatascience.arrow_client.v1.data_mapper_utils import deserialize_single
 
 from ...procedure_surface.arrow.error_handler import handle_flight_error
@@ -24,6 +28,8 @@ class GdsArrowClient:
     def __init__(
         self,
         flight_client: AuthenticatedArrowClient,
+        max_in_flight_batches: int = DEFAULT_MAX_IN_FLIGHT_BATCHES,
+        keep_dictionaries: bool = False,
     ):
         """Creates a new GdsArrowClient instance.
 
@@ -31,8 +37,16 @@ class GdsArrowClient:
         ----------
         flight_client : AuthenticatedArrowClient
             The authenticated flight client to use for communication with the GDS server. Ownership of the client is transferred to this GdsArrowClient.
+        max_in_flight_batches : int
+            The number of uploaded batches which may be awaiting an acknowledgement from the server before the next batch is sent.
+            A value of 1 waits for each batch to be acknowledged before sending the next one.
+        keep_dictionaries : bool
+            Whether dictionary-encoded result columns, such as labels and relationship types, are returned as
+            pandas.Categorical instead of being decoded into one string per row.
         """
         self._flight_client = flight_client
+        self._max_in_flight_batches = max_in_flight_batches
+        self._keep_dictionaries = keep_dictionaries
         self._logger = logging.getLogger("gds_arrow_client")
 
     def get_node_properties(
@@ -386,7 +400,7 @@ class GdsArrowClient:
         self,
         graph_name: str,
         node_data: pyarrow.Table | Iterable[pyarrow.RecordBatch] | pandas.DataFrame,
-        batch_size: int = 10_000,
+        batch_size: int | BatchByteBudget = 10_000,
         progress_callback: ProgressCallback = lambda x: None,
     ) -> None:
         """
@@ -398,8 +412,8 @@ class GdsArrowClient:
             The name of the import process
         node_data : pyarrow.Table | Iterable[pyarrow.RecordBatch] | DataFrame
             The node data to upload
-        batch_size : int
-            The number of rows per batch
+        batch_size : int | BatchByteBudget
+            The number of rows per batch, or a byte budget to size the batches by their estimated size in bytes
         progress_callback : ProgressCallback
             A callback function that is called with the number of rows uploaded after each batch
         """
@@ -409,7 +423,7 @@ class GdsArrowClient:
         self,
         graph_name: str,
         relationship_data: pyarrow.Table | Iterable[pyarrow.RecordBatch] | pandas.DataFrame,
-        batch_size: int = 10_000,
+        batch_size: int | BatchByteBudget = 10_000,
         progress_callback: ProgressCallback = lambda num_rows: None,
     ) -> None:
         """
@@ -422,7 +436,7 @@ class GdsArrowClient:
         relationship_data
             The relationship data to upload
         batch_size
-            The number of rows per batch
+            The number of rows per batch, or a byte budget to size the batches by their estimated size in bytes
         progress_callback
             A callback function that is called with the number of rows uploaded after each batch
         """
@@ -432,7 +446,7 @@ class GdsArrowClient:
         self,
         graph_name: str,
         triplet_data: pyarrow.Table | Iterable[pyarrow.RecordBatch] | pandas.DataFrame,
-        batch_size: int = 10_000,
+        batch_size: int | BatchByteBudget = 10_000,
         progress_callback: ProgressCallback = lambda num_triplets: None,
     ) -> None:
         """
@@ -445,7 +459,7 @@ class GdsArrowClient:
         triplet_data : pyarrow.Table | Iterable[pyarrow.RecordBatch] | DataFrame
             The triplet data to upload
         batch_size
-            The number of rows per batch
+            The number of rows per batch, or a byte budget to size the batches by their estimated size in bytes
         progress_callback
             A callback function that is called with the number of rows uploaded after each batch
         """
@@ -483,20 +497,27 @@ class GdsArrowClient:
         self,
         graph_name: str,
         entity_type: str,
-        data: pyarrow.Table | list[pyarrow.RecordBatch] | pandas.DataFrame,
-        batch_size: int,
+        data: pyarrow.Table | Iterable[pyarrow.RecordBatch] | pandas.DataFrame,
+        batch_size: int | BatchByteBudget,
         progress_callback: ProgressCallback,
     ) -> None:
-        batches: list[RecordBatch]
+        batch_sizer = BatchSizer(batch_size)
+        batches: Iterable[RecordBatch]
         match data:
             case pyarrow.Table():
-                batches = data.to_batches(batch_size)
+                batches = batch_sizer.batches(data)
             case pandas.DataFrame():
-                batches = table_from_pandas(data).to_batches(batch_size)
-
+                batches = pandas_upload_batches(data, batch_sizer)
+            case pyarrow.RecordBatchReader():
+                batches = batch_sizer.rebatch(data)
             case _:
                 batches = data
 
+        batch_iterator = iter(batches)
+        first_batch = next(batch_iterator, None)
+        if first_batch is None:
+            return
+
         flight_descriptor = {
             "name": "PUT_COMMAND",
             "version": ArrowEndpointVersion.V1.version(),
@@ -504,18 +525,22 @@ class GdsArrowClient:
         }
         upload_descriptor = flight.FlightDescriptor.for_command(json.dumps(flight_descriptor).encode("utf-8"))
 
-        put_stream, ack_stream = self._flight_client.do_put_with_retry(upload_descriptor, batches[0].schema)
+        put_stream, ack_stream = self._flight_client.do_put_with_retry(upload_descriptor, first_batch.schema)
 
         @self._flight_client._retry_config.decorator(operation_name="Upload batch", logger=self._logger)
         def upload_batch(p: RecordBatch) -> None:
             put_stream.write_batch(p)
 
+        ack_window = UploadAckWindow(
+            ack_stream, self._max_in_flight_batches, progress_callback, batch_sizer.acknowledged
+        )
         try:
             with put_stream:
-                for partition in batches:
+                for partition in itertools.chain([first_batch], batch_iterator):
                     upload_batch(partition)
-                    ack_stream.read()
-                    progress_callback(partition.num_rows)
+                    ack_window.sent(partition)
+
+                ack_window.drain()
         except Exception as e:
             handle_flight_error(e)
 
@@ -563,6 +588,9 @@ class GdsArrowClient:
             arrow_table = get.read_all()
         except Exception as e:
             handle_flight_error(e)
+        if self._keep_dictionaries:
+            return table_to_pandas(arrow_table, keep_dictionaries=True)
+
         arrow_table = self._sanitize_arrow_table(arrow_table)
         return arrow_table.to_pandas(types_mapper=pandas.ArrowDtype)  # type: ignore
 
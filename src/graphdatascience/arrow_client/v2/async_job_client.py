@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from contextlib import aclosing
+from typing import Any, AsyncGenerator, AsyncIterator, Literal, overload
+
+import pyarrow
+from pandas import DataFrame
+from pyarrow import RecordBatch
+from pyarrow.flight import FlightStreamReader
+from tenacity import AsyncRetrying, retry_if_result
+
+from graphdatascience.arrow_client.arrow_table_utils import NumpyColumns, OutputFormat, convert_table
+from graphdatascience.arrow_client.authenticated_flight_client import AuthenticatedArrowClient
+from graphdatascience.arrow_client.v2.api_types import JobStatus
+from graphdatascience.arrow_client.v2.job_client import JobClient
+from graphdatascience.retry_utils.retry_utils import job_wait_strategy
+
+
+class AsyncJobClient:
+    """
+    Awaitable counterpart of `JobClient`, to drive many jobs concurrently from one event loop.
+
+    Flight calls block, so each of them runs in the default executor of the event loop for the duration of the call
+    only. Between the status checks of `wait`, no thread is held. Cancelling a task which awaits a job also cancels
+    the job on the server, unless disabled via `cancel_on_cancellation`, and cancelling a stream closes it.
+
+    Parameters
+    ----------
+    client
+        The authenticated Arrow client used for all calls. It is shared by all jobs, so consider a client pool size
+        that matches the number of concurrent streams.
+    """
+
+    def __init__(self, client: AuthenticatedArrowClient):
+        self._client = client
+        self._logger = logging.getLogger("gds_async_job_client")
+
+    async def run_job(self, endpoint: str, config: dict[str, Any]) -> str:
+        """Starts a job and returns its id without waiting for it."""
+        return await asyncio.to_thread(JobClient.run_job, self._client, endpoint, config)
+
+    async def run_job_and_wait(self, endpoint: str, config: dict[str, Any]) -> str:
+        job_id = await self.run_job(endpoint, config)
+        await self.wait(job_id)
+        return job_id
+
+    async def status(self, job_id: str) -> JobStatus:
+        return await asyncio.to_thread(JobClient.get_job_status, self._client, job_id)
+
+    async def wait(
+        self, job_id: str, expected_status: str | None = None, cancel_on_cancellation: bool = True
+    ) -> JobStatus:
+        """
+        Waits until the job succeeded, reached the expected status or was aborted.
+
+        Parameters
+        ----------
+        job_id
+            The job to wait for.
+        expected_status
+            A status to wait for instead of the job being done.
+        cancel_on_cancellation
+            Whether to cancel the job on the server if the awaiting task is cancelled.
+
+        Returns
+        -------
+        JobStatus
+            The last status of the job, which tells whether it succeeded or was aborted.
+        """
+        try:
+            async for attempt in AsyncRetrying(
+                retry=retry_if_result(lambda _: True), wait=job_wait_strategy(), reraise=True
+            ):
+                with attempt:
+                    job_status = await self.status(job_id)
+                    if job_status.aborted():
+                        return job_status
+                    if job_status.succeeded() if expected_status is None else job_status.status == expected_status:
+                        return job_status
+        except asyncio.CancelledError:
+            if cancel_on_cancellation:
+                await self._cancel_quietly(job_id)
+            raise
+
+        raise AssertionError("unreachable: the job status is polled until it returns")
+
+    async def cancel(self, job_id: str) -> None:
+        await asyncio.to_thread(JobClient.cancel_job, self._client, job_id)
+
+    async def summary(self, job_id: str) -> dict[str, Any]:
+        return await asyncio.to_thread(JobClient.get_summary, self._client, job_id)
+
+    @overload
+    async def stream(
+        self,
+        graph_name: str,
+        job_id: str,
+        output_format: Literal["pandas"] = "pandas",
+        keep_dictionaries: bool = False,
+    ) -> DataFrame: ...
+
+    @overload
+    async def stream(
+        self, graph_name: str, job_id: str, output_format: Literal["arrow"], keep_dictionaries: bool = False
+    ) -> pyarrow.Table: ...
+
+    @overload
+    async def stream(
+        self, graph_name: str, job_id: str, output_format: Literal["numpy"], keep_dictionaries: bool = False
+    ) -> NumpyColumns: ...
+
+    async def stream(
+        self,
+        graph_name: str,
+        job_id: str,
+        output_format: OutputFormat = "pandas",
+        keep_dictionaries: bool = False,
+    ) -> DataFrame | pyarrow.Table | NumpyColumns:
+        """
+        Streams the result of a finished job into the requested output format.
+
+        The result is read batch by batch, so a cancelled task stops reading after the current batch.
+        """
+        export_job_id = await asyncio.to_thread(JobClient.start_export_result, self._client, graph_name, job_id)
+        reader = await asyncio.to_thread(self._client.get_stream, JobClient._stream_ticket(export_job_id))
+
+        async with aclosing(self._read_batches(reader)) as batch_iterator:
+            batches = [batch async for batch in batch_iterator]
+        table = pyarrow.Table.from_batches(batches, schema=reader.schema)
+        return convert_table(table, output_format, keep_dictionaries)
+
+    async def stream_batches(self, graph_name: str, job_id: str) -> AsyncIterator[RecordBatch]:
+        """
+        Yields the record batches of the result of a finished job as they arrive.
+
+        Abandoning the iterator or cancelling the consuming task cancels the stream.
+        """
+        export_job_id = await asyncio.to_thread(JobClient.start_export_result, self._client, graph_name, job_id)
+        reader = await asyncio.to_thread(self._client.get_stream, JobClient._stream_ticket(export_job_id))
+
+        async with aclosing(self._read_batches(reader)) as batches:
+            async for batch in batches:
+                yield batch
+
+    @staticmethod
+    async def _read_batches(reader: FlightStreamReader) -> AsyncGenerator[RecordBatch, None]:
+        exhausted = False
+        try:
+            while True:
+                batch = await asyncio.to_thread(AsyncJobClient._read_chunk, reader)
+                if batch is None:
+                    exhausted = True
+                    return
+                yield batch
+        finally:
+            if not exhausted:
+                # also unblocks a read which is still waiting for the next batch in the executor
+                reader.cancel()
+
+    @staticmethod
+    def _read_chunk(reader: FlightStreamReader) -> RecordBatch | None:
+        # a StopIteration cannot be raised through a future, so the end of the stream is signalled with None
+        try:
+            return reader.read_chunk().data
+        except StopIteration:
+            return None
+
+    async def _cancel_quietly(self, job_id: str) -> None:
+        try:
+            # the cancellation of the job must not be interrupted by the cancellation of the task
+            await asyncio.shield(self.cancel(job_id))
+        except Exception as e:
+            self._logger.warning(f"Failed to cancel job '{job_id}' after the waiting task was cancelled: {e}")
@@ -1,17 +1,26 @@
 from __future__ import annotations
 
+import itertools
 import json
 import logging
 from types import TracebackType
-from typing import Any, Type
+from typing import Any, Callable, Iterable, Iterator, Literal, Type, overload
 
 import pandas
 import pyarrow
 from pyarrow import RecordBatch, flight
 
 from graphdatascience.arrow_client.arrow_endpoint_version import ArrowEndpointVersion
-from graphdatascience.arrow_client.arrow_table_utils import table_from_pandas
+from graphdatascience.arrow_client.arrow_table_utils import NumpyColumns, OutputFormat, convert_table
 from graphdatascience.arrow_client.authenticated_flight_client import AuthenticatedArrowClient, ConnectionInfo
+from graphdatascience.arrow_client.batch_sizing import BatchByteBudget, BatchSizer
+from graphdatascience.arrow_client.stream_export import ExportFormat, ExportPath, export_stream
+from graphdatascience.arrow_client.upload_ack_window import DEFAULT_MAX_IN_FLIGHT_BATCHES, UploadAckWindow
+from graphdatascience.arrow_client.upload_pipeline import (
+    DEFAULT_CONVERSION_CHUNK_ROWS,
+    DEFAULT_MAX_QUEUED_CHUNKS,
+    pandas_upload_batches,
+)
 from graphdatascience.query_runner.termination_flag import TerminationFlag
 
 from ...procedure_surface.api.default_values import ALL_TYPES
@@ -20,11 +29,20 @@ from ..progress_callback import ProgressCallback
 from .api_types import JobStatus
 from .job_client import JobClient
 
+DEFAULT_MAX_UPLOAD_RESUMES = 3
+
+# Errors after which the put stream is broken, but the server may still accept a new stream for the same job.
+_RESUMABLE_UPLOAD_ERRORS = (flight.FlightUnavailableError, flight.FlightTimedOutError)
+
 
 class GdsArrowClient:
     def __init__(
         self,
         flight_client: AuthenticatedArrowClient,
+        max_in_flight_batches: int = DEFAULT_MAX_IN_FLIGHT_BATCHES,
+        max_upload_resumes: int = DEFAULT_MAX_UPLOAD_RESUMES,
+        conversion_chunk_rows: int = DEFAULT_CONVERSION_CHUNK_ROWS,
+        max_queued_chunks: int = DEFAULT_MAX_QUEUED_CHUNKS,
     ):
         """Creates a new GdsArrowClient instance.
 
@@ -32,8 +50,26 @@ class GdsArrowClient:
         ----------
         flight_client : AuthenticatedArrowClient
             The authenticated flight client to use for communication with the GDS server. Ownership of the client is transferred to this GdsArrowClient.
+        max_in_flight_batches : int
+            The number of uploaded batches which may be awaiting an acknowledgement from the server before the next batch is sent.
+            A value of 1 waits for each batch to be acknowledged before sending the next one.
+        max_upload_resumes : int
+            How often an upload reopens its stream after a transient failure and resumes from the last acknowledged batch.
+            Batches are delivered at least once: the batches which were not acknowledged when the stream broke are sent
+            again, although the server may already have applied some of them, whose acknowledgement was lost with the
+            connection. As the server does not deduplicate batches, a resumed upload can then add duplicate nodes or
+            relationships to the projection. Use 0 to fail the upload on the first broken stream instead.
+        conversion_chunk_rows : int
+            The number of DataFrame rows converted to Arrow at once. Chunks are converted on a background thread while
+            the previous chunk is being uploaded.
+        max_queued_chunks : int
+            The number of converted chunks which may wait to be uploaded, bounding the memory used for the conversion.
         """
         self._flight_client = flight_client
+        self._max_in_flight_batches = max_in_flight_batches
+        self._max_upload_resumes = max_upload_resumes
+        self._conversion_chunk_rows = conversion_chunk_rows
+        self._max_queued_chunks = max_queued_chunks
         self._logger = logging.getLogger("gds_arrow_client")
 
     def get_node_properties(
@@ -177,7 +213,24 @@ class GdsArrowClient:
 
         return JobClient.run_job(self._flight_client, endpoint, config)
 
-    def stream_job(self, job_id: str) -> pandas.DataFrame:
+    @overload
+    def stream_job(
+        self, job_id: str, output_format: Literal["pandas"] = "pandas", keep_dictionaries: bool = False
+    ) -> pandas.DataFrame: ...
+
+    @overload
+    def stream_job(
+        self, job_id: str, output_format: Literal["arrow"], keep_dictionaries: bool = False
+    ) -> pyarrow.Table: ...
+
+    @overload
+    def stream_job(
+        self, job_id: str, output_format: Literal["numpy"], keep_dictionaries: bool = False
+    ) -> NumpyColumns: ...
+
+    def stream_job(
+        self, job_id: str, output_format: OutputFormat = "pandas", keep_dictionaries: bool = False
+    ) -> pandas.DataFrame | pyarrow.Table | NumpyColumns:
         """
         Streams the results of a previously started job.
 
@@ -185,13 +238,74 @@ class GdsArrowClient:
         ----------
         job_id
             Identifier for the computation.
+        output_format
+            The format of the result. "pandas" returns a DataFrame, "arrow" returns the pyarrow Table as received
+            from the server and "numpy" returns a dictionary of NumPy arrays keyed by column name.
+        keep_dictionaries
+            Whether dictionary-encoded columns, such as labels and relationship types, become pandas.Categorical
+            columns. Arrow tables always keep dictionary arrays.
 
         Returns
         -------
-        DataFrame
-            A pandas DataFrame containing the results of the job.
+        DataFrame | pyarrow.Table | dict[str, numpy.ndarray]
+            The results of the job in the requested format.
         """
-        return JobClient().get_stream(self._flight_client, job_id)
+        if output_format == "pandas":
+            return JobClient().get_stream(self._flight_client, job_id, keep_dictionaries)
+        return convert_table(JobClient.get_stream_table(self._flight_client, job_id), output_format, keep_dictionaries)
+
+    def stream_job_batches(self, job_id: str) -> Iterator[RecordBatch]:
+        """
+        Streams the results of a previously started job batch by batch.
+
+        In contrast to `stream_job`, the result is never materialized as a whole. This allows processing results
+        which are larger than the available client memory.
+
+        Parameters
+        ----------
+        job_id
+            Identifier for the computation.
+
+        Returns
+        -------
+        Iterator[RecordBatch]
+            The record batches of the result, in the order they are received from the server.
+        """
+        return JobClient.get_stream_batches(self._flight_client, job_id)
+
+    def stream_job_to_file(
+        self,
+        job_id: str,
+        path: ExportPath,
+        file_format: ExportFormat = "parquet",
+        *,
+        partition_by: list[str] | None = None,
+    ) -> int:
+        """
+        Streams the results of a previously started job into a file, writing each batch as it is received.
+
+        Only the batch currently being written is held in client memory.
+
+        Parameters
+        ----------
+        job_id
+            Identifier for the computation.
+        path
+            The target file, or the base directory for the "dataset" format.
+        file_format
+            "parquet" for a single Parquet file, "ipc" for an Arrow IPC file, or "dataset" for a directory of
+            Parquet files.
+        partition_by
+            The columns by which the "dataset" format is partitioned into hive-style subdirectories.
+
+        Returns
+        -------
+        int
+            The number of rows written.
+        """
+        reader = JobClient.get_stream_reader(self._flight_client, job_id)
+        with reader:
+            return export_stream(reader, path, file_format, partition_by=partition_by)
 
     def create_graph(
         self,
@@ -327,10 +441,15 @@ class GdsArrowClient:
     def upload_nodes(
         self,
         job_id: str,
-        data: pyarrow.Table | list[pyarrow.RecordBatch] | pandas.DataFrame | list[pandas.DataFrame],
-        batch_size: int = 10000,
+        data: pyarrow.Table
+        | list[pyarrow.RecordBatch]
+        | pyarrow.RecordBatchReader
+        | pandas.DataFrame
+        | list[pandas.DataFrame],
+        batch_size: int | BatchByteBudget = 10000,
         progress_callback: ProgressCallback = lambda num_rows: None,
         termination_flag: TerminationFlag | None = None,
+        abort_on_termination: bool = True,
     ) -> None:
         """
         Uploads node data to the server for a given job.
@@ -342,23 +461,39 @@ class GdsArrowClient:
         data
             The data to upload
         batch_size
-            The number of rows per batch
+            The number of rows per batch, or a byte budget to size the batches by their estimated size in bytes.
+            Applies to DataFrames, Tables and the batches read from a RecordBatchReader. Lists of record batches are
+            sent as they are.
         progress_callback
             A callback function that is called with the number of rows uploaded after each batch
         termination_flag
             A termination flag to cancel the upload if requested
+        abort_on_termination
+            Whether to abort the job once the termination flag is set. Pass False if the caller aborts the job itself,
+            such as when uploading on several streams at once.
         """
         self._upload_data(
-            "graph.project.fromTables.nodes", job_id, data, batch_size, progress_callback, termination_flag
+            "graph.project.fromTables.nodes",
+            job_id,
+            data,
+            batch_size,
+            progress_callback,
+            termination_flag,
+            abort_on_termination,
         )
 
     def upload_relationships(
         self,
         job_id: str,
-        data: pyarrow.Table | list[pyarrow.RecordBatch] | pandas.DataFrame | list[pandas.DataFrame],
-        batch_size: int = 10000,
+        data: pyarrow.Table
+        | list[pyarrow.RecordBatch]
+        | pyarrow.RecordBatchReader
+        | pandas.DataFrame
+        | list[pandas.DataFrame],
+        batch_size: int | BatchByteBudget = 10000,
         progress_callback: ProgressCallback = lambda num_rows: None,
         termination_flag: TerminationFlag | None = None,
+        abort_on_termination: bool = True,
     ) -> None:
         """
         Uploads relationship data to the server for a given job.
@@ -370,21 +505,32 @@ class GdsArrowClient:
         data
             The data to upload
         batch_size
-            The number of rows per batch
+            The number of rows per batch, or a byte budget to size the batches by their estimated size in bytes.
+            Applies to DataFrames, Tables and the batches read from a RecordBatchReader. Lists of record batches are
+            sent as they are.
         progress_callback
             A callback function that is called with the number of rows uploaded after each batch
         termination_flag
             A termination flag to cancel the upload if requested
+        abort_on_termination
+            Whether to abort the job once the termination flag is set. Pass False if the caller aborts the job itself,
+            such as when uploading on several streams at once.
         """
         self._upload_data(
-            "graph.project.fromTables.relationships", job_id, data, batch_size, progress_callback, termination_flag
+            "graph.project.fromTables.relationships",
+            job_id,
+            data,
+            batch_size,
+            progress_callback,
+            termination_flag,
+            abort_on_termination,
         )
 
     def upload_triplets(
         self,
         job_id: str,
-        data: pyarrow.Table | list[pyarrow.RecordBatch] | pandas.DataFrame,
-        batch_size: int = 10000,
+        data: pyarrow.Table | list[pyarrow.RecordBatch] | pyarrow.RecordBatchReader | pandas.DataFrame,
+        batch_size: int | BatchByteBudget = 10000,
         progress_callback: ProgressCallback = lambda num_triplets: None,
         termination_flag: TerminationFlag | None = None,
     ) -> None:
@@ -398,7 +544,9 @@ class GdsArrowClient:
         data
             The data to upload
         batch_size
-            The number of rows per batch
+            The number of rows per batch, or a byte budget to size the batches by their estimated size in bytes.
+            Applies to DataFrames, Tables and the batches read from a RecordBatchReader. Lists of record batches are
+            sent as they are.
         progress_callback
             A callback function that is called with the number of rows uploaded after each batch
         termination_flag
@@ -482,10 +630,15 @@ class GdsArrowClient:
         self,
         endpoint: str,
         job_id: str,
-        data: pyarrow.Table | list[pyarrow.RecordBatch] | list[pandas.DataFrame] | pandas.DataFrame,
-        batch_size: int = 10000,
+        data: pyarrow.Table
+        | list[pyarrow.RecordBatch]
+        | pyarrow.RecordBatchReader
+        | list[pandas.DataFrame]
+        | pandas.DataFrame,
+        batch_size: int | BatchByteBudget = 10000,
         progress_callback: ProgressCallback = lambda num_rows: None,
         termination_flag: TerminationFlag | None = None,
+        abort_on_termination: bool = True,
     ) -> None:
         flight_descriptor = {
             "name": endpoint,
@@ -496,23 +649,50 @@ class GdsArrowClient:
         }
         upload_descriptor = flight.FlightDescriptor.for_command(json.dumps(flight_descriptor).encode("utf-8"))
 
-        for batches in self._batch_groups(data, batch_size):
-            self._upload_batches(upload_descriptor, batches, job_id, progress_callback, termination_flag)
+        for group in self._upload_groups(data):
+            batch_sizer = BatchSizer(batch_size)
+            batches: Iterable[RecordBatch]
+            if isinstance(group, list):
+                batches = group
+            elif isinstance(group, pyarrow.RecordBatchReader):
+                batches = batch_sizer.rebatch(group)
+            elif isinstance(group, pandas.DataFrame):
+                batches = pandas_upload_batches(
+                    group, batch_sizer, self._conversion_chunk_rows, self._max_queued_chunks
+                )
+            else:
+                batches = batch_sizer.batches(group)
+            self._upload_batches(
+                upload_descriptor,
+                batches,
+                job_id,
+                progress_callback,
+                termination_flag,
+                batch_sizer.acknowledged,
+                abort_on_termination,
+            )
 
     @staticmethod
-    def _batch_groups(
-        data: pyarrow.Table | list[pyarrow.RecordBatch] | list[pandas.DataFrame] | pandas.DataFrame,
-        batch_size: int,
-    ) -> list[list[pyarrow.RecordBatch]]:
-        if isinstance(data, pandas.DataFrame):
-            return [table_from_pandas(data).to_batches(batch_size)]
+    def _upload_groups(
+        data: pyarrow.Table
+        | list[pyarrow.RecordBatch]
+        | pyarrow.RecordBatchReader
+        | list[pandas.DataFrame]
+        | pandas.DataFrame,
+    ) -> list[pyarrow.Table | list[pyarrow.RecordBatch] | pyarrow.RecordBatchReader | pandas.DataFrame]:
+        """
+        Splits the data into groups sharing a schema, each of which is uploaded on its own stream.
 
-        if isinstance(data, pyarrow.Table):
-            return [data.to_batches(batch_size)]
+        Tables are sliced into batches during the upload, whereas given record batches are sent as they are.
+        A RecordBatchReader is read lazily while uploading, and DataFrames are converted chunk by chunk while
+        uploading.
+        """
+        if isinstance(data, (pyarrow.Table, pyarrow.RecordBatchReader, pandas.DataFrame)):
+            return [data]
 
         if isinstance(data, list):
             if all(isinstance(entry, pandas.DataFrame) for entry in data):
-                return [table_from_pandas(entry).to_batches(batch_size) for entry in data]
+                return list(data)
 
             if all(isinstance(entry, pyarrow.RecordBatch) for entry in data):
                 return [data]
@@ -522,30 +702,62 @@ class GdsArrowClient:
     def _upload_batches(
         self,
         upload_descriptor: flight.FlightDescriptor,
-        batches: list[pyarrow.RecordBatch],
+        batches: Iterable[pyarrow.RecordBatch],
         job_id: str,
         progress_callback: ProgressCallback,
         termination_flag: TerminationFlag | None,
+        ack_latency_callback: Callable[[float], None] = lambda latency: None,
+        abort_on_termination: bool = True,
     ) -> None:
-        if not batches:
+        batch_iterator = iter(batches)
+        first_batch = next(batch_iterator, None)
+        if first_batch is None:
             return
 
-        put_stream, ack_stream = self._flight_client.do_put_with_retry(upload_descriptor, batches[0].schema)
-
-        @self._flight_client._retry_config.decorator(operation_name="Upload batch", logger=self._logger)
-        def upload_batch(batch: RecordBatch) -> None:
-            put_stream.write_batch(batch)
-
-        with put_stream:
-            for partition in batches:
-                if termination_flag is not None and termination_flag.is_set():
-                    self.abort_job(job_id)
-                    # closing the put_stream should raise an error. this is a safeguard to always signal the termination to the user.
-                    raise RuntimeError(f"Upload for job '{job_id}' was aborted via termination flag.")
-
-                upload_batch(partition)
-                ack_stream.read()
-                progress_callback(partition.num_rows)
+        # Batches which were written but not acknowledged when the stream broke, to be sent again on a new stream.
+        # Acknowledged batches were processed by the server, so progress is only reported once per batch. An
+        # unacknowledged batch may still have been applied, so resuming delivers batches at least once.
+        replay: list[RecordBatch] = [first_batch]
+        resumes = 0
+        while True:
+            put_stream, ack_stream = self._flight_client.do_put_with_retry(upload_descriptor, replay[0].schema)
+            ack_window = UploadAckWindow(
+                ack_stream, self._max_in_flight_batches, progress_callback, ack_latency_callback
+            )
+            current_batch: RecordBatch | None = None
+            try:
+                with put_stream:
+                    for batch in itertools.chain(replay, batch_iterator):
+                        if termination_flag is not None and termination_flag.is_set():
+                            if abort_on_termination:
+                                self.abort_job(job_id)
+                            # closing the put_stream should raise an error. this is a safeguard to always signal the termination to the user.
+                            raise RuntimeError(f"Upload for job '{job_id}' was aborted via termination flag.")
+
+                        current_batch = batch
+                        put_stream.write_batch(batch)
+                        current_batch = None
+                        ack_window.sent(batch)
+
+                    ack_window.drain()
+                return
+            except _RESUMABLE_UPLOAD_ERRORS as e:
+                replay = ack_window.unacknowledged() + ([current_batch] if current_batch is not None else [])
+                if not replay:
+                    next_batch = next(batch_iterator, None)
+                    if next_batch is None:
+                        # the stream broke while closing, after every batch was acknowledged
+                        return
+                    replay = [next_batch]
+
+                if resumes >= self._max_upload_resumes:
+                    raise
+
+                resumes += 1
+                self._logger.warning(
+                    f"Upload for job '{job_id}' was interrupted ({e}), resuming after the last acknowledged batch "
+                    f"(attempt {resumes} of {self._max_upload_resumes})."
+                )
 
     def __enter__(self) -> GdsArrowClient:
         return self
@@ -1,21 +1,27 @@
 import json
-from typing import Any
+from typing import Any, Iterator
 
-from pandas import ArrowDtype, DataFrame
-from pyarrow.flight import Ticket
-from tenacity import Retrying, retry_if_result
+from pandas import DataFrame
+from pyarrow import RecordBatch, RecordBatchReader, Table
+from pyarrow.flight import FlightStreamReader, Ticket
 
+from graphdatascience.arrow_client.arrow_table_utils import table_to_pandas
 from graphdatascience.arrow_client.authenticated_flight_client import AuthenticatedArrowClient
+from graphdatascience.arrow_client.result_cache import ResultCache
 from graphdatascience.arrow_client.v2.api_types import JobIdConfig, JobStatus
 from graphdatascience.arrow_client.v2.data_mapper_utils import deserialize_single
+from graphdatascience.arrow_client.v2.job_poller import JobPoller
+from graphdatascience.arrow_client.v2.job_scope import JobScope
 from graphdatascience.progress.progress_bar import TqdmProgressBar
 from graphdatascience.query_runner.termination_flag import TerminationFlag
-from graphdatascience.retry_utils.retry_utils import job_wait_strategy
 
 JOB_STATUS_ENDPOINT = "v2/jobs.status"
 JOBS_CANCEL_ENDPOINT = "v2/jobs.cancel"
 RESULTS_SUMMARY_ENDPOINT = "v2/results.summary"
 
+# how often a waiting thread checks its termination flag while no new job status arrived
+_TERMINATION_CHECK_INTERVAL = 0.1
+
 
 class JobClient:
     def __init__(self, progress_bar_options: dict[str, Any] | None = None):
@@ -34,7 +40,10 @@ class JobClient:
         res = client.do_action_with_retry(endpoint, config)
 
         single = deserialize_single(res)
-        return JobIdConfig(**single).job_id
+        job_id = JobIdConfig(**single).job_id
+        if scope := JobScope.current():
+            scope.record(job_id)
+        return job_id
 
     def wait_for_job(
         self,
@@ -43,24 +52,41 @@ class JobClient:
         show_progress: bool,
         expected_status: str | None = None,
         termination_flag: TerminationFlag | None = None,
-    ) -> None:
+    ) -> JobStatus:
+        """
+        Waits until the job succeeded, reached the expected status or was aborted.
+
+        The status is polled by the `JobPoller` shared by all waiters on the client, so that concurrent waits result
+        in one status request per job and tick instead of one polling loop per thread.
+
+        Returns
+        -------
+        JobStatus
+            The status which finished the wait, so callers can tell an aborted job apart without polling again.
+        """
         progress_bar: TqdmProgressBar | None = None
 
-        def check_expected_status(status: JobStatus) -> bool:
-            return job_status.succeeded() if expected_status is None else status.status == expected_status
+        def is_finished(status: JobStatus) -> bool:
+            reached = status.succeeded() if expected_status is None else status.status == expected_status
+            return reached or status.aborted()
 
         if termination_flag is None:
-            termination_flag = TerminationFlag.create()
+            scope = JobScope.current()
+            termination_flag = scope.termination_flag if scope else TerminationFlag.create()
 
-        for attempt in Retrying(retry=retry_if_result(lambda _: True), wait=job_wait_strategy(), reraise=True):
-            with attempt:
+        termination_flag.assert_running()
+        waiter = JobPoller.shared(client, JobClient.get_job_status).register(job_id, is_finished)
+        try:
+            while True:
                 termination_flag.assert_running()
-                job_status = self.get_job_status(client, job_id)
+                job_status = waiter.next_status(timeout=_TERMINATION_CHECK_INTERVAL)
+                if job_status is None:
+                    continue
 
-                if check_expected_status(job_status) or job_status.aborted():
+                if is_finished(job_status):
                     if progress_bar:
                         progress_bar.finish(success=job_status.succeeded())
-                    return
+                    return job_status
 
                 if show_progress:
                     if progress_bar is None:
@@ -73,6 +99,8 @@ class JobClient:
                             )
                     if progress_bar:
                         progress_bar.update(job_status.status, job_status.progress_percent(), job_status.sub_tasks())
+        finally:
+            waiter.close()
 
     @staticmethod
     def cancel_job(client: AuthenticatedArrowClient, job_id: str) -> None:
@@ -86,14 +114,59 @@ class JobClient:
 
     @staticmethod
     def get_summary(client: AuthenticatedArrowClient, job_id: str) -> dict[str, Any]:
+        cache = ResultCache.of(client)
+        if cache is not None and (cached := cache.get_summary(job_id)) is not None:
+            return cached
+
         res = client.do_action_with_retry(RESULTS_SUMMARY_ENDPOINT, JobIdConfig(jobId=job_id).dump_camel())
-        return deserialize_single(res)
+        summary = deserialize_single(res)
+        if cache is not None:
+            cache.put_summary(job_id, summary)
+        return summary
+
+    @staticmethod
+    def stream_results(
+        client: AuthenticatedArrowClient, graph_name: str, job_id: str, keep_dictionaries: bool = False
+    ) -> DataFrame:
+        if ResultCache.of(client) is not None:
+            return table_to_pandas(JobClient.stream_result_table(client, graph_name, job_id), keep_dictionaries)
+
+        export_job_id = JobClient.start_export_result(client, graph_name, job_id)
+
+        return JobClient.get_stream(client, export_job_id, keep_dictionaries)
+
+    @staticmethod
+    def stream_result_table(client: AuthenticatedArrowClient, graph_name: str, job_id: str) -> Table:
+        """Streams the complete result of a job, or returns it from the result cache attached to the client."""
+        cache = ResultCache.of(client)
+        if cache is not None and (cached := cache.get(graph_name, job_id)) is not None:
+            return cached
+
+        export_job_id = JobClient.start_export_result(client, graph_name, job_id)
+        table = JobClient.get_stream_table(client, export_job_id)
+        if cache is not None:
+            cache.put(graph_name, job_id, table)
+        return table
+
+    @staticmethod
+    def stream_result_batches(client: AuthenticatedArrowClient, graph_name: str, job_id: str) -> Iterator[RecordBatch]:
+        """
+        Yields the record batches of the result as they arrive. A cached result is served from the cache, but
+        streamed results are not added to it, as they are meant to be processed without holding them in memory.
+        """
+        cache = ResultCache.of(client)
+        if cache is not None and (cached := cache.get(graph_name, job_id)) is not None:
+            return iter(cached.to_batches())
+
+        export_job_id = JobClient.start_export_result(client, graph_name, job_id)
+
+        return JobClient.get_stream_batches(client, export_job_id)
 
     @staticmethod
-    def stream_results(client: AuthenticatedArrowClient, graph_name: str, job_id: str) -> DataFrame:
+    def stream_result_reader(client: AuthenticatedArrowClient, graph_name: str, job_id: str) -> RecordBatchReader:
         export_job_id = JobClient.start_export_result(client, graph_name, job_id)
 
-        return JobClient.get_stream(client, export_job_id)
+        return JobClient.get_stream_reader(client, export_job_id)
 
     @staticmethod
     def start_export_result(client: AuthenticatedArrowClient, graph_name: str, job_id: str) -> str:
@@ -106,11 +179,57 @@ class JobClient:
         return JobIdConfig(**deserialize_single(res)).job_id
 
     @staticmethod
-    def get_stream(client: AuthenticatedArrowClient, export_job_id: str) -> DataFrame:
-        stream_payload = {"version": "v2", "name": export_job_id, "body": {}}
+    def get_stream(client: AuthenticatedArrowClient, export_job_id: str, keep_dictionaries: bool = False) -> DataFrame:
+        """
+        Reads the complete result stream into a DataFrame.
+
+        With `keep_dictionaries`, dictionary-encoded columns become pandas.Categorical instead of Arrow dictionary
+        dtypes.
+        """
+        arrow_table = JobClient.get_stream_table(client, export_job_id)
+        return table_to_pandas(arrow_table, keep_dictionaries)
+
+    @staticmethod
+    def get_stream_table(client: AuthenticatedArrowClient, export_job_id: str) -> Table:
+        get = client.get_stream(JobClient._stream_ticket(export_job_id))
+        return get.read_all()
+
+    @staticmethod
+    def get_stream_batches(client: AuthenticatedArrowClient, export_job_id: str) -> Iterator[RecordBatch]:
+        """
+        Opens the result stream eagerly and yields its record batches as they arrive.
 
-        ticket = Ticket(json.dumps(stream_payload).encode("utf-8"))
+        Only the batch currently being consumed is held in memory. Abandoning the iterator cancels the stream.
+        """
+        get = client.get_stream(JobClient._stream_ticket(export_job_id))
+        return JobClient._read_batches(get)
 
-        get = client.get_stream(ticket)
-        arrow_table = get.read_all()
-        return arrow_table.to_pandas(types_mapper=ArrowDtype)  # type: ignore
+    @staticmethod
+    def get_stream_reader(client: AuthenticatedArrowClient, export_job_id: str) -> RecordBatchReader:
+        """
+        Opens the result stream eagerly and returns a reader which exposes the result schema before any batch is read.
+
+        Batches are read lazily like in `get_stream_batches`.
+        """
+        get = client.get_stream(JobClient._stream_ticket(export_job_id))
+        return RecordBatchReader.from_batches(get.schema, JobClient._read_batches(get))
+
+    @staticmethod
+    def _stream_ticket(export_job_id: str) -> Ticket:
+        stream_payload = {"version": "v2", "name": export_job_id, "body": {}}
+        return Ticket(json.dumps(stream_payload).encode("utf-8"))
+
+    @staticmethod
+    def _read_batches(reader: FlightStreamReader) -> Iterator[RecordBatch]:
+        exhausted = False
+        try:
+            while True:
+                try:
+                    chunk = reader.read_chunk()
+                except StopIteration:
+                    exhausted = True
+                    return
+                yield chunk.data
+        finally:
+            if not exhausted:
+                reader.cancel()
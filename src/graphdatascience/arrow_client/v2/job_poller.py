@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from queue import Empty, Queue
+from typing import Callable, ClassVar
+
+from graphdatascience.arrow_client.authenticated_flight_client import AuthenticatedArrowClient
+from graphdatascience.arrow_client.v2.api_types import JobStatus
+from graphdatascience.retry_utils.retry_utils import AdaptivePollSchedule
+
+JobStatusFetcher = Callable[[AuthenticatedArrowClient, str], JobStatus]
+
+DEFAULT_MAX_CONCURRENT_STATUS_REQUESTS = 8
+
+
+class JobWaiter:
+    """
+    Receives the status updates of one awaited job from a `JobPoller`.
+
+    The waiter is finished once a status matched its `is_finished` predicate or polling the status failed.
+    """
+
+    def __init__(self, poller: JobPoller, job_id: str, is_finished: Callable[[JobStatus], bool]):
+        self.job_id = job_id
+        self._poller = poller
+        self._is_finished = is_finished
+        self._updates: Queue[JobStatus | BaseException] = Queue()
+
+    def next_status(self, timeout: float) -> JobStatus | None:
+        """
+        Returns the next polled status, or None if there was none within the timeout.
+        An error which occurred while polling the status is raised.
+        """
+        try:
+            update = self._updates.get(timeout=timeout)
+        except Empty:
+            return None
+
+        if isinstance(update, BaseException):
+            raise update
+        return update
+
+    def is_finished(self, status: JobStatus) -> bool:
+        return self._is_finished(status)
+
+    def close(self) -> None:
+        """Stops receiving updates. The job is no longer polled once it has no waiters left."""
+        self._poller._unregister(self)
+
+    def _publish(self, update: JobStatus | BaseException) -> None:
+        self._updates.put(update)
+
+
+@dataclass
+class _PolledJob:
+    job_id: str
+    next_poll: float
+    schedule: AdaptivePollSchedule = field(default_factory=AdaptivePollSchedule)
+    waiters: list[JobWaiter] = field(default_factory=list)
+
+
+class JobPoller:
+    """
+    Polls the status of all awaited jobs of a client from a single background thread.
+
+    Instead of one polling loop per waiting thread, each job is polled once per tick regardless of how many threads
+    wait for it. All jobs due in a tick are polled together, with up to `max_concurrent_requests` status requests in
+    flight, and every waiter is handed the new status. The next check of each job is scheduled by an
+    `AdaptivePollSchedule` from its reported progress. The background thread only runs while there are jobs to poll.
+
+    The poller only holds a weak reference to its client, so that the shared poller does not keep a client, its
+    connections and the poller itself alive once the client is no longer used.
+    """
+
+    _shared: ClassVar[weakref.WeakKeyDictionary[AuthenticatedArrowClient, JobPoller]] = weakref.WeakKeyDictionary()
+    _shared_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __init__(
+        self,
+        client: AuthenticatedArrowClient,
+        fetch_status: JobStatusFetcher,
+        max_concurrent_requests: int = DEFAULT_MAX_CONCURRENT_STATUS_REQUESTS,
+    ):
+        self._client = weakref.ref(client)
+        self._fetch_status = fetch_status
+        self._max_concurrent_requests = max_concurrent_requests
+        self._lock = threading.Condition()
+        self._jobs: dict[str, _PolledJob] = {}
+        self._thread: threading.Thread | None = None
+
+    @classmethod
+    def shared(cls, client: AuthenticatedArrowClient, fetch_status: JobStatusFetcher) -> JobPoller:
+        """The poller used by all waiters on the given client."""
+        with cls._shared_lock:
+            poller = cls._shared.get(client)
+            if poller is None:
+                poller = JobPoller(client, fetch_status)
+                cls._shared[client] = poller
+            return poller
+
+    def register(self, job_id: str, is_finished: Callable[[JobStatus], bool]) -> JobWaiter:
+        """Starts delivering the status of the job to a new waiter, beginning with an immediate status check."""
+        waiter = JobWaiter(self, job_id, is_finished)
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                job = _PolledJob(job_id, next_poll=time.monotonic())
+                self._jobs[job_id] = job
+            else:
+                job.next_poll = time.monotonic()
+            job.waiters.append(waiter)
+
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="gds-job-poller", daemon=True)
+                self._thread.start()
+            self._lock.notify_all()
+
+        return waiter
+
+    def polled_jobs(self) -> list[str]:
+        with self._lock:
+            return list(self._jobs)
+
+    def _unregister(self, waiter: JobWaiter) -> None:
+        with self._lock:
+            job = self._jobs.get(waiter.job_id)
+            if job is None or waiter not in job.waiters:
+                return
+            job.waiters.remove(waiter)
+            if not job.waiters:
+                del self._jobs[waiter.job_id]
+
+    def _run(self) -> None:
+        with ThreadPoolExecutor(self._max_concurrent_requests, thread_name_prefix="gds-job-status") as executor:
+            while True:
+                with self._lock:
+                    if not self._jobs:
+                        self._thread = None
+                        return
+
+                    now = time.monotonic()
+                    due = [job.job_id for job in self._jobs.values() if job.next_poll <= now]
+                    if not due:
+                        next_poll = min(job.next_poll for job in self._jobs.values())
+                        self._lock.wait(next_poll - now)
+                        continue
+
+                updates = self._poll(executor, due)
+
+                with self._lock:
+                    for job_id, update in zip(due, updates):
+                        self._deliver(job_id, update)
+
+    def _poll(self, executor: ThreadPoolExecutor, job_ids: list[str]) -> list[JobStatus | BaseException]:
+        def fetch(job_id: str) -> JobStatus | BaseException:
+            client = self._client()
+            if client is None:
+                return RuntimeError(f"Cannot poll the status of job '{job_id}', as its client was garbage collected.")
+            try:
+                return self._fetch_status(client, job_id)
+            except Exception as e:
+                return e
+
+        if len(job_ids) == 1:
+            return [fetch(job_ids[0])]
+        return list(executor.map(fetch, job_ids))
+
+    def _deliver(self, job_id: str, update: JobStatus | BaseException) -> None:
+        job = self._jobs.get(job_id)
+        if job is None:
+            # all waiters left while the status was polled
+            return
+
+        for waiter in list(job.waiters):
+            waiter._publish(update)
+            if isinstance(update, BaseException) or waiter.is_finished(update):
+                job.waiters.remove(waiter)
+
+        if job.waiters:
+            progress = update.progress if isinstance(update, JobStatus) and update.progress_known() else None
+            job.next_poll = time.monotonic() + job.schedule.next_delay(progress)
+        else:
+            del self._jobs[job_id]
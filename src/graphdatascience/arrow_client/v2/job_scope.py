@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator
+
+from graphdatascience.query_runner.termination_flag import TerminationFlag
+
+_current_scope: ContextVar[JobScope | None] = ContextVar("gds_job_scope", default=None)
+
+
+class ScopeTerminationFlag(TerminationFlag):
+    """A termination flag which is only set explicitly, as signal handlers cannot be installed off the main thread."""
+
+    def __init__(self) -> None:
+        self._event = threading.Event()
+
+    def is_set(self) -> bool:
+        return self._event.is_set()
+
+    def set(self) -> None:
+        self._event.set()
+
+    def assert_running(self) -> None:
+        if self.is_set():
+            raise RuntimeError("The call was cancelled.")
+
+
+class JobScope:
+    """
+    Tracks the jobs started by a call, so that they can be cancelled from another thread.
+
+    While a scope is active, `JobClient.run_job` records the ids of the started jobs in it, and waits without an
+    explicit termination flag stop once the scope was cancelled.
+    """
+
+    def __init__(self) -> None:
+        self.termination_flag = ScopeTerminationFlag()
+        self._lock = threading.Lock()
+        self._job_ids: list[str] = []
+
+    @staticmethod
+    def current() -> JobScope | None:
+        return _current_scope.get()
+
+    @contextmanager
+    def activate(self) -> Iterator[JobScope]:
+        token = _current_scope.set(self)
+        try:
+            yield self
+        finally:
+            _current_scope.reset(token)
+
+    def record(self, job_id: str) -> None:
+        with self._lock:
+            self._job_ids.append(job_id)
+
+    def job_ids(self) -> list[str]:
+        with self._lock:
+            return list(self._job_ids)
+
+    def cancel(self) -> list[str]:
+        """Stops the waits of the scope and returns the ids of the jobs started so far."""
+        self.termination_flag.set()
+        return self.job_ids()
+
+    def cancelled(self) -> bool:
+        return self.termination_flag.is_set()
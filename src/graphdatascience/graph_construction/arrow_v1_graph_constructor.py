@@ -5,11 +5,11 @@ import logging
 from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
-from pandas import DataFrame
 from tqdm.auto import tqdm
 
 from graphdatascience.arrow_client.v1.gds_arrow_client import GdsArrowClient
 
+from .construct_input import ConstructInput, InputPartition, input_partitions
 from .graph_constructor import GraphConstructor
 
 
@@ -34,7 +34,7 @@ class ArrowV1GraphConstructor(GraphConstructor):
         self._min_partition_size = batch_size * 10
         self._logger = logging.getLogger()
 
-    def run(self, node_dfs: list[DataFrame], relationship_dfs: list[DataFrame]) -> None:
+    def run(self, node_dfs: list[ConstructInput], relationship_dfs: list[ConstructInput]) -> None:
         try:
             config: dict[str, Any] = {
                 "name": self._graph_name,
@@ -70,29 +70,23 @@ class ArrowV1GraphConstructor(GraphConstructor):
                     self._logger.warning(f"error aborting graph creation: {abort_exception}")
             raise e
 
-    def _partition_dfs(self, dfs: list[DataFrame]) -> list[DataFrame]:
-        partitioned_dfs: list[DataFrame] = []
-
-        for df in dfs:
-            i = 0
-            while i < len(df):
-                partitioned_dfs.append(df.iloc[i : i + self._min_partition_size])
-                i += self._min_partition_size
-
-        return partitioned_dfs
-
-    def _send_dfs(self, dfs: list[DataFrame], entity_type: str) -> None:
+    def _send_dfs(self, dfs: list[ConstructInput], entity_type: str) -> None:
         desc = "Uploading Nodes" if entity_type == "node" else "Uploading Relationships"
-        pbar = tqdm(total=sum([df.shape[0] for df in dfs]), unit="Records", desc=desc)
-
-        partitioned_dfs = self._partition_dfs(dfs)
+        partitions = [
+            partition for source in dfs for partition in input_partitions(source, lambda df: self._min_partition_size)
+        ]
+        row_counts = [partition.num_rows for partition in partitions]
+        total = None if None in row_counts else sum(row_count or 0 for row_count in row_counts)
+        pbar = tqdm(total=total, unit="Records", desc=desc)
 
         with ThreadPoolExecutor(self._concurrency) as executor:
 
-            def run_upload(df: DataFrame) -> None:
+            def run_upload(partition: InputPartition) -> None:
                 def progress_callback(num_rows: int) -> None:
                     pbar.update(num_rows)
 
+                df = partition.read()
+
                 if entity_type == "node":
                     self._client.upload_nodes(
                         self._graph_name,
@@ -109,7 +103,7 @@ class ArrowV1GraphConstructor(GraphConstructor):
                     )
                 pbar.refresh()
 
-            futures = [executor.submit(run_upload, df) for df in partitioned_dfs]
+            futures = [executor.submit(run_upload, partition) for partition in partitions]
             for future in concurrent.futures.as_completed(futures):
                 if not future.exception():
                     continue
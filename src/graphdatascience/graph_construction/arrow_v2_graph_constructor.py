@@ -1,17 +1,26 @@
 from __future__ import annotations
 
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable
 
 from pandas import DataFrame
+from pyarrow import RecordBatchReader
 
 from graphdatascience.arrow_client.v2.gds_arrow_client import GdsArrowClient
 from graphdatascience.progress.progress_bar import NoOpProgressBar, ProgressBar, TqdmProgressBar
 
 from ..arrow_client.authenticated_flight_client import AuthenticatedArrowClient
+from ..arrow_client.batch_sizing import BatchByteBudget
+from ..arrow_client.progress_callback import ProgressCallback
 from ..arrow_client.v2.job_client import JobClient
 from ..query_runner.termination_flag import TerminationFlag
+from .construct_input import ConstructInput, InputPartition, input_partitions, normalize_inputs
 from .graph_constructor import GraphConstructor
 
+DEFAULT_UPLOAD_CONCURRENCY = 4
+
 
 class ArrowV2GraphConstructor(GraphConstructor):
     def __init__(
@@ -21,8 +30,9 @@ class ArrowV2GraphConstructor(GraphConstructor):
         concurrency: int | None = None,
         undirected_relationship_types: list[str] | None = None,
         inverse_indexed_relationship_types: list[str] | None = None,
-        batch_size: int = 100_000,
+        batch_size: int | BatchByteBudget = 100_000,
         show_progress: bool = True,
+        upload_concurrency: int | None = None,
     ):
         self._arrow_client = authenticated_arrow_client
         self._graph_name = graph_name
@@ -31,16 +41,27 @@ class ArrowV2GraphConstructor(GraphConstructor):
         self._undirected_relationship_types = undirected_relationship_types or []
         self._inverse_indexed_relationship_types = inverse_indexed_relationship_types or []
         self._batch_size = batch_size
+        self._upload_concurrency = upload_concurrency or concurrency or DEFAULT_UPLOAD_CONCURRENCY
         self._show_progress = show_progress
         self._logger = logging.getLogger()
 
-    def run(self, node_dfs: list[DataFrame], relationship_dfs: list[DataFrame]) -> None:
+    def run(self, node_dfs: list[ConstructInput], relationship_dfs: list[ConstructInput]) -> None:
         gds_arrow_client = GdsArrowClient(self._arrow_client)
         job_client = JobClient()
-        termination_flag = TerminationFlag.create()
+        termination_flag = _UploadTerminationFlag(TerminationFlag.create())
+
+        # files and datasets are only split into partitions here, their data is read by the upload threads
+        node_partitions = self._partitions(normalize_inputs(node_dfs))
+        rel_partitions = self._partitions(normalize_inputs(relationship_dfs))
+
+        # the total is unknown if one of the inputs is a RecordBatchReader
+        row_counts = [partition.num_rows for partition in node_partitions + rel_partitions]
+        total_count = None if None in row_counts else sum(row_count or 0 for row_count in row_counts)
 
         if self._show_progress:
-            progress_bar: ProgressBar = TqdmProgressBar(task_name="Constructing graph", relative_progress=0.0)
+            progress_bar: ProgressBar = TqdmProgressBar(
+                task_name="Constructing graph", relative_progress=0.0 if total_count is not None else None
+            )
         else:
             progress_bar = NoOpProgressBar()
 
@@ -51,52 +72,119 @@ class ArrowV2GraphConstructor(GraphConstructor):
                 inverse_indexed_relationship_types=self._inverse_indexed_relationship_types,
                 concurrency=self._concurrency,
             )
-            node_count = node_dfs.shape[0] if isinstance(node_dfs, DataFrame) else sum(df.shape[0] for df in node_dfs)
-            if isinstance(relationship_dfs, DataFrame):
-                rel_count = relationship_dfs.shape[0]
-            elif relationship_dfs is None:
-                rel_count = 0
-            else:
-                rel_count = sum(df.shape[0] for df in relationship_dfs)
-            total_count = node_count + rel_count
-
-            gds_arrow_client.upload_nodes(
-                create_job_id,
-                node_dfs,
-                batch_size=self._batch_size,
-                progress_callback=lambda rows_imported: progress_bar.update(
-                    sub_tasks_description="Uploading nodes", progress=rows_imported / total_count, status="Running"
-                ),
-                termination_flag=termination_flag,
-            )
+            # the uploads of all streams report to the same progress bar
+            uploaded_rows = 0
+            progress_lock = threading.Lock()
 
-            gds_arrow_client.node_load_done(create_job_id)
+            def progress_callback(task: str) -> ProgressCallback:
+                def update(num_rows: int) -> None:
+                    nonlocal uploaded_rows
+                    with progress_lock:
+                        uploaded_rows += num_rows
+                        progress_bar.update(
+                            sub_tasks_description=task,
+                            progress=100 * uploaded_rows / total_count if total_count else None,
+                            status="Running",
+                        )
 
-            # skipping progress bar here as we have our own for the overall process
-            job_client.wait_for_job(
-                self._arrow_client,
-                create_job_id,
-                expected_status="RELATIONSHIP_LOADING",
-                termination_flag=termination_flag,
-                show_progress=False,
-            )
+                return update
 
-            if rel_count > 0:
-                gds_arrow_client.upload_relationships(
-                    create_job_id,
-                    relationship_dfs,
-                    batch_size=self._batch_size,
-                    progress_callback=lambda rows_imported: progress_bar.update(
-                        sub_tasks_description="Uploading relationships",
-                        progress=rows_imported / total_count,
-                        status="Running",
+            try:
+                self._upload_concurrently(
+                    lambda df: gds_arrow_client.upload_nodes(
+                        create_job_id,
+                        df,
+                        batch_size=self._batch_size,
+                        progress_callback=progress_callback("Uploading nodes"),
+                        termination_flag=termination_flag,
+                        # the job is aborted once below, not by every stream observing the termination flag
+                        abort_on_termination=False,
                     ),
+                    node_partitions,
+                    termination_flag,
+                )
+
+                gds_arrow_client.node_load_done(create_job_id)
+
+                # skipping progress bar here as we have our own for the overall process
+                job_client.wait_for_job(
+                    self._arrow_client,
+                    create_job_id,
+                    expected_status="RELATIONSHIP_LOADING",
                     termination_flag=termination_flag,
+                    show_progress=False,
                 )
 
-            gds_arrow_client.relationship_load_done(create_job_id)
+                if rel_partitions:
+                    self._upload_concurrently(
+                        lambda df: gds_arrow_client.upload_relationships(
+                            create_job_id,
+                            df,
+                            batch_size=self._batch_size,
+                            progress_callback=progress_callback("Uploading relationships"),
+                            termination_flag=termination_flag,
+                            abort_on_termination=False,
+                        ),
+                        rel_partitions,
+                        termination_flag,
+                    )
+
+                gds_arrow_client.relationship_load_done(create_job_id)
+            except (Exception, KeyboardInterrupt) as e:
+                try:
+                    gds_arrow_client.abort_job(create_job_id)
+                except Exception as abort_exception:
+                    self._logger.warning(f"error aborting graph creation: {abort_exception}")
+                raise e
 
         # will produce a second progress bar to show graph construction on the server side
         job_client.wait_for_job(
             self._arrow_client, create_job_id, termination_flag=termination_flag, show_progress=True
         )
+
+    def _upload_concurrently(
+        self,
+        upload: Callable[[DataFrame | RecordBatchReader], None],
+        partitions: list[InputPartition],
+        termination_flag: TerminationFlag,
+    ) -> None:
+        """Uploads the given partitions, each on its own `do_put` stream, and fails on the first error."""
+        with ThreadPoolExecutor(self._upload_concurrency) as executor:
+            futures = [executor.submit(lambda p: upload(p.read()), partition) for partition in partitions]
+            try:
+                for future in as_completed(futures):
+                    future.result()
+            except BaseException:
+                # stop the uploads of the other partitions as the construction will be aborted
+                termination_flag.set()
+                for future in futures:
+                    future.cancel()
+                raise
+
+    def _partitions(self, inputs: list[ConstructInput]) -> list[InputPartition]:
+        return [partition for source in inputs for partition in input_partitions(source, self._partition_size)]
+
+    def _partition_size(self, df: DataFrame) -> int:
+        """The number of rows per partition, which corresponds to ten upload batches."""
+        if isinstance(self._batch_size, int):
+            return self._batch_size * 10
+
+        row_bytes = max(df.memory_usage(index=False).sum() / max(len(df), 1), 1.0)
+        return max(1, int(10 * self._batch_size.target_bytes / row_bytes))
+
+
+class _UploadTerminationFlag(TerminationFlag):
+    """Set when the user interrupts the construction or when one of the concurrent uploads failed."""
+
+    def __init__(self, user_flag: TerminationFlag):
+        self._user_flag = user_flag
+        self._upload_failed = threading.Event()
+
+    def is_set(self) -> bool:
+        return self._upload_failed.is_set() or self._user_flag.is_set()
+
+    def set(self) -> None:
+        self._upload_failed.set()
+
+    def assert_running(self) -> None:
+        self._user_flag.assert_running()
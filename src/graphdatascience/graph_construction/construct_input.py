@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+from typing import Callable, Iterator, TypeAlias
+
+import pyarrow
+import pyarrow.dataset
+from pandas import ArrowDtype, DataFrame
+from pyarrow import RecordBatch, RecordBatchReader, ipc
+
+# A Parquet file, an Arrow IPC file or a directory of Parquet files
+ArrowFilePath: TypeAlias = str | os.PathLike[str]
+ArrowInput: TypeAlias = ArrowFilePath | pyarrow.dataset.Dataset | RecordBatchReader
+ConstructInput: TypeAlias = DataFrame | ArrowInput
+
+IPC_FILE_SUFFIXES = (".arrow", ".ipc", ".feather")
+
+# the number of record batches of an Arrow IPC file which are uploaded on one stream
+_IPC_BATCHES_PER_PARTITION = 10
+
+
+@dataclass(frozen=True)
+class InputPartition:
+    """
+    A part of a construct input which is uploaded on its own stream.
+
+    The data is only read once `read` is called, so partitions of files can be listed without loading them.
+    `num_rows` is None if it is only known after reading the data, as for a RecordBatchReader.
+    """
+
+    num_rows: int | None
+    read: Callable[[], DataFrame | RecordBatchReader]
+
+
+def partition_dfs(dfs: list[DataFrame], partition_size: int) -> list[DataFrame]:
+    """Split the given DataFrames into slices of at most `partition_size` rows, which can be uploaded independently."""
+    partitioned_dfs: list[DataFrame] = []
+
+    for df in dfs:
+        i = 0
+        while i < len(df):
+            partitioned_dfs.append(df.iloc[i : i + partition_size])
+            i += partition_size
+
+    return partitioned_dfs
+
+
+def normalize_inputs(inputs: ConstructInput | list[ConstructInput] | None) -> list[ConstructInput]:
+    if inputs is None:
+        return []
+    if isinstance(inputs, list):
+        return inputs
+    return [inputs]
+
+
+def input_partitions(
+    source: ConstructInput, dataframe_partition_size: Callable[[DataFrame], int]
+) -> list[InputPartition]:
+    """
+    Splits a construct input into partitions which can be uploaded concurrently.
+
+    DataFrames are sliced, datasets are split into their files, and Arrow IPC files are memory-mapped and split into
+    ranges of record batches. A RecordBatchReader can only be consumed once and is therefore a single partition.
+    """
+    if isinstance(source, DataFrame):
+        return [
+            InputPartition(len(partition), _constant(partition))
+            for partition in partition_dfs([source], dataframe_partition_size(source))
+        ]
+
+    if isinstance(source, RecordBatchReader):
+        return [InputPartition(None, _constant(source))]
+
+    if isinstance(source, pyarrow.dataset.Dataset):
+        return _dataset_partitions(source)
+
+    if isinstance(source, (str, os.PathLike)):
+        if str(source).endswith(IPC_FILE_SUFFIXES):
+            return _ipc_file_partitions(source)
+        return _dataset_partitions(pyarrow.dataset.dataset(source, format="parquet", partitioning="hive"))
+
+    raise ValueError(
+        f"Unsupported construct input of type {type(source)}. Expected a DataFrame, a path to a Parquet or Arrow IPC "
+        "file, a pyarrow Dataset or a RecordBatchReader."
+    )
+
+
+def read_input(source: ConstructInput) -> DataFrame:
+    """Reads a construct input completely, for constructors which can only send DataFrames."""
+    if isinstance(source, DataFrame):
+        return source
+
+    if isinstance(source, RecordBatchReader):
+        table = source.read_all()
+    elif isinstance(source, pyarrow.dataset.Dataset):
+        table = source.to_table()
+    elif isinstance(source, (str, os.PathLike)) and str(source).endswith(IPC_FILE_SUFFIXES):
+        with pyarrow.memory_map(str(source)) as mapped_file:
+            table = ipc.open_file(mapped_file).read_all()
+    elif isinstance(source, (str, os.PathLike)):
+        table = pyarrow.dataset.dataset(source, format="parquet", partitioning="hive").to_table()
+    else:
+        raise ValueError(f"Unsupported construct input of type {type(source)}.")
+
+    return table.to_pandas(types_mapper=ArrowDtype)  # type: ignore
+
+
+def _constant(data: DataFrame | RecordBatchReader) -> Callable[[], DataFrame | RecordBatchReader]:
+    return lambda: data
+
+
+def _dataset_partitions(dataset: pyarrow.dataset.Dataset) -> list[InputPartition]:
+    def reader(fragment: pyarrow.dataset.Fragment) -> Callable[[], RecordBatchReader]:
+        return lambda: RecordBatchReader.from_batches(dataset.schema, fragment.to_batches(schema=dataset.schema))
+
+    return [InputPartition(fragment.count_rows(), reader(fragment)) for fragment in dataset.get_fragments()]
+
+
+def _ipc_file_partitions(path: ArrowFilePath) -> list[InputPartition]:
+    with pyarrow.memory_map(str(path)) as mapped_file:
+        file_reader = ipc.open_file(mapped_file)
+        schema = file_reader.schema
+        batch_rows = [file_reader.get_batch(i).num_rows for i in range(file_reader.num_record_batches)]
+
+    def reader(start: int, end: int) -> Callable[[], RecordBatchReader]:
+        def batches() -> Iterator[RecordBatch]:
+            # batches of a memory-mapped file are not copied, their pages are loaded as they are sent
+            with pyarrow.memory_map(str(path)) as mapped_file:
+                file_reader = ipc.open_file(mapped_file)
+                for i in range(start, end):
+                    yield file_reader.get_batch(i)
+
+        return lambda: RecordBatchReader.from_batches(schema, batches())
+
+    partitions = []
+    for start in range(0, len(batch_rows), _IPC_BATCHES_PER_PARTITION):
+        end = min(start + _IPC_BATCHES_PER_PARTITION, len(batch_rows))
+        partitions.append(InputPartition(sum(batch_rows[start:end]), reader(start, end)))
+    return partitions
@@ -12,6 +12,7 @@ from graphdatascience.query_runner.query_runner import QueryRunner
 from graphdatascience.query_runner.query_type import QueryType
 from graphdatascience.versions import ServerVersion
 
+from .construct_input import ConstructInput, read_input
 from .graph_constructor import GraphConstructor
 
 
@@ -69,7 +70,7 @@ class CypherGraphConstructor(GraphConstructor):
         self._undirected_relationship_types = undirected_relationship_types
         self._inverse_indexed_relationship_types = inverse_indexed_relationship_types
 
-    def run(self, node_dfs: list[DataFrame], relationship_dfs: list[DataFrame]) -> None:
+    def run(self, node_dfs: list[ConstructInput], relationship_dfs: list[ConstructInput]) -> None:
         if self._should_warn_about_arrow_missing():
             warnings.warn(
                 "GDS Enterprise users can use Apache Arrow for fast graph construction; please see the documentation "
@@ -83,7 +84,11 @@ class CypherGraphConstructor(GraphConstructor):
             self._server_version,
             self._concurrency,
             self._undirected_relationship_types,
-        ).run(node_dfs, relationship_dfs)
+        ).run(
+            # the data is sent as query parameters, so file inputs need to be read completely
+            [read_input(source) for source in node_dfs],
+            [read_input(source) for source in relationship_dfs],
+        )
 
     def _should_warn_about_arrow_missing(self) -> bool:
         try:
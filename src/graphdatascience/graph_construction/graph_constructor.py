@@ -1,9 +1,11 @@
+from __future__ import annotations
+
 from abc import ABC, abstractmethod
 
-from pandas import DataFrame
+from .construct_input import ConstructInput
 
 
 class GraphConstructor(ABC):
     @abstractmethod
-    def run(self, node_dfs: list[DataFrame], relationship_dfs: list[DataFrame]) -> None:
+    def run(self, node_dfs: list[ConstructInput], relationship_dfs: list[ConstructInput]) -> None:
         pass
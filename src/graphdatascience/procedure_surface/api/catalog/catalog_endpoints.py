@@ -4,11 +4,11 @@ from abc import ABC, abstractmethod
 from types import TracebackType
 from typing import Any, NamedTuple, Type
 
-from pandas import DataFrame
 from pydantic import field_validator
 
 from graphdatascience.graph.graph_api import Graph
 from graphdatascience.graph.graph_info import GraphInfoWithDegrees
+from graphdatascience.graph_construction.construct_input import ConstructInput
 from graphdatascience.procedure_surface.api.base_result import BaseResult
 from graphdatascience.procedure_surface.api.catalog.dataset_endpoints import DatasetEndpoints
 from graphdatascience.procedure_surface.api.catalog.graph_export_endpoints import GraphExportEndpoints
@@ -62,8 +62,8 @@ class CatalogEndpoints(ABC):
     def construct(
         self,
         graph_name: str,
-        nodes: DataFrame | list[DataFrame],
-        relationships: DataFrame | list[DataFrame] | None = None,
+        nodes: ConstructInput | list[ConstructInput],
+        relationships: ConstructInput | list[ConstructInput] | None = None,
         concurrency: int | None = None,
         undirected_relationship_types: list[str] | None = None,
         inverse_indexed_relationship_types: list[str] | None = None,
@@ -71,6 +71,10 @@ class CatalogEndpoints(ABC):
     ) -> Graph:
         """Construct a graph from a list of node and relationship dataframes.
 
+        Instead of dataframes, the inputs can also be paths to Parquet files, directories of Parquet files or Arrow IPC
+        files (`.arrow`, `.ipc`, `.feather`), as well as pyarrow Datasets or RecordBatchReaders.
+        When uploading over Arrow, these are streamed to the server without being converted into dataframes.
+
         Parameters
         ----------
         graph_name
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 from collections import OrderedDict
-from typing import Any
+from typing import Any, Iterator, Literal, overload
 
+import pyarrow
 from pandas import DataFrame
 
+from graphdatascience.arrow_client.arrow_table_utils import NumpyColumns, OutputFormat, convert_table, table_to_pandas
 from graphdatascience.arrow_client.authenticated_flight_client import AuthenticatedArrowClient
 from graphdatascience.arrow_client.v2.api_types import JobStatus
 from graphdatascience.arrow_client.v2.job_client import JobClient
@@ -12,12 +14,25 @@ from graphdatascience.graph import Graph
 from graphdatascience.procedure_surface.api.job_not_finished_error import JobNotFinishedError
 from graphdatascience.procedure_surface.api.write_job_handle import WriteJobHandle
 from graphdatascience.procedure_surface.arrow.mutation_runner import MutationRunner
-from graphdatascience.procedure_surface.arrow.stream_result_mapper import apply_stream_mapper
+from graphdatascience.procedure_surface.arrow.stream_result_mapper import (
+    apply_arrow_stream_mapper,
+    apply_stream_mapper,
+    supports_chunked_stream,
+)
 from graphdatascience.query_runner.termination_flag import TerminationFlag
 from graphdatascience.session.remote_ops.write_protocols import WriteProtocol
 
 
 class JobHandle:
+    """
+    A job started on Aura Graph Analytics, such as by the `compute` method of an Arrow algorithm endpoint or by
+    `gds.jobs.get`.
+
+    `stream` and `stream_batches` can return the result as a `pyarrow.Table` or as NumPy arrays with `output_format`.
+    This is the only way to get other formats than a DataFrame, the `stream` methods of the algorithm and catalog
+    endpoints return DataFrames.
+    """
+
     def __init__(
         self,
         arrow_client: AuthenticatedArrowClient,
@@ -77,16 +92,111 @@ class JobHandle:
             MutationRunner.drop_write_internals(nested_config)
         return result
 
+    @overload
+    def stream(
+        self,
+        *,
+        wait: bool = True,
+        termination_flag: TerminationFlag | None = None,
+        output_format: Literal["pandas"] = "pandas",
+        keep_dictionaries: bool = False,
+    ) -> DataFrame: ...
+
+    @overload
     def stream(
         self,
         *,
         wait: bool = True,
         termination_flag: TerminationFlag | None = None,
-    ) -> DataFrame:
+        output_format: Literal["arrow"],
+        keep_dictionaries: bool = False,
+    ) -> pyarrow.Table: ...
+
+    @overload
+    def stream(
+        self,
+        *,
+        wait: bool = True,
+        termination_flag: TerminationFlag | None = None,
+        output_format: Literal["numpy"],
+        keep_dictionaries: bool = False,
+    ) -> NumpyColumns: ...
+
+    def stream(
+        self,
+        *,
+        wait: bool = True,
+        termination_flag: TerminationFlag | None = None,
+        output_format: OutputFormat = "pandas",
+        keep_dictionaries: bool = False,
+    ) -> DataFrame | pyarrow.Table | NumpyColumns:
         self._ensure_done(wait=wait, termination_flag=termination_flag)
-        result = JobClient.stream_results(self._arrow_client, self._graph_name, self._job_id)
-        result = apply_stream_mapper(self._endpoint, result)
-        return result
+        if output_format == "pandas":
+            result = JobClient.stream_results(self._arrow_client, self._graph_name, self._job_id, keep_dictionaries)
+            return apply_stream_mapper(self._endpoint, result)
+
+        table = JobClient.stream_result_table(self._arrow_client, self._graph_name, self._job_id)
+        return convert_table(apply_arrow_stream_mapper(self._endpoint, table), output_format, keep_dictionaries)
+
+    @overload
+    def stream_batches(
+        self,
+        *,
+        wait: bool = True,
+        termination_flag: TerminationFlag | None = None,
+        output_format: Literal["pandas"] = "pandas",
+        keep_dictionaries: bool = False,
+    ) -> Iterator[DataFrame]: ...
+
+    @overload
+    def stream_batches(
+        self,
+        *,
+        wait: bool = True,
+        termination_flag: TerminationFlag | None = None,
+        output_format: Literal["arrow"],
+        keep_dictionaries: bool = False,
+    ) -> Iterator[pyarrow.Table]: ...
+
+    @overload
+    def stream_batches(
+        self,
+        *,
+        wait: bool = True,
+        termination_flag: TerminationFlag | None = None,
+        output_format: Literal["numpy"],
+        keep_dictionaries: bool = False,
+    ) -> Iterator[NumpyColumns]: ...
+
+    def stream_batches(
+        self,
+        *,
+        wait: bool = True,
+        termination_flag: TerminationFlag | None = None,
+        output_format: OutputFormat = "pandas",
+        keep_dictionaries: bool = False,
+    ) -> Iterator[DataFrame] | Iterator[pyarrow.Table] | Iterator[NumpyColumns]:
+        if not supports_chunked_stream(self._endpoint):
+            raise ValueError(f"The result of '{self._endpoint}' can only be streamed as a whole. Use `stream` instead.")
+
+        self._ensure_done(wait=wait, termination_flag=termination_flag)
+        batches = JobClient.stream_result_batches(self._arrow_client, self._graph_name, self._job_id)
+        if output_format == "pandas":
+            return (
+                apply_stream_mapper(
+                    self._endpoint, table_to_pandas(pyarrow.Table.from_batches([batch]), keep_dictionaries)
+                )
+                for batch in batches
+            )
+
+        return (  # type: ignore[return-value]
+            convert_table(
+                apply_arrow_stream_mapper(self._endpoint, pyarrow.Table.from_batches([batch])),
+                output_format,
+                keep_dictionaries,
+            )
+            for batch in batches
+        )
 
     def mutate(
         self,
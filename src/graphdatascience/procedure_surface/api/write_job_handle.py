@@ -9,7 +9,7 @@ from graphdatascience.procedure_surface.api.base_result import BaseResult
 from graphdatascience.procedure_surface.api.job_not_finished_error import JobNotFinishedError
 from graphdatascience.progress.progress_bar import TqdmProgressBar
 from graphdatascience.query_runner.termination_flag import TerminationFlag
-from graphdatascience.retry_utils.retry_utils import before_log, job_wait_strategy
+from graphdatascience.retry_utils.retry_utils import adaptive_job_wait_strategy, before_log
 from graphdatascience.session.remote_ops.write_protocols import JobStatus, WriteProtocol
 
 
@@ -110,7 +110,7 @@ class WriteJobHandle:
         @retry(
             reraise=True,
             retry=retry_if_result(is_not_done),
-            wait=job_wait_strategy(),
+            wait=adaptive_job_wait_strategy(lambda status: status.progress),
             before=before_log(
                 f"Write-Back (graph: `{self._graph_name}`, jobId: `{self._job_id}`)",
                 logger,
@@ -3,17 +3,16 @@ from __future__ import annotations
 import typing
 from typing import Any
 
-from pandas import DataFrame
-
 from graphdatascience.arrow_client.authenticated_flight_client import AuthenticatedArrowClient
+from graphdatascience.arrow_client.batch_sizing import BatchByteBudget
+from graphdatascience.arrow_client.result_cache import ResultCache
 from graphdatascience.arrow_client.v2.job_client import JobClient
 from graphdatascience.graph.graph_api import Graph
 from graphdatascience.graph.graph_info import GraphInfo, GraphInfoWithDegrees
 from graphdatascience.graph_construction.arrow_v2_graph_constructor import ArrowV2GraphConstructor
+from graphdatascience.graph_construction.construct_input import ConstructInput, normalize_inputs
 from graphdatascience.procedure_surface.api.catalog import (
     NodeLabelEndpoints,
-    NodePropertiesEndpoints,
-    RelationshipsEndpoints,
 )
 from graphdatascience.procedure_surface.api.catalog.catalog_endpoints import (
     CatalogEndpoints,
@@ -76,20 +75,13 @@ class CatalogArrowEndpoints(CatalogEndpoints):
     def construct(
         self,
         graph_name: str,
-        nodes: DataFrame | typing.List[DataFrame],
-        relationships: DataFrame | typing.List[DataFrame] | None = None,
+        nodes: ConstructInput | typing.List[ConstructInput],
+        relationships: ConstructInput | typing.List[ConstructInput] | None = None,
         concurrency: int | None = None,
         undirected_relationship_types: typing.List[str] | None = None,
         inverse_index_relationship_types: typing.List[str] | None = None,
-        batch_size: int = 100000,
+        batch_size: int | BatchByteBudget = 100000,
     ) -> Graph:
-        if isinstance(nodes, DataFrame):
-            nodes = [nodes]
-        if relationships is not None and isinstance(relationships, DataFrame):
-            relationships = [relationships]
-        if relationships is None:
-            relationships = []
-
         constructor = ArrowV2GraphConstructor(
             self._arrow_client,
             graph_name,
@@ -99,7 +91,7 @@ class CatalogArrowEndpoints(CatalogEndpoints):
             batch_size,
             self._show_progress,
         )
-        constructor.run(nodes, relationships)
+        constructor.run(normalize_inputs(nodes), normalize_inputs(relationships))
         return get_graph(graph_name, self._arrow_client)
 
     def drop(self, G: Graph | str, fail_if_missing: bool = True) -> GraphInfo | None:
@@ -119,6 +111,9 @@ class CatalogArrowEndpoints(CatalogEndpoints):
         """
         graph_name = G.name() if isinstance(G, Graph) else G
 
+        if (result_cache := ResultCache.of(self._arrow_client)) is not None:
+            result_cache.invalidate(graph_name=graph_name)
+
         return self._graph_backend.drop(graph_name, fail_if_missing)
 
     def filter(
@@ -302,11 +297,11 @@ class CatalogArrowEndpoints(CatalogEndpoints):
         return NodeLabelArrowEndpoints(self._arrow_client, write_client, show_progress=self._show_progress)
 
     @property
-    def node_properties(self) -> NodePropertiesEndpoints:
+    def node_properties(self) -> NodePropertiesArrowEndpoints:
         return NodePropertiesArrowEndpoints(self._arrow_client, self._query_runner, show_progress=self._show_progress)
 
     @property
-    def relationships(self) -> RelationshipsEndpoints:
+    def relationships(self) -> RelationshipArrowEndpoints:
         return RelationshipArrowEndpoints(
             self._arrow_client,
             self._write_protocol,
@@ -1,6 +1,7 @@
 from pandas import DataFrame
 
 from graphdatascience.arrow_client.authenticated_flight_client import AuthenticatedArrowClient
+from graphdatascience.arrow_client.stream_export import ExportFormat, ExportPath, export_stream, map_stream
 from graphdatascience.arrow_client.v2.data_mapper_utils import deserialize_single
 from graphdatascience.arrow_client.v2.job_client import JobClient
 from graphdatascience.graph.graph_api import Graph
@@ -13,7 +14,7 @@ from graphdatascience.procedure_surface.api.catalog.node_properties_endpoints im
 from graphdatascience.procedure_surface.api.default_values import ALL_LABELS
 from graphdatascience.procedure_surface.api.write_job_handle import WriteJobHandle
 from graphdatascience.procedure_surface.arrow.node_property_endpoints import NodePropertyEndpointsHelper
-from graphdatascience.procedure_surface.arrow.stream_result_mapper import apply_stream_mapper
+from graphdatascience.procedure_surface.arrow.stream_result_mapper import apply_arrow_stream_mapper, apply_stream_mapper
 from graphdatascience.procedure_surface.utils.config_converter import ConfigConverter
 from graphdatascience.procedure_surface.utils.result_utils import join_db_node_properties
 from graphdatascience.query_runner.query_runner import QueryRunner
@@ -81,6 +82,62 @@ class NodePropertiesArrowEndpoints(NodePropertiesEndpoints):
 
         return result
 
+    def stream_to_file(
+        self,
+        G: Graph,
+        node_properties: str | list[str],
+        path: ExportPath,
+        *,
+        file_format: ExportFormat = "parquet",
+        partition_by: list[str] | None = None,
+        list_node_labels: bool | None = False,
+        node_labels: list[str] = ALL_LABELS,
+        concurrency: int | None = None,
+        sudo: bool = False,
+        log_progress: bool = True,
+        username: str | None = None,
+        job_id: str | None = None,
+    ) -> int:
+        """
+        Streams the given node properties into a file.
+
+        Each chunk is written as it arrives, so the full result is never held in client memory.
+        See `stream` for a description of the remaining parameters.
+
+        Parameters
+        ----------
+        path
+            The target file, or the base directory for the "dataset" format.
+        file_format
+            "parquet" for a single Parquet file, "ipc" for an Arrow IPC file, or "dataset" for a directory of
+            Parquet files.
+        partition_by
+            The columns by which the "dataset" format is partitioned into hive-style subdirectories.
+
+        Returns
+        -------
+        int
+            The number of nodes written.
+        """
+        config = ConfigConverter.convert_to_gds_config(
+            graph_name=G.name(),
+            node_properties=node_properties if isinstance(node_properties, list) else [node_properties],
+            list_node_labels=list_node_labels,
+            node_labels=node_labels,
+            concurrency=concurrency,
+            sudo=sudo,
+            log_progress=log_progress,
+            username=username,
+            job_id=job_id,
+        )
+
+        job_id = JobClient.run_job(self._arrow_client, "v2/graph.nodeProperties.stream", config)
+        with JobClient.stream_result_reader(self._arrow_client, G.name(), job_id) as reader:
+            mapped = map_stream(
+                reader, lambda table: apply_arrow_stream_mapper("v2/graph.nodeProperties.stream", table)
+            )
+            return export_stream(mapped, path, file_format, partition_by=partition_by)
+
     def write(
         self,
         G: Graph,
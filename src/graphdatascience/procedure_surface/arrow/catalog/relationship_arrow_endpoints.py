@@ -1,4 +1,11 @@
+from typing import Any, Iterator
+
+import pyarrow
+from pandas import ArrowDtype, DataFrame
+
+from graphdatascience.arrow_client.arrow_table_utils import dictionary_encode_columns, table_to_pandas
 from graphdatascience.arrow_client.authenticated_flight_client import AuthenticatedArrowClient
+from graphdatascience.arrow_client.stream_export import ExportFormat, ExportPath, export_stream, map_stream
 from graphdatascience.arrow_client.v2.data_mapper_utils import deserialize_single
 from graphdatascience.arrow_client.v2.job_client import JobClient
 from graphdatascience.graph.graph_api import Graph
@@ -15,7 +22,7 @@ from graphdatascience.procedure_surface.api.catalog.relationships_endpoints impo
 from graphdatascience.procedure_surface.api.default_values import ALL_LABELS, ALL_TYPES
 from graphdatascience.procedure_surface.api.write_job_handle import WriteJobHandle
 from graphdatascience.procedure_surface.arrow.collapse_path_arrow_endpoints import CollapsePathArrowEndpoints
-from graphdatascience.procedure_surface.arrow.stream_result_mapper import apply_stream_mapper
+from graphdatascience.procedure_surface.arrow.stream_result_mapper import apply_arrow_stream_mapper, apply_stream_mapper
 from graphdatascience.procedure_surface.utils.config_converter import ConfigConverter
 from graphdatascience.query_runner.termination_flag import TerminationFlag
 from graphdatascience.session.remote_ops.write_protocols import WriteProtocol
@@ -46,7 +53,144 @@ class RelationshipArrowEndpoints(RelationshipsEndpoints):
         sudo: bool = False,
         log_progress: bool = True,
         username: str | None = None,
+        keep_dictionaries: bool = False,
     ) -> RelationshipsDataFrame:
+        """
+        Streams all relationships of the specified types with the specified properties.
+
+        Parameters
+        ----------
+        G
+           Graph object to use
+        relationship_types
+            Filter the graph using the given relationship types. Relationships with any of the given types will be included.
+        relationship_properties: list[str] | None, default = None
+            The relationship properties to stream. If not specified, no properties will be streamed.
+        concurrency
+            Number of concurrent threads to use.
+        sudo
+            Disable the memory guard.
+        log_progress
+            Display progress logging.
+        username
+            As an administrator, impersonate a different user for accessing their graphs.
+        keep_dictionaries
+            Return the relationshipType column as a pandas.Categorical, which stores each type only once and speeds
+            up grouping, for example in ``by_rel_type()``.
+        Returns
+        -------
+        RelationshipsDataFrame
+            The streamed relationships [sourceNodeId, targetNodeId, relationshipType] with a column for each
+            property. Offers a ``by_rel_type()`` method to reshape the relationships by relationship type.
+        """
+        endpoint, config = self._stream_config(
+            G, relationship_types, relationship_properties, concurrency, sudo, log_progress, username
+        )
+
+        job_id = JobClient.run_job(self._arrow_client, endpoint, config)
+        if not keep_dictionaries:
+            result = apply_stream_mapper(endpoint, JobClient.stream_results(self._arrow_client, G.name(), job_id))
+            return RelationshipsDataFrame(result)
+
+        table = JobClient.stream_result_table(self._arrow_client, G.name(), job_id)
+        return RelationshipsDataFrame(self._to_categorical_pandas(endpoint, table))
+
+    def stream_batches(
+        self,
+        G: Graph,
+        relationship_types: list[str] = ALL_TYPES,
+        relationship_properties: list[str] | None = None,
+        *,
+        concurrency: int | None = None,
+        sudo: bool = False,
+        log_progress: bool = True,
+        username: str | None = None,
+        keep_dictionaries: bool = False,
+    ) -> Iterator[DataFrame]:
+        """
+        Streams all relationships of the specified types with the specified properties, one chunk at a time.
+
+        Each chunk is converted as it arrives, so the full result is never held in client memory.
+        See `stream` for a description of the parameters, including `keep_dictionaries`.
+
+        Returns
+        -------
+        Iterator[DataFrame]
+            The streamed relationships [sourceNodeId, targetNodeId, relationshipType] with a column for each
+            property, split into chunks.
+        """
+        endpoint, config = self._stream_config(
+            G, relationship_types, relationship_properties, concurrency, sudo, log_progress, username
+        )
+
+        job_id = JobClient.run_job(self._arrow_client, endpoint, config)
+        batches = JobClient.stream_result_batches(self._arrow_client, G.name(), job_id)
+
+        if keep_dictionaries:
+            return (self._to_categorical_pandas(endpoint, pyarrow.Table.from_batches([batch])) for batch in batches)
+
+        return (apply_stream_mapper(endpoint, batch.to_pandas(types_mapper=ArrowDtype)) for batch in batches)
+
+    @staticmethod
+    def _to_categorical_pandas(endpoint: str, table: pyarrow.Table) -> DataFrame:
+        table = dictionary_encode_columns(apply_arrow_stream_mapper(endpoint, table), ["relationshipType"])
+        return table_to_pandas(table, keep_dictionaries=True)
+
+    def stream_to_file(
+        self,
+        G: Graph,
+        path: ExportPath,
+        relationship_types: list[str] = ALL_TYPES,
+        relationship_properties: list[str] | None = None,
+        *,
+        file_format: ExportFormat = "parquet",
+        partition_by: list[str] | None = None,
+        concurrency: int | None = None,
+        sudo: bool = False,
+        log_progress: bool = True,
+        username: str | None = None,
+    ) -> int:
+        """
+        Streams all relationships of the specified types with the specified properties into a file.
+
+        Each chunk is written as it arrives, so the full result is never held in client memory.
+        See `stream` for a description of the remaining parameters.
+
+        Parameters
+        ----------
+        path
+            The target file, or the base directory for the "dataset" format.
+        file_format
+            "parquet" for a single Parquet file, "ipc" for an Arrow IPC file, or "dataset" for a directory of
+            Parquet files.
+        partition_by
+            The columns by which the "dataset" format is partitioned into hive-style subdirectories,
+            for example ["relationshipType"].
+
+        Returns
+        -------
+        int
+            The number of relationships written.
+        """
+        endpoint, config = self._stream_config(
+            G, relationship_types, relationship_properties, concurrency, sudo, log_progress, username
+        )
+
+        job_id = JobClient.run_job(self._arrow_client, endpoint, config)
+        with JobClient.stream_result_reader(self._arrow_client, G.name(), job_id) as reader:
+            mapped = map_stream(reader, lambda table: apply_arrow_stream_mapper(endpoint, table))
+            return export_stream(mapped, path, file_format, partition_by=partition_by)
+
+    @staticmethod
+    def _stream_config(
+        G: Graph,
+        relationship_types: list[str],
+        relationship_properties: list[str] | None,
+        concurrency: int | None,
+        sudo: bool,
+        log_progress: bool,
+        username: str | None,
+    ) -> tuple[str, dict[str, Any]]:
         config_input = {
             "graph_name": G.name(),
             "relationship_types": relationship_types or ["*"],
@@ -61,12 +205,7 @@ class RelationshipArrowEndpoints(RelationshipsEndpoints):
             config_input["relationship_properties"] = relationship_properties
             endpoint = "v2/graph.relationshipProperties.stream"
 
-        config = ConfigConverter.convert_to_gds_config(**config_input)
-
-        job_id = JobClient.run_job(self._arrow_client, endpoint, config)
-        result = apply_stream_mapper(endpoint, JobClient.stream_results(self._arrow_client, G.name(), job_id))
-
-        return RelationshipsDataFrame(result)
+        return endpoint, ConfigConverter.convert_to_gds_config(**config_input)
 
     def write(
         self,
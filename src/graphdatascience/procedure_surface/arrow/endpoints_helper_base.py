@@ -10,6 +10,7 @@ from graphdatascience.graph.graph_api import Graph
 from ...arrow_client.authenticated_flight_client import AuthenticatedArrowClient
 from ...arrow_client.v2.data_mapper_utils import deserialize_single
 from ...arrow_client.v2.job_client import JobClient
+from ...arrow_client.v2.job_scope import JobScope
 from ...query_runner.termination_flag import TerminationFlag
 from ...session.remote_ops.write_protocols import WriteProtocol
 from ..api.estimation_result import EstimationResult
@@ -100,11 +101,12 @@ class EndpointsHelperBase:
         if self._write_protocol is None:
             raise Exception("Write back is not supported by this session.")
 
+        scope = JobScope.current()
         job_handle = WriteJobHandle.create(
             self._write_protocol,
             G.name(),
             job_id,
-            TerminationFlag.create(),
+            scope.termination_flag if scope else TerminationFlag.create(),
             concurrency=write_concurrency if write_concurrency is not None else concurrency,
             property_overwrites=property_overwrites,
             relationship_type_overwrite=relationship_type_overwrite,
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import logging
+import threading
+from concurrent.futures import CancelledError, Future, ThreadPoolExecutor
+from types import TracebackType
+from typing import Any, Callable, Generic, ParamSpec, TypeVar
+
+from ...arrow_client.authenticated_flight_client import AuthenticatedArrowClient
+from ...arrow_client.v2.job_client import JobClient
+from ...arrow_client.v2.job_scope import JobScope
+
+DEFAULT_MAX_CONCURRENT_CALLS = 8
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+
+class JobFuture(Future[T], Generic[T]):
+    """
+    The pending result of an endpoint call submitted to a `JobFutureExecutor`.
+
+    It is a regular `concurrent.futures.Future`, so it works with `as_completed` and `wait`. Cancelling a pending call
+    returns True and the call never starts. Like any running future, a running call cannot be cancelled, so `cancel`
+    returns False. It still cancels the jobs the call started on the server, and the worker thread keeps running the
+    call until its next wait for a job. The future then completes with a `CancelledError` as its exception.
+    """
+
+    def __init__(self, arrow_client: AuthenticatedArrowClient, scope: JobScope) -> None:
+        super().__init__()
+        self._arrow_client = arrow_client
+        self._scope = scope
+        self._logger = logging.getLogger("gds_job_futures")
+
+    def job_ids(self) -> list[str]:
+        """The ids of the jobs started by the call so far."""
+        return self._scope.job_ids()
+
+    def cancel(self) -> bool:
+        if super().cancel():
+            return True
+        if self.done():
+            return False
+
+        for job_id in self._scope.cancel():
+            try:
+                JobClient.cancel_job(self._arrow_client, job_id)
+            except Exception as e:
+                self._logger.warning(f"Failed to cancel the job '{job_id}': {e}")
+
+        return False
+
+
+class JobFutureExecutor:
+    """
+    Runs blocking endpoint calls, such as `stream`, `mutate` or `write`, concurrently and returns their futures.
+
+    Each submitted call runs on a worker thread, with at most `max_concurrent_calls` calls at once. The waits of all
+    calls share the status polling of the client, so many concurrent calls do not multiply the status requests.
+
+    Parameters
+    ----------
+    arrow_client
+        The client the submitted endpoints use, for cancelling their jobs.
+    max_concurrent_calls
+        The maximum number of calls running at the same time. Further calls wait for a free worker.
+    """
+
+    def __init__(
+        self, arrow_client: AuthenticatedArrowClient, max_concurrent_calls: int = DEFAULT_MAX_CONCURRENT_CALLS
+    ):
+        if max_concurrent_calls < 1:
+            raise ValueError(f"The number of concurrent calls must be at least 1, but got {max_concurrent_calls}.")
+
+        self._arrow_client = arrow_client
+        self._executor = ThreadPoolExecutor(max_concurrent_calls, thread_name_prefix="gds-job-future")
+        self._lock = threading.Lock()
+        self._futures: set[Future[Any]] = set()
+
+    def submit(self, fn: Callable[P, T], /, *args: P.args, **kwargs: P.kwargs) -> JobFuture[T]:
+        """
+        Calls the endpoint method with the given arguments on a worker thread.
+
+        Example: ``executor.submit(gds.bellman_ford.stream, G, source_node=node)``
+        """
+        future: JobFuture[T] = JobFuture(self._arrow_client, JobScope())
+        with self._lock:
+            self._futures.add(future)
+        future.add_done_callback(self._forget)
+        self._executor.submit(self._run, future, fn, *args, **kwargs)
+        return future
+
+    def shutdown(self, wait: bool = True, cancel_futures: bool = False) -> None:
+        """Stops accepting calls. With `cancel_futures`, pending and running calls are cancelled as well."""
+        if cancel_futures:
+            with self._lock:
+                futures = list(self._futures)
+            for future in futures:
+                future.cancel()
+        self._executor.shutdown(wait=wait, cancel_futures=cancel_futures)
+
+    def __enter__(self) -> JobFutureExecutor:
+        return self
+
+    def __exit__(
+        self,
+        exception_type: type[BaseException] | None,
+        exception_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.shutdown(wait=True, cancel_futures=exception_type is not None)
+
+    def _forget(self, future: Future[T]) -> None:
+        with self._lock:
+            self._futures.discard(future)
+
+    @staticmethod
+    def _run(future: JobFuture[T], fn: Callable[P, T], /, *args: P.args, **kwargs: P.kwargs) -> None:
+        if not future.set_running_or_notify_cancel():
+            return
+
+        scope = future._scope
+        try:
+            with scope.activate():
+                result = fn(*args, **kwargs)
+        except BaseException as e:
+            if scope.cancelled():
+                cancelled = CancelledError()
+                cancelled.__cause__ = e
+                future.set_exception(cancelled)
+            else:
+                future.set_exception(e)
+        else:
+            if scope.cancelled():
+                future.set_exception(CancelledError())
+            else:
+                future.set_result(result)
@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+import logging
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any
+
+from graphdatascience.graph.graph_api import Graph
+
+from ...arrow_client.authenticated_flight_client import AuthenticatedArrowClient
+from ...arrow_client.v2.job_client import JobClient
+from ...query_runner.termination_flag import TerminationFlag
+from ..utils.config_converter import ConfigConverter
+from .mutation_runner import MutationRunner
+
+DEFAULT_MAX_CONCURRENT_JOBS = 4
+
+
+@dataclass(frozen=True)
+class JobStep:
+    """
+    A job of a `JobScheduler` workflow.
+
+    The config uses the parameter names of the Python endpoints, such as `embedding_dimension`. A step with a
+    `mutate_property` or `mutate_relationship_type` writes its result to the in-memory graph before the steps
+    depending on it are started.
+    """
+
+    name: str
+    endpoint: str
+    config: dict[str, Any] = field(default_factory=dict)
+    depends_on: tuple[str, ...] = ()
+    mutate_property: str | None = None
+    mutate_relationship_type: str | None = None
+
+
+class JobScheduler:
+    """
+    Runs a workflow of jobs on one graph, starting each job as soon as the steps it depends on have finished.
+
+    Independent jobs run concurrently on the server, with at most `max_concurrent_jobs` jobs running at once.
+    If a job fails, no further jobs are started, the running jobs are cancelled and the error is raised.
+    """
+
+    def __init__(
+        self,
+        arrow_client: AuthenticatedArrowClient,
+        G: Graph,
+        max_concurrent_jobs: int = DEFAULT_MAX_CONCURRENT_JOBS,
+        show_progress: bool = False,
+    ):
+        if max_concurrent_jobs < 1:
+            raise ValueError(f"The number of concurrent jobs must be at least 1, but got {max_concurrent_jobs}.")
+
+        self._arrow_client = arrow_client
+        self._graph_name = G.name()
+        self._max_concurrent_jobs = max_concurrent_jobs
+        self._show_progress = show_progress
+        self._mutation_runner = MutationRunner(arrow_client)
+        self._steps: dict[str, JobStep] = {}
+        self._logger = logging.getLogger("gds_job_scheduler")
+
+    def add(
+        self,
+        name: str,
+        endpoint: str,
+        config: dict[str, Any] | None = None,
+        *,
+        depends_on: list[str] | None = None,
+        mutate_property: str | None = None,
+        mutate_relationship_type: str | None = None,
+    ) -> JobScheduler:
+        """
+        Adds a step to the workflow.
+
+        Parameters
+        ----------
+        name
+            The name of the step, which other steps refer to in `depends_on`.
+        endpoint
+            The Arrow endpoint of the job, such as `v2/embeddings.fastrp`.
+        config
+            The configuration of the job. The graph name is added automatically.
+        depends_on
+            The steps which have to finish before this step is started.
+        mutate_property
+            The node property to which the result of the job is written.
+        mutate_relationship_type
+            The relationship type to which the result of the job is written.
+
+        Returns
+        -------
+        JobScheduler
+            This scheduler, so that steps can be chained.
+        """
+        if name in self._steps:
+            raise ValueError(f"A step named '{name}' already exists.")
+
+        self._steps[name] = JobStep(
+            name,
+            endpoint,
+            dict(config or {}),
+            tuple(depends_on or []),
+            mutate_property,
+            mutate_relationship_type,
+        )
+        return self
+
+    def steps(self) -> list[JobStep]:
+        return list(self._steps.values())
+
+    def run(self, termination_flag: TerminationFlag | None = None) -> dict[str, dict[str, Any]]:
+        """
+        Runs all steps and returns the summary of each step by its name.
+
+        Mutate steps return the summary including the mutation result, as the mutate endpoints do.
+        """
+        self._validate()
+        if termination_flag is None:
+            termination_flag = TerminationFlag.create()
+
+        summaries: dict[str, dict[str, Any]] = {}
+        running: dict[Future[dict[str, Any]], JobStep] = {}
+        job_ids: dict[str, str] = {}
+        pending = dict(self._steps)
+
+        with ThreadPoolExecutor(self._max_concurrent_jobs, thread_name_prefix="gds-job-scheduler") as executor:
+            try:
+                while pending or running:
+                    termination_flag.assert_running()
+
+                    ready = [step for step in pending.values() if all(dep in summaries for dep in step.depends_on)]
+                    for step in ready[: self._max_concurrent_jobs - len(running)]:
+                        del pending[step.name]
+                        running[executor.submit(self._run_step, step, job_ids, termination_flag)] = step
+
+                    done, _ = wait(running, timeout=0.1, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        step = running.pop(future)
+                        summaries[step.name] = future.result()
+            except BaseException:
+                self._cancel_running(running, job_ids)
+                raise
+
+        return summaries
+
+    def _run_step(self, step: JobStep, job_ids: dict[str, str], termination_flag: TerminationFlag) -> dict[str, Any]:
+        config = ConfigConverter.convert_to_gds_config(graph_name=self._graph_name, **step.config)
+        job_id = JobClient.run_job(self._arrow_client, step.endpoint, config)
+        job_ids[step.name] = job_id
+
+        job_status = JobClient().wait_for_job(
+            self._arrow_client, job_id, show_progress=self._show_progress, termination_flag=termination_flag
+        )
+        if job_status.aborted():
+            raise RuntimeError(f"The job '{job_id}' of step '{step.name}' was aborted.")
+
+        if step.mutate_property is not None or step.mutate_relationship_type is not None:
+            return self._mutation_runner.run_mutation(
+                job_id,
+                mutate_property=step.mutate_property,
+                mutate_relationship_type=step.mutate_relationship_type,
+            )
+
+        summary = JobClient.get_summary(self._arrow_client, job_id)
+        if nested_config := summary.get("configuration", None):
+            MutationRunner.drop_write_internals(nested_config)
+        return summary
+
+    def _cancel_running(self, running: dict[Future[dict[str, Any]], JobStep], job_ids: dict[str, str]) -> None:
+        for future, step in running.items():
+            future.cancel()
+            job_id = job_ids.get(step.name)
+            if job_id is None:
+                continue
+            try:
+                JobClient.cancel_job(self._arrow_client, job_id)
+            except Exception as e:
+                self._logger.warning(f"Failed to cancel the job '{job_id}' of step '{step.name}': {e}")
+
+    def _validate(self) -> None:
+        for step in self._steps.values():
+            unknown = [dep for dep in step.depends_on if dep not in self._steps]
+            if unknown:
+                raise ValueError(f"The step '{step.name}' depends on unknown steps {unknown}.")
+
+        # Kahn's algorithm, every step has to become ready eventually
+        finished: set[str] = set()
+        remaining = dict(self._steps)
+        while remaining:
+            ready = [name for name, step in remaining.items() if all(dep in finished for dep in step.depends_on)]
+            if not ready:
+                raise ValueError(f"The dependencies of the steps {sorted(remaining)} form a cycle.")
+            for name in ready:
+                finished.add(name)
+                del remaining[name]
@@ -10,6 +10,7 @@ from graphdatascience.procedure_surface.api.base_result import BaseResult
 from graphdatascience.procedure_surface.api.job_handle import JobHandle
 from graphdatascience.procedure_surface.api.projection_job_handle import ProjectionJobHandle
 from graphdatascience.procedure_surface.api.write_job_handle import WriteJobHandle
+from graphdatascience.procedure_surface.arrow.job_scheduler import DEFAULT_MAX_CONCURRENT_JOBS, JobScheduler
 from graphdatascience.query_runner.termination_flag import TerminationFlag
 from graphdatascience.session.remote_ops.write_protocols import WriteProtocol
 
@@ -92,6 +93,24 @@ class JobsArrowEndpoints:
         rows = deserialize(self._arrow_client.do_action_with_retry(self.LIST_ENDPOINT, {}))
         return [JobInfo(**row) for row in rows]
 
+    def scheduler(self, G: Graph, max_concurrent_jobs: int = DEFAULT_MAX_CONCURRENT_JOBS) -> JobScheduler:
+        """
+        Creates a scheduler for a workflow of dependent jobs on the graph.
+
+        Parameters
+        ----------
+        G
+            Graph object to run the jobs on
+        max_concurrent_jobs
+            The maximum number of jobs running at the same time.
+
+        Returns
+        -------
+        JobScheduler
+            An empty scheduler, to which the steps of the workflow are added.
+        """
+        return JobScheduler(self._arrow_client, G, max_concurrent_jobs, show_progress=self._show_progress)
+
     def _is_projection(self, job_name: str, graph_name: str) -> bool:
         projection_endpoints = [
             "v2/graph.project.fromTables",
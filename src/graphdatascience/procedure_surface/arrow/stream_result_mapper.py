@@ -1,5 +1,7 @@
 from typing import Callable
 
+import numpy
+import pyarrow
 from pandas import DataFrame
 
 
@@ -132,6 +134,107 @@ _STREAM_MAPPERS: dict[str, Callable[[DataFrame], DataFrame | None]] = {
 }
 
 
+def _rename_arrow_columns(result: pyarrow.Table, renames: dict[str, str]) -> pyarrow.Table:
+    return result.rename_columns({old: new for old, new in renames.items() if old in result.column_names})
+
+
+def _drop_arrow_relationship_type(result: pyarrow.Table) -> pyarrow.Table:
+    if "relationshipType" in result.column_names:
+        return result.drop_columns(["relationshipType"])
+    return result
+
+
+def rename_similarity_stream_table(result: pyarrow.Table) -> pyarrow.Table:
+    result = _rename_arrow_columns(result, {"sourceNodeId": "node1", "targetNodeId": "node2"})
+    return _drop_arrow_relationship_type(result)
+
+
+def map_shortest_path_stream_table(result: pyarrow.Table) -> pyarrow.Table:
+    result = _rename_arrow_columns(result, {"sourceNodeId": "sourceNode", "targetNodeId": "targetNode"})
+    result = _drop_arrow_relationship_type(result)
+    return result.append_column("index", pyarrow.array(numpy.arange(result.num_rows, dtype=numpy.int64)))
+
+
+def map_max_flow_stream_table(result: pyarrow.Table) -> pyarrow.Table:
+    result = _rename_arrow_columns(result, {"sourceNodeId": "source", "targetNodeId": "target"})
+    return _drop_arrow_relationship_type(result)
+
+
+def map_topological_sort_stream_table(result: pyarrow.Table) -> pyarrow.Table:
+    return result.sort_by("index").drop_columns(["index"])
+
+
+def aggregate_traversal_rels_from_table(result: pyarrow.Table) -> pyarrow.Table:
+    if result.num_rows == 0:
+        return pyarrow.table(
+            {
+                "sourceNode": pyarrow.array([], pyarrow.int64()),
+                "nodeIds": pyarrow.array([], pyarrow.list_(pyarrow.int64())),
+            }
+        )
+    source_node = result["sourceNodeId"][0]
+    node_ids = result.sort_by("index")["targetNodeId"].combine_chunks()
+
+    return pyarrow.table(
+        {
+            "sourceNode": pyarrow.array([source_node.as_py()], source_node.type),
+            "nodeIds": pyarrow.ListArray.from_arrays(pyarrow.array([0, len(node_ids)], pyarrow.int32()), node_ids),
+        }
+    )
+
+
+def map_steiner_tree_stream_table(result: pyarrow.Table) -> pyarrow.Table:
+    result = _rename_arrow_columns(result, {"sourceNodeId": "nodeId", "targetNodeId": "parentId"})
+    return _drop_arrow_relationship_type(result)
+
+
+def _arrow_column_renamer(renames: dict[str, str]) -> Callable[[pyarrow.Table], pyarrow.Table]:
+    return lambda result: _rename_arrow_columns(result, renames)
+
+
+# Arrow-native counterparts of the mappers above, to map results that are never converted to pandas.
+_ARROW_STREAM_MAPPERS: dict[str, Callable[[pyarrow.Table], pyarrow.Table]] = {
+    "v2/similarity.knn": rename_similarity_stream_table,
+    "v2/similarity.knn.filtered": rename_similarity_stream_table,
+    "v2/similarity.nodeSimilarity": rename_similarity_stream_table,
+    "v2/similarity.nodeSimilarity.filtered": rename_similarity_stream_table,
+    "v2/pathfinding.sourceTarget.dijkstra": map_shortest_path_stream_table,
+    "v2/pathfinding.sourceTarget.aStar": map_shortest_path_stream_table,
+    "v2/pathfinding.sourceTarget.yens": map_shortest_path_stream_table,
+    "v2/pathfinding.singleSource.dijkstra": map_shortest_path_stream_table,
+    "v2/pathfinding.singleSource.deltaStepping": map_shortest_path_stream_table,
+    "v2/pathfinding.singleSource.bellmanFord": map_shortest_path_stream_table,
+    "v2/pathfinding.longestPath": map_shortest_path_stream_table,
+    "v2/pathfinding.topologicalSort": map_topological_sort_stream_table,
+    "v2/pathfinding.maxFlow": map_max_flow_stream_table,
+    "v2/pathfinding.maxFlow.minCost": map_max_flow_stream_table,
+    "v2/pathfinding.allShortestPaths": _drop_arrow_relationship_type,
+    "v2/pathfinding.spanningTree": map_steiner_tree_stream_table,
+    "v2/pathfinding.steinerTree": map_steiner_tree_stream_table,
+    "v2/pathfinding.prizeSteinerTree": map_steiner_tree_stream_table,
+    "v2/pathfinding.bfs": aggregate_traversal_rels_from_table,
+    "v2/pathfinding.dfs": aggregate_traversal_rels_from_table,
+    "v2/community.conductance": _arrow_column_renamer({"communityId": "community"}),
+    "v2/community.sllpa": _arrow_column_renamer({"community": "values"}),
+    "v2/community.cliquecounting": _arrow_column_renamer({"cliqueCount": "counts"}),
+    "v2/graph.nodeProperties.stream": _arrow_column_renamer({"labels": "nodeLabels"}),
+    "v2/graph.nodeProperties.scale": _arrow_column_renamer({"scaledProperties": "scaledProperty"}),
+    "v2/pipeline.linkPrediction.predict": rename_similarity_stream_table,
+}
+
+# Mappers that sort, number or aggregate rows need to see the complete result and cannot be applied per chunk.
+_WHOLE_RESULT_MAPPERS: set[Callable[[DataFrame], DataFrame | None]] = {
+    map_shortest_path_stream_result,
+    map_topological_sort_stream_result,
+    aggregate_traversal_rels_from_result,
+}
+
+
+def supports_chunked_stream(endpoint: str) -> bool:
+    """Whether the stream result of the endpoint can be mapped chunk by chunk."""
+    return _STREAM_MAPPERS.get(endpoint) not in _WHOLE_RESULT_MAPPERS
+
+
 def apply_stream_mapper(endpoint: str, result: DataFrame) -> DataFrame:
     """Apply the endpoint-specific stream result mapper.
 
@@ -142,3 +245,11 @@ def apply_stream_mapper(endpoint: str, result: DataFrame) -> DataFrame:
         return result
     mapped = mapper(result)
     return mapped if mapped is not None else result
+
+
+def apply_arrow_stream_mapper(endpoint: str, result: pyarrow.Table) -> pyarrow.Table:
+    """Apply the endpoint-specific stream result mapper to an Arrow table, yielding the same columns as `apply_stream_mapper`."""
+    mapper = _ARROW_STREAM_MAPPERS.get(endpoint)
+    if mapper is None:
+        return result
+    return mapper(result)
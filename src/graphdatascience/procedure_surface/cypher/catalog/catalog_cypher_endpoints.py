@@ -2,13 +2,12 @@ from __future__ import annotations
 
 from typing import Any, cast
 
-from pandas import DataFrame
-
 from graphdatascience.arrow_client.v1.gds_arrow_client import GdsArrowClient
 from graphdatascience.call_parameters import CallParameters
 from graphdatascience.graph.graph_api import Graph
 from graphdatascience.graph.graph_info import GraphInfo, GraphInfoWithDegrees
 from graphdatascience.graph_construction.arrow_v1_graph_constructor import ArrowV1GraphConstructor
+from graphdatascience.graph_construction.construct_input import ConstructInput, normalize_inputs
 from graphdatascience.graph_construction.cypher_graph_constructor import CypherGraphConstructor
 from graphdatascience.graph_construction.graph_constructor import GraphConstructor
 from graphdatascience.procedure_surface.api.catalog import (
@@ -68,20 +67,13 @@ class CatalogCypherEndpoints(CatalogEndpoints):
     def construct(
         self,
         graph_name: str,
-        nodes: DataFrame | list[DataFrame],
-        relationships: DataFrame | list[DataFrame] | None = None,
+        nodes: ConstructInput | list[ConstructInput],
+        relationships: ConstructInput | list[ConstructInput] | None = None,
         concurrency: int | None = None,
         undirected_relationship_types: list[str] | None = None,
         inverse_indexed_relationship_types: list[str] | None = None,
         batch_size: int = 100000,
     ) -> Graph:
-        if isinstance(nodes, DataFrame):
-            nodes = [nodes]
-        if relationships is None:
-            relationships = []
-        elif isinstance(relationships, DataFrame):
-            relationships = [relationships]
-
         graph_constructor: GraphConstructor
         if self._arrow_client is not None:
             database = require_database(self._cypher_runner)
@@ -104,7 +96,7 @@ class CatalogCypherEndpoints(CatalogEndpoints):
                 inverse_indexed_relationship_types=inverse_indexed_relationship_types,
             )
 
-        graph_constructor.run(node_dfs=nodes, relationship_dfs=relationships)
+        graph_constructor.run(node_dfs=normalize_inputs(nodes), relationship_dfs=normalize_inputs(relationships))
         return get_graph(graph_name, self._cypher_runner)
 
     def list(self, G: Graph | str | None = None) -> list[GraphInfoWithDegrees]:
@@ -12,7 +12,10 @@ from graphdatascience.procedure_surface.api.catalog.node_properties_endpoints im
 from graphdatascience.procedure_surface.api.default_values import ALL_LABELS
 from graphdatascience.procedure_surface.cypher.catalog.utils import require_database
 from graphdatascience.procedure_surface.utils.config_converter import ConfigConverter
-from graphdatascience.procedure_surface.utils.result_utils import join_db_node_properties, transpose_property_columns
+from graphdatascience.procedure_surface.utils.result_utils import (
+    join_db_node_properties,
+    transpose_property_column_chunks,
+)
 from graphdatascience.query_runner.query_mode import QueryMode
 from graphdatascience.query_runner.query_runner import QueryRunner
 
@@ -58,8 +61,8 @@ class NodePropertiesCypherEndpoints(NodePropertiesEndpoints):
                 config=config,
             )
 
-            raw_result = self._query_runner.call_procedure(endpoint="gds.graph.nodeProperties.stream", params=params)
-            result = transpose_property_columns(raw_result, list_node_labels or False)
+            chunks = self._query_runner.call_procedure_chunks(endpoint="gds.graph.nodeProperties.stream", params=params)
+            result = transpose_property_column_chunks(chunks, list_node_labels or False)
 
         if (db_node_properties is not None) and (len(db_node_properties) > 0):
             return join_db_node_properties(result, db_node_properties, self._query_runner)
@@ -1,3 +1,5 @@
+import pandas
+
 from graphdatascience.arrow_client.v1.gds_arrow_client import GdsArrowClient
 from graphdatascience.call_parameters import CallParameters
 from graphdatascience.graph.graph_api import Graph
@@ -15,7 +17,7 @@ from graphdatascience.procedure_surface.api.default_values import ALL_LABELS, AL
 from graphdatascience.procedure_surface.cypher.catalog.utils import require_database
 from graphdatascience.procedure_surface.cypher.collapse_path_cypher_endpoints import CollapsePathCypherEndpoints
 from graphdatascience.procedure_surface.utils.config_converter import ConfigConverter
-from graphdatascience.procedure_surface.utils.result_utils import transpose_relationship_property_columns
+from graphdatascience.procedure_surface.utils.result_utils import transpose_relationship_property_column_chunks
 from graphdatascience.query_runner.query_mode import QueryMode
 from graphdatascience.query_runner.query_runner import QueryRunner
 
@@ -88,12 +90,13 @@ class RelationshipCypherEndpoints(RelationshipsEndpoints):
                     config=config,
                 )
 
-            result = self._query_runner.call_procedure(endpoint=endpoint, params=params)
+            chunks = self._query_runner.call_procedure_chunks(endpoint=endpoint, params=params)
 
             if relationship_properties:
-                result = transpose_relationship_property_columns(result, relationship_properties)
-
-            return RelationshipsDataFrame(result)
+                return RelationshipsDataFrame(
+                    transpose_relationship_property_column_chunks(chunks, relationship_properties)
+                )
+            return RelationshipsDataFrame(pandas.concat(chunks, ignore_index=True))
 
     def write(
         self,
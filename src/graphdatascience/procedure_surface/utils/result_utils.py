@@ -1,7 +1,8 @@
 from functools import reduce
-from typing import Any, cast
+from typing import Any, Iterable, cast
 
-from pandas import DataFrame
+import pandas
+from pandas import DataFrame, Series
 
 from graphdatascience.query_runner.query_mode import QueryMode
 from graphdatascience.query_runner.query_runner import QueryRunner
@@ -43,6 +44,63 @@ def transpose_relationship_property_columns(result: DataFrame, relationship_prop
     return wide_result
 
 
+def transpose_property_column_chunks(chunks: Iterable[DataFrame], list_node_labels: bool) -> DataFrame:
+    """
+    Like `transpose_property_columns`, for a node property stream which arrives in chunks.
+
+    Each chunk is reduced to one value column per property right away, so that the long format with a property name
+    per row is never held for the whole result. The properties of a node may be spread over several chunks.
+    """
+    labels: list[DataFrame] = []
+
+    def with_labels(chunk: DataFrame) -> DataFrame:
+        if list_node_labels:
+            labels.append(chunk[["nodeId", "nodeLabels"]].drop_duplicates(subset=["nodeId"]))
+        return chunk
+
+    wide_result = _transpose_chunks((with_labels(chunk) for chunk in chunks), ["nodeId"], "nodeProperty")
+    if list_node_labels:
+        labels_df = pandas.concat(labels).drop_duplicates(subset=["nodeId"]).set_index("nodeId")
+        wide_result = wide_result.join(labels_df, on="nodeId")
+    wide_result = wide_result.reset_index()
+    wide_result.columns.name = None
+
+    return wide_result
+
+
+def transpose_relationship_property_column_chunks(
+    chunks: Iterable[DataFrame], relationship_properties: list[str]
+) -> DataFrame:
+    """Like `transpose_relationship_property_columns`, for a relationship property stream which arrives in chunks."""
+    if len(relationship_properties) == 1:
+        return transpose_relationship_property_columns(
+            pandas.concat(chunks, ignore_index=True), relationship_properties
+        )
+
+    wide_result = _transpose_chunks(
+        chunks, ["sourceNodeId", "targetNodeId", "relationshipType"], "relationshipProperty"
+    ).reset_index()
+    wide_result.columns.name = None
+
+    return wide_result
+
+
+def _transpose_chunks(chunks: Iterable[DataFrame], index: list[str], property_column: str) -> DataFrame:
+    values: dict[str, list[Series]] = {}
+    for chunk in chunks:
+        for property_name, rows in chunk.groupby(property_column, sort=False):
+            values.setdefault(str(property_name), []).append(rows.set_index(index)["propertyValue"])
+
+    columns = {property_name: pandas.concat(parts) for property_name, parts in sorted(values.items())}
+    if not columns:
+        return DataFrame(columns=index).set_index(index)
+
+    # aligning the property columns on the index outer joins them, as a pivot would
+    wide_result = DataFrame(columns).sort_index()
+    wide_result.index.names = index
+    return wide_result
+
+
 def join_db_node_properties(result: DataFrame, db_node_properties: list[str], query_runner: QueryRunner) -> DataFrame:
     query = _build_query(db_node_properties)
     db_properties_df = query_runner.run_retryable_cypher(
@@ -0,0 +1,613 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from types import TracebackType
+from typing import Any, AsyncIterator, Awaitable, Coroutine, Iterator, TypeVar
+
+import neo4j
+from pandas import DataFrame
+
+from graphdatascience.call_parameters import CallParameters
+from graphdatascience.error.gds_not_installed import GdsNotFound
+from graphdatascience.progress.query_progress_logger import QueryProgressLogger
+from graphdatascience.query_runner.cypher_notifications import NotificationClassifier, install_notification_filters
+from graphdatascience.query_runner.neo4j_query_runner import (
+    CONNECTION_ERRORS,
+    DEFAULT_CONNECTIVITY_TTL,
+    ConnectivityAttempts,
+    ConnectivityCache,
+    ConnectivityStats,
+    Neo4jQueryRunner,
+    db_driver_config,
+    function_call_query,
+    procedure_call_query,
+    server_version_error,
+    wrap_query,
+)
+from graphdatascience.query_runner.query_mode import QueryMode
+from graphdatascience.query_runner.query_runner import DEFAULT_CHUNK_SIZE, QueryRunner
+from graphdatascience.query_runner.query_type import QueryType
+from graphdatascience.query_runner.record_columns import RecordChunker, records_to_pandas
+from graphdatascience.versions import ServerVersion
+
+T = TypeVar("T")
+
+
+class AsyncNeo4jQueryRunner:
+    """
+    Runs the queries of the client through a `neo4j.AsyncDriver`.
+
+    The methods mirror the `QueryRunner` contract as coroutines, so that many procedure calls can run concurrently
+    on one event loop and share the connection pool of a single driver, instead of each blocking a thread.
+
+    The catalog and algorithm Cypher endpoints are synchronous. To use them from an event loop, create them with the
+    `QueryRunner` returned by `blocking()` and call them via `asyncio.to_thread`. Their queries are then still run by
+    the async driver on the event loop.
+
+    Parameters
+    ----------
+    driver
+        The driver to run the queries with.
+    protocol
+        The protocol of the endpoint, such as `neo4j` or `bolt`.
+    connectivity_ttl
+        How many seconds a successful connectivity verification is trusted before it is repeated.
+    """
+
+    @staticmethod
+    def create_for_db(
+        endpoint: str | neo4j.AsyncDriver,
+        auth: tuple[str, str] | neo4j.Auth | None = None,
+        aura_ds: bool = False,
+        database: str | None = None,
+        bookmarks: Any | None = None,
+        show_progress: bool = True,
+        config: dict[str, Any] | None = None,
+    ) -> AsyncNeo4jQueryRunner:
+        if isinstance(endpoint, str):
+            config = db_driver_config(config, aura_ds)
+            driver = neo4j.AsyncGraphDatabase.driver(endpoint, auth=auth, database=database, **config)
+
+            return AsyncNeo4jQueryRunner(
+                driver,
+                Neo4jQueryRunner.parse_protocol(endpoint),
+                auth,
+                auto_close=True,
+                bookmarks=bookmarks,
+                config=config,
+                database=database,
+                show_progress=show_progress,
+            )
+        elif isinstance(endpoint, neo4j.AsyncDriver):
+            protocol = "neo4j+s" if endpoint.encrypted else "bolt"
+            return AsyncNeo4jQueryRunner(
+                endpoint,
+                protocol,
+                auto_close=False,
+                bookmarks=bookmarks,
+                database=database,
+                show_progress=show_progress,
+            )
+        else:
+            raise ValueError(f"Invalid endpoint type: {type(endpoint)}")
+
+    def __init__(
+        self,
+        driver: neo4j.AsyncDriver,
+        protocol: str,
+        auth: tuple[str, str] | neo4j.Auth | None = None,
+        config: dict[str, Any] = {},
+        database: str | None = neo4j.DEFAULT_DATABASE,
+        auto_close: bool = False,
+        bookmarks: Any | None = None,
+        show_progress: bool = True,
+        instance_description: str = "Neo4j DBMS",
+        connectivity_ttl: float = DEFAULT_CONNECTIVITY_TTL,
+    ):
+        self._driver = driver
+        self._protocol = protocol
+        self._auth = auth
+        self._config = config
+        self._auto_close = auto_close
+        self._database = database
+        self._logger = logging.getLogger()
+        self._bookmarks = bookmarks
+        self._last_bookmarks: Any | None = None
+        self._server_version: ServerVersion | None = None
+        self._show_progress = show_progress
+        self._notification_classifier = NotificationClassifier(self._logger)
+        install_notification_filters()
+        self._instance_description = instance_description
+        self._connectivity_ttl = connectivity_ttl
+        self._connectivity = ConnectivityCache(connectivity_ttl)
+
+    async def run_cypher(
+        self,
+        query: str,
+        query_type: QueryType,
+        params: dict[str, Any] | None = None,
+        database: str | None = None,
+        mode: QueryMode | None = None,
+        custom_error: bool = True,
+        connectivity_retry_config: Neo4jQueryRunner.ConnectivityRetriesConfig | None = None,
+    ) -> DataFrame:
+        if params is None:
+            params = {}
+
+        if mode is None:
+            mode = QueryMode.WRITE
+
+        if database is None:
+            database = self._database
+
+        if connectivity_retry_config is None:
+            connectivity_retry_config = Neo4jQueryRunner.ConnectivityRetriesConfig()
+        await self._verify_connectivity(database, connectivity_retry_config)
+
+        try:
+            async with self._driver.session(
+                database=database,
+                bookmarks=self._bookmarks,
+                default_access_mode=mode.neo4j_access_mode(),
+            ) as session:
+                result = await session.run(wrap_query(query, query_type), params)
+
+                df = records_to_pandas(result.keys(), [record async for record in result])
+
+                self._last_bookmarks = await session.last_bookmarks()
+
+                self._notification_classifier.handle(await result.consume())
+
+                return df
+        except CONNECTION_ERRORS:
+            self._connectivity.invalidate(database)
+            raise
+
+    async def run_cypher_chunks(
+        self,
+        query: str,
+        query_type: QueryType,
+        params: dict[str, Any] | None = None,
+        database: str | None = None,
+        mode: QueryMode | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        connectivity_retry_config: Neo4jQueryRunner.ConnectivityRetriesConfig | None = None,
+    ) -> AsyncIterator[DataFrame]:
+        """
+        Yields the result of the query as DataFrames of at most `chunk_size` rows, as the driver fetches them.
+
+        The session stays open until the iterator is exhausted or closed. A query without records yields a single
+        empty DataFrame with the result columns.
+        """
+        if chunk_size < 1:
+            raise ValueError(f"The chunk size must be at least 1, but got {chunk_size}.")
+
+        if params is None:
+            params = {}
+
+        if mode is None:
+            mode = QueryMode.WRITE
+
+        if database is None:
+            database = self._database
+
+        if connectivity_retry_config is None:
+            connectivity_retry_config = Neo4jQueryRunner.ConnectivityRetriesConfig()
+        await self._verify_connectivity(database, connectivity_retry_config)
+
+        try:
+            async with self._driver.session(
+                database=database,
+                bookmarks=self._bookmarks,
+                default_access_mode=mode.neo4j_access_mode(),
+                fetch_size=chunk_size,
+            ) as session:
+                result = await session.run(wrap_query(query, query_type), params)
+
+                chunker = RecordChunker(result.keys())
+                while records := await result.fetch(chunk_size):
+                    yield chunker.chunk(records)
+                if (empty_result := chunker.empty_result()) is not None:
+                    yield empty_result
+
+                self._last_bookmarks = await session.last_bookmarks()
+
+                self._notification_classifier.handle(await result.consume())
+        except CONNECTION_ERRORS:
+            self._connectivity.invalidate(database)
+            raise
+
+    async def run_retryable_cypher(
+        self,
+        query: str,
+        query_type: QueryType,
+        params: dict[str, Any] | None = None,
+        database: str | None = None,
+        mode: QueryMode | None = None,
+        custom_error: bool = True,
+        connectivity_retry_config: Neo4jQueryRunner.ConnectivityRetriesConfig | None = None,
+    ) -> DataFrame:
+        if not database:
+            database = self._database
+
+        if not mode:
+            routing = neo4j.RoutingControl.WRITE
+        else:
+            routing = mode.neo4j_routing()
+
+        try:
+            bookmark_manager = neo4j.AsyncGraphDatabase.bookmark_manager(self._bookmarks)
+
+            result: DataFrame = await self._driver.execute_query(
+                query_=wrap_query(query, query_type),
+                parameters_=params,
+                database_=database,
+                result_transformer_=_result_to_df,
+                bookmark_manager_=bookmark_manager,
+                routing_=routing,
+            )
+
+            self._last_bookmarks = neo4j.Bookmarks.from_raw_values(await bookmark_manager.get_bookmarks())
+
+            return result
+        except CONNECTION_ERRORS:
+            self._connectivity.invalidate(database)
+            raise
+
+    async def call_function(
+        self,
+        endpoint: str,
+        query_type: QueryType = QueryType.USER_TRANSPILED,
+        params: CallParameters | None = None,
+        custom_error: bool = True,
+    ) -> Any:
+        if params is None:
+            params = CallParameters()
+        query = function_call_query(endpoint, params)
+
+        # we can use retryable cypher as we expect all gds functions to be idempotent
+        df = await self.run_retryable_cypher(query, query_type, params, custom_error=custom_error, mode=QueryMode.READ)
+        return df.squeeze()
+
+    async def call_procedure(
+        self,
+        endpoint: str,
+        query_type: QueryType = QueryType.USER_TRANSPILED,
+        params: CallParameters | None = None,
+        yields: list[str] | None = None,
+        database: str | None = None,
+        mode: QueryMode = QueryMode.READ,
+        logging: bool = False,
+        retryable: bool = False,
+        custom_error: bool = True,
+    ) -> DataFrame:
+        """
+        Calls the procedure and returns its result.
+
+        No progress is logged for calls awaited directly, as a progress bar per concurrent call would interleave.
+        Calls through the `QueryRunner` of `blocking()` log their progress as the synchronous query runner does.
+        """
+        if params is None:
+            params = CallParameters()
+        query = procedure_call_query(endpoint, params, yields)
+
+        if retryable:
+            return await self.run_retryable_cypher(
+                query, query_type, params, database, custom_error=custom_error, mode=mode
+            )
+        else:
+            return await self.run_cypher(query, query_type, params, database, custom_error=custom_error)
+
+    def call_procedure_chunks(
+        self,
+        endpoint: str,
+        query_type: QueryType = QueryType.USER_TRANSPILED,
+        params: CallParameters | None = None,
+        yields: list[str] | None = None,
+        database: str | None = None,
+        mode: QueryMode | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> AsyncIterator[DataFrame]:
+        if params is None:
+            params = CallParameters()
+        query = procedure_call_query(endpoint, params, yields)
+
+        return self.run_cypher_chunks(query, query_type, params, database, mode, chunk_size)
+
+    async def server_version(self) -> ServerVersion:
+        if self._server_version:
+            return self._server_version
+
+        try:
+            server_version_string = await self.call_function(
+                "gds.version", query_type=QueryType.SYSTEM, custom_error=False
+            )
+            self._server_version = ServerVersion.from_string(server_version_string)
+            return self._server_version
+        except Exception as e:
+            error = server_version_error(e, self._instance_description)
+            if isinstance(error, GdsNotFound):
+                await self.close()
+
+            raise error
+
+    def set_server_version(self, server_version: ServerVersion) -> None:
+        self._server_version = server_version
+
+    def encrypted(self) -> bool:
+        return self._driver.encrypted
+
+    def driver_config(self) -> dict[str, Any]:
+        return self._config
+
+    def set_database(self, database: str) -> None:
+        self._database = database
+
+    def set_bookmarks(self, bookmarks: Any | None) -> None:
+        self._bookmarks = bookmarks
+
+    def database(self) -> str | None:
+        return self._database
+
+    def bookmarks(self) -> Any | None:
+        return self._bookmarks
+
+    def last_bookmarks(self) -> Any | None:
+        return self._last_bookmarks
+
+    def set_show_progress(self, show_progress: bool) -> None:
+        self._show_progress = show_progress
+
+    def connectivity_stats(self) -> ConnectivityStats:
+        """Counts the connectivity verifications done and skipped before queries, and the connection errors seen."""
+        return self._connectivity.stats()
+
+    async def close(self) -> None:
+        if self._auto_close:
+            await self._driver.close()
+
+    async def __aenter__(self) -> AsyncNeo4jQueryRunner:
+        return self
+
+    async def __aexit__(
+        self,
+        exception_type: type[BaseException] | None,
+        exception_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.close()
+
+    def cloneWithoutRouting(self, host: str, port: int) -> AsyncNeo4jQueryRunner:
+        protocol = self._protocol.replace("neo4j", "bolt")
+        endpoint = "{}://{}:{}".format(protocol, host, port)
+        driver = neo4j.AsyncGraphDatabase.driver(endpoint, auth=self._auth, **self.driver_config())
+
+        return AsyncNeo4jQueryRunner(
+            driver=driver,
+            protocol=protocol,
+            auth=self._auth,
+            config=self._config,
+            database=self._database,
+            auto_close=self._auto_close,
+            bookmarks=self._bookmarks,
+            show_progress=self._show_progress,
+            instance_description=self._instance_description,
+            connectivity_ttl=self._connectivity_ttl,
+        )
+
+    def blocking(self, loop: asyncio.AbstractEventLoop | None = None) -> QueryRunner:
+        """
+        Returns a synchronous `QueryRunner` which runs its queries with this runner on the event loop.
+
+        Its methods must be called from other threads than the one running the event loop, for example via
+        `asyncio.to_thread`, as they wait for the result. Each concurrent endpoint call made this way still holds one
+        thread while it waits, so the concurrency is bounded by the thread pool running the calls rather than by the
+        connection pool of the driver.
+
+        Parameters
+        ----------
+        loop
+            The event loop which runs the driver. Defaults to the running event loop.
+        """
+        return BlockingQueryRunner(self, loop if loop is not None else asyncio.get_running_loop())
+
+    async def _verify_connectivity(
+        self, database: str | None, retry_config: Neo4jQueryRunner.ConnectivityRetriesConfig
+    ) -> None:
+        if self._connectivity.is_verified(database):
+            return
+
+        attempts = ConnectivityAttempts(retry_config, self._logger, self._instance_description)
+        while attempts.next():
+            try:
+                await self._driver.verify_connectivity(database=database)
+            except neo4j.exceptions.DriverError as e:
+                await asyncio.sleep(attempts.failed(e))
+            else:
+                self._connectivity.mark_verified(database)
+                return
+
+
+class BlockingQueryRunner(QueryRunner):
+    """
+    A synchronous `QueryRunner` which runs its queries with an `AsyncNeo4jQueryRunner` on an event loop.
+
+    Every call submits the query to the event loop and waits for its result, so the synchronous Cypher endpoints can
+    be used by worker threads while all queries share the connection pool of the async driver.
+    """
+
+    def __init__(self, async_runner: AsyncNeo4jQueryRunner, loop: asyncio.AbstractEventLoop):
+        self._async_runner = async_runner
+        self._loop = loop
+        self._progress_logger = QueryProgressLogger(self._run_cypher_for_progress_logger)
+
+    def async_runner(self) -> AsyncNeo4jQueryRunner:
+        return self._async_runner
+
+    def call_procedure(
+        self,
+        endpoint: str,
+        query_type: QueryType = QueryType.USER_TRANSPILED,
+        params: CallParameters | None = None,
+        yields: list[str] | None = None,
+        database: str | None = None,
+        mode: QueryMode = QueryMode.READ,
+        logging: bool = False,
+        retryable: bool = False,
+        custom_error: bool = True,
+    ) -> DataFrame:
+        def run_procedure() -> DataFrame:
+            return self._wait(
+                self._async_runner.call_procedure(
+                    endpoint, query_type, params, yields, database, mode, retryable=retryable, custom_error=custom_error
+                )
+            )
+
+        job_id = None if not params else params.get_job_id()
+        if self._resolve_show_progress(logging) and job_id:
+            return self._progress_logger.run_with_progress_logging(run_procedure, job_id, database)
+        else:
+            return run_procedure()
+
+    def call_function(
+        self, endpoint: str, query_type: QueryType = QueryType.USER_TRANSPILED, params: CallParameters | None = None
+    ) -> Any:
+        return self._wait(self._async_runner.call_function(endpoint, query_type, params))
+
+    def run_cypher(
+        self,
+        query: str,
+        query_type: QueryType,
+        params: dict[str, Any] | None = None,
+        database: str | None = None,
+        mode: QueryMode | None = None,
+        custom_error: bool = True,
+    ) -> DataFrame:
+        return self._wait(self._async_runner.run_cypher(query, query_type, params, database, mode, custom_error))
+
+    def run_retryable_cypher(
+        self,
+        query: str,
+        query_type: QueryType,
+        params: dict[str, Any] | None = None,
+        database: str | None = None,
+        mode: QueryMode | None = None,
+        custom_error: bool = True,
+    ) -> DataFrame:
+        return self._wait(
+            self._async_runner.run_retryable_cypher(query, query_type, params, database, mode, custom_error)
+        )
+
+    def run_cypher_chunks(
+        self,
+        query: str,
+        query_type: QueryType,
+        params: dict[str, Any] | None = None,
+        database: str | None = None,
+        mode: QueryMode | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Iterator[DataFrame]:
+        return self._iterate(
+            self._async_runner.run_cypher_chunks(query, query_type, params, database, mode, chunk_size)
+        )
+
+    def call_procedure_chunks(
+        self,
+        endpoint: str,
+        query_type: QueryType = QueryType.USER_TRANSPILED,
+        params: CallParameters | None = None,
+        yields: list[str] | None = None,
+        database: str | None = None,
+        mode: QueryMode | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Iterator[DataFrame]:
+        return self._iterate(
+            self._async_runner.call_procedure_chunks(endpoint, query_type, params, yields, database, mode, chunk_size)
+        )
+
+    def server_version(self) -> ServerVersion:
+        return self._wait(self._async_runner.server_version())
+
+    def set_server_version(self, server_version: ServerVersion) -> None:
+        self._async_runner.set_server_version(server_version)
+
+    def driver_config(self) -> dict[str, Any]:
+        return self._async_runner.driver_config()
+
+    def encrypted(self) -> bool:
+        return self._async_runner.encrypted()
+
+    def set_database(self, database: str) -> None:
+        self._async_runner.set_database(database)
+
+    def set_bookmarks(self, bookmarks: Any | None) -> None:
+        self._async_runner.set_bookmarks(bookmarks)
+
+    def close(self) -> None:
+        self._wait(self._async_runner.close())
+
+    def database(self) -> str | None:
+        return self._async_runner.database()
+
+    def bookmarks(self) -> Any | None:
+        return self._async_runner.bookmarks()
+
+    def last_bookmarks(self) -> Any | None:
+        return self._async_runner.last_bookmarks()
+
+    def set_show_progress(self, show_progress: bool) -> None:
+        self._async_runner.set_show_progress(show_progress)
+
+    def _resolve_show_progress(self, show_progress: bool) -> bool:
+        return self._async_runner._show_progress and show_progress
+
+    def cloneWithoutRouting(self, host: str, port: int) -> QueryRunner:
+        return BlockingQueryRunner(self._async_runner.cloneWithoutRouting(host, port), self._loop)
+
+    def _run_cypher_for_progress_logger(self, query: str, database: str | None) -> DataFrame:
+        # progress logging should not retry a lot as it periodically fetches the latest progress anyway
+        return self._wait(
+            self._async_runner.run_cypher(
+                query,
+                QueryType.USER_TRANSPILED,
+                database=database,
+                connectivity_retry_config=Neo4jQueryRunner.ConnectivityRetriesConfig(max_retries=2),
+            )
+        )
+
+    def _wait(self, awaitable: Awaitable[T]) -> T:
+        if self._on_loop_thread():
+            if isinstance(awaitable, Coroutine):
+                awaitable.close()
+            raise RuntimeError(
+                "The blocking query runner cannot be used on the thread of its event loop, as it would wait for "
+                "itself. Call the endpoint from another thread, for example with `asyncio.to_thread`."
+            )
+        return asyncio.run_coroutine_threadsafe(_await(awaitable), self._loop).result()
+
+    def _iterate(self, chunks: AsyncIterator[DataFrame]) -> Iterator[DataFrame]:
+        try:
+            while True:
+                try:
+                    yield self._wait(anext(chunks))
+                except StopAsyncIteration:
+                    return
+        finally:
+            aclose = getattr(chunks, "aclose", None)
+            if aclose is not None:
+                self._wait(aclose())
+
+    def _on_loop_thread(self) -> bool:
+        try:
+            return asyncio.get_running_loop() is self._loop
+        except RuntimeError:
+            return False
+
+
+async def _await(awaitable: Awaitable[T]) -> T:
+    return await awaitable
+
+
+async def _result_to_df(result: neo4j.AsyncResult) -> DataFrame:
+    return records_to_pandas(result.keys(), [record async for record in result])
@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Generator, Iterable
+
+from pandas import DataFrame
+
+from graphdatascience.call_parameters import CallParameters
+from graphdatascience.progress.progress_bar import NoOpProgressBar, ProgressBar, TqdmProgressBar
+from graphdatascience.query_runner.query_mode import QueryMode
+from graphdatascience.query_runner.query_type import QueryType
+
+if TYPE_CHECKING:
+    from graphdatascience.query_runner.query_runner import QueryRunner
+
+DEFAULT_MAX_CONCURRENT_CALLS = 8
+
+
+@dataclass(frozen=True)
+class BulkCallResult:
+    """
+    The outcome of one procedure call of a bulk execution.
+
+    Attributes
+    ----------
+    index
+        The position of the parameters in the list passed to the executor.
+    params
+        The parameters of the call.
+    result
+        The result of the call, or None if it failed.
+    error
+        The error raised by the call, or None if it succeeded.
+    """
+
+    index: int
+    params: CallParameters
+    result: DataFrame | None = None
+    error: Exception | None = None
+
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class BulkProcedureExecutor:
+    """
+    Calls the same procedure with many parameter sets, running a bounded number of calls at once.
+
+    Each call runs `call_procedure` of the query runner on a worker thread, so the calls share the connection pool of
+    the driver. A failing call does not stop the others, its error is reported in its `BulkCallResult`. Parameter sets
+    are only submitted as workers become free, so long lists do not queue up all calls at once.
+
+    Parameters
+    ----------
+    query_runner
+        The query runner to call the procedure with.
+    max_concurrent_calls
+        The maximum number of calls running at the same time. It should not exceed the connection pool size of the
+        driver, as further calls would wait for a connection.
+    show_progress
+        Whether to show one progress bar over all calls. No progress is shown while the query runner has showing
+        progress disabled, just as for single procedure calls.
+    """
+
+    def __init__(
+        self,
+        query_runner: QueryRunner,
+        max_concurrent_calls: int = DEFAULT_MAX_CONCURRENT_CALLS,
+        show_progress: bool = True,
+    ):
+        if max_concurrent_calls < 1:
+            raise ValueError(f"The number of concurrent calls must be at least 1, but got {max_concurrent_calls}.")
+
+        self._query_runner = query_runner
+        self._max_concurrent_calls = max_concurrent_calls
+        self._show_progress = show_progress
+
+    def run(
+        self,
+        endpoint: str,
+        params: Iterable[CallParameters],
+        query_type: QueryType = QueryType.USER_TRANSPILED,
+        yields: list[str] | None = None,
+        database: str | None = None,
+        mode: QueryMode = QueryMode.READ,
+        retryable: bool = False,
+        ordered: bool = True,
+    ) -> Generator[BulkCallResult, None, None]:
+        """
+        Calls the procedure once per parameter set and yields the results.
+
+        Parameters
+        ----------
+        endpoint
+            The procedure to call, such as `gds.shortestPath.dijkstra.stream`.
+        params
+            The parameters of each call.
+        ordered
+            Whether to yield the results in the order of the parameters. Otherwise, they are yielded as the calls
+            complete. In order, at most `2 * max_concurrent_calls` results are buffered behind a slow call.
+
+        Returns
+        -------
+        Generator[BulkCallResult, None, None]
+            One result per parameter set. Closing the iterator early cancels the calls which did not start yet.
+        """
+        param_list = list(params)
+        window = 2 * self._max_concurrent_calls
+
+        def call(index: int, call_params: CallParameters) -> BulkCallResult:
+            try:
+                result = self._query_runner.call_procedure(
+                    endpoint, query_type, call_params, yields, database, mode, retryable=retryable
+                )
+                return BulkCallResult(index, call_params, result=result)
+            except Exception as e:
+                return BulkCallResult(index, call_params, error=e)
+
+        progress_bar = self._progress_bar(endpoint, len(param_list))
+        executor = ThreadPoolExecutor(self._max_concurrent_calls, thread_name_prefix="gds-bulk-call")
+        pending: set[Future[BulkCallResult]] = set()
+        completed: dict[int, BulkCallResult] = {}
+        submitted = 0
+        yielded = 0
+        failed = 0
+        success = False
+        try:
+            while yielded < len(param_list):
+                # in order, the results buffered behind a slow call count towards the window as well
+                while submitted < len(param_list) and submitted - yielded < window:
+                    pending.add(executor.submit(call, submitted, param_list[submitted]))
+                    submitted += 1
+
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    result = future.result()
+                    failed += not result.ok()
+                    completed[result.index] = result
+
+                finished = submitted - len(pending)
+                progress_bar.update(
+                    "RUNNING", 100 * finished / len(param_list), f"{failed} of {finished} failed" if failed else None
+                )
+
+                if ordered:
+                    while yielded in completed:
+                        yield completed.pop(yielded)
+                        yielded += 1
+                else:
+                    for index in list(completed):
+                        yield completed.pop(index)
+                        yielded += 1
+            success = True
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+            progress_bar.finish(success)
+
+    def _progress_bar(self, endpoint: str, num_calls: int) -> ProgressBar:
+        if not self._query_runner._resolve_show_progress(self._show_progress) or num_calls == 0:
+            return NoOpProgressBar()
+        return TqdmProgressBar(f"{endpoint} ({num_calls} calls)", 0.0)
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import logging
+import re
+import threading
+import warnings
+from typing import Any
+
+import neo4j
+
+from graphdatascience.versions import SemanticVersion
+
+_NEO4J_DRIVER_VERSION = SemanticVersion.from_string(neo4j.__version__)
+
+# the client does not expose YIELD fields, so deprecations of procedure fields are not actionable for users
+_DEPRECATED_FIELD_STATUS = re.compile(r"(.*returned by the procedure.*)|(.*procedure field deprecated.*)")
+
+_IGNORED_WARNING_MESSAGES = [
+    r"^pandas support is experimental and might be changed or removed in future versions$",
+    # neo4j 2025.04
+    r".*The procedure has a deprecated field.*by 'gds.*",
+    # neo4j driver 6.0
+    r".*returned by the procedure.* is deprecated.*",
+    r".*procedure field deprecated..*",
+]
+
+_install_lock = threading.Lock()
+_installed_on: object | None = None
+
+
+def install_notification_filters() -> None:
+    """
+    Silences the driver notifications and warnings about deprecated GDS procedure fields.
+
+    The filters are installed once per process. They are only installed again if `warnings.filters` was replaced,
+    as `warnings.catch_warnings` does, so that repeated calls never grow the filter lists.
+    """
+    global _installed_on
+
+    if _installed_on is warnings.filters:
+        return
+
+    with _install_lock:
+        if _installed_on is warnings.filters:
+            return
+
+        # adding the same filter function again is a no-op for a logger
+        logging.getLogger("neo4j.notifications").addFilter(_drop_deprecated_gds_field_notification)
+        for message in _IGNORED_WARNING_MESSAGES:
+            warnings.filterwarnings("ignore", message=message)
+        _installed_on = warnings.filters
+
+
+def _drop_deprecated_gds_field_notification(record: logging.LogRecord) -> bool:
+    message = str(record.msg)
+    if "The query used a deprecated field from a procedure" in message and "by 'gds." in message:
+        return False
+    return not ("The procedure has a deprecated field" in message and "gds." in message)
+
+
+class NotificationClassifier:
+    """Turns the notifications of a query summary into Python warnings and log records."""
+
+    def __init__(self, logger: logging.Logger):
+        self._logger = logger
+        self._uses_gql_status = _NEO4J_DRIVER_VERSION >= SemanticVersion(6, 0, 0)
+
+    def handle(self, result_summary: neo4j.ResultSummary) -> None:
+        if self._uses_gql_status:
+            for status in result_summary.gql_status_objects:
+                if status.raw_classification == "DEPRECATION" and not _DEPRECATED_FIELD_STATUS.match(
+                    status.status_description
+                ):
+                    warnings.warn(DeprecationWarning(status.status_description))
+        elif notifications := result_summary.notifications:
+            for notification in notifications:
+                self._forward(notification)
+
+    def _forward(self, notification: dict[str, Any]) -> None:
+        # (see https://neo4j.com/docs/status-codes/current/notifications/ for more details)
+        severity = notification["severity"]
+        if severity == "WARNING":
+            description = notification["description"]
+            if "deprecated field" in description and "procedure" in description:
+                # the client does not expose YIELD fields so we just skip these warnings for now
+                return
+
+            if "deprecated" in description:
+                warning: Warning = DeprecationWarning(description)
+            else:
+                warning = RuntimeWarning(description)
+            warnings.warn(warning)
+        elif severity == "INFORMATION":
+            self._logger.info(notification)
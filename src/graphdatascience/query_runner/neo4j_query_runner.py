@@ -2,9 +2,12 @@ from __future__ import annotations
 
 import logging
 import re
+import threading
 import time
 import warnings
-from typing import Any, NamedTuple
+from contextlib import contextmanager
+from dataclasses import dataclass, replace
+from typing import Any, Iterator, NamedTuple
 
 import neo4j
 from pandas import DataFrame
@@ -14,13 +17,61 @@ from graphdatascience.call_parameters import CallParameters
 from graphdatascience.error.gds_not_installed import GdsNotFound
 from graphdatascience.error.unable_to_connect import UnableToConnectError
 from graphdatascience.progress.query_progress_logger import QueryProgressLogger
+from graphdatascience.query_runner.cypher_notifications import NotificationClassifier, install_notification_filters
 from graphdatascience.query_runner.query_mode import QueryMode
-from graphdatascience.query_runner.query_runner import QueryRunner
+from graphdatascience.query_runner.query_runner import DEFAULT_CHUNK_SIZE, QueryRunner
 from graphdatascience.query_runner.query_type import QueryType
+from graphdatascience.query_runner.record_columns import RecordChunker, records_to_pandas
 from graphdatascience.retry_utils.neo4j_retry_helper import is_retryable_neo4j_exception
 from graphdatascience.version import __version__
 from graphdatascience.versions import SemanticVersion, ServerVersion
 
+DEFAULT_CONNECTIVITY_TTL = 60.0
+
+# errors after which the connectivity is verified again before the next query
+CONNECTION_ERRORS = (neo4j.exceptions.ServiceUnavailable, neo4j.exceptions.SessionExpired)
+
+
+@dataclass(frozen=True)
+class ConnectivityStats:
+    """How often the connectivity was verified before a query, and how often a recent verification was reused."""
+
+    verifications: int = 0
+    skipped_verifications: int = 0
+    connection_errors: int = 0
+
+
+class ConnectivityCache:
+    """Remembers per database when the connectivity was last verified, so that queries can skip the verification."""
+
+    def __init__(self, ttl: float):
+        self._ttl = ttl
+        self._lock = threading.Lock()
+        self._verified_at: dict[str | None, float] = {}
+        self._stats = ConnectivityStats()
+
+    def is_verified(self, database: str | None) -> bool:
+        with self._lock:
+            verified_at = self._verified_at.get(database)
+            if verified_at is None or time.monotonic() - verified_at >= self._ttl:
+                return False
+            self._stats = replace(self._stats, skipped_verifications=self._stats.skipped_verifications + 1)
+            return True
+
+    def mark_verified(self, database: str | None) -> None:
+        with self._lock:
+            self._verified_at[database] = time.monotonic()
+            self._stats = replace(self._stats, verifications=self._stats.verifications + 1)
+
+    def invalidate(self, database: str | None) -> None:
+        with self._lock:
+            self._verified_at.pop(database, None)
+            self._stats = replace(self._stats, connection_errors=self._stats.connection_errors + 1)
+
+    def stats(self) -> ConnectivityStats:
+        with self._lock:
+            return self._stats
+
 
 class Neo4jQueryRunner(QueryRunner):
     _AURA_DS_PROTOCOL = "neo4j+s"
@@ -38,14 +89,7 @@ class Neo4jQueryRunner(QueryRunner):
         config: dict[str, Any] | None = None,
     ) -> Neo4jQueryRunner:
         if isinstance(endpoint, str):
-            if config is None:
-                config = {}
-
-            config["user_agent"] = f"neo4j-graphdatascience-v{__version__}"
-
-            if aura_ds:
-                Neo4jQueryRunner._configure_aura(config)
-
+            config = db_driver_config(config, aura_ds)
             driver = neo4j.GraphDatabase.driver(endpoint, auth=auth, database=database, **config)
 
             query_runner = Neo4jQueryRunner(
@@ -128,7 +172,16 @@ class Neo4jQueryRunner(QueryRunner):
         bookmarks: Any | None = None,
         show_progress: bool = True,
         instance_description: str = "Neo4j DBMS",
+        connectivity_ttl: float = DEFAULT_CONNECTIVITY_TTL,
     ):
+        """
+        Parameters
+        ----------
+        connectivity_ttl
+            How many seconds a successful connectivity verification is trusted before it is repeated. Until then,
+            queries skip the verification unless a query failed with a connection error. Use 0 to verify before
+            every query.
+        """
         self._driver = driver
         self._protocol = protocol
         self._auth = auth
@@ -140,8 +193,12 @@ class Neo4jQueryRunner(QueryRunner):
         self._last_bookmarks: Any | None = None
         self._server_version: ServerVersion | None = None
         self._show_progress = show_progress
+        self._notification_classifier = NotificationClassifier(self._logger)
+        install_notification_filters()
         self._progress_logger = QueryProgressLogger(self.__run_cypher_simplified_for_query_progress_logger)
         self._instance_description = instance_description
+        self._connectivity_ttl = connectivity_ttl
+        self._connectivity = ConnectivityCache(connectivity_ttl)
 
     def __run_cypher_simplified_for_query_progress_logger(self, query: str, database: str | None) -> DataFrame:
         # progress logging should not retry a lot as it perodically fetches the latest progress anyway
@@ -184,27 +241,80 @@ class Neo4jQueryRunner(QueryRunner):
             connectivity_retry_config = Neo4jQueryRunner.ConnectivityRetriesConfig()
         self._verify_connectivity(database=database, retry_config=connectivity_retry_config)
 
-        with self._driver.session(
-            database=database,
-            bookmarks=self.bookmarks(),
-            default_access_mode=mode.neo4j_access_mode(),
-        ) as session:
-            try:
-                result = session.run(self._wrap_query(query, query_type), params)
-            except Exception as e:
-                raise e
-
-            self.__configure_warnings_filter()
+        with (
+            self._invalidate_connectivity_on_error(database),
+            self._driver.session(
+                database=database,
+                bookmarks=self.bookmarks(),
+                default_access_mode=mode.neo4j_access_mode(),
+            ) as session,
+        ):
+            result = session.run(wrap_query(query, query_type), params)
 
-            df = result.to_df()
+            df = records_to_pandas(result.keys(), result)
 
             self._last_bookmarks = session.last_bookmarks()
 
             result_summary = result.consume()
-            self._handle_notifications(result_summary)
+            self._notification_classifier.handle(result_summary)
 
             return df
 
+    def run_cypher_chunks(
+        self,
+        query: str,
+        query_type: QueryType,
+        params: dict[str, Any] | None = None,
+        database: str | None = None,
+        mode: QueryMode | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        connectivity_retry_config: ConnectivityRetriesConfig | None = None,
+    ) -> Iterator[DataFrame]:
+        """
+        Yields the result of the query as DataFrames of at most `chunk_size` rows, as the driver fetches them.
+
+        Records are pulled from the server `chunk_size` at a time, so the full result is never held as records.
+        The session stays open until the iterator is exhausted or closed. A query without records yields a single
+        empty DataFrame with the result columns.
+        """
+        if chunk_size < 1:
+            raise ValueError(f"The chunk size must be at least 1, but got {chunk_size}.")
+
+        if params is None:
+            params = {}
+
+        if mode is None:
+            mode = QueryMode.WRITE
+
+        if database is None:
+            database = self._database
+
+        if connectivity_retry_config is None:
+            connectivity_retry_config = Neo4jQueryRunner.ConnectivityRetriesConfig()
+        self._verify_connectivity(database=database, retry_config=connectivity_retry_config)
+
+        with (
+            self._invalidate_connectivity_on_error(database),
+            self._driver.session(
+                database=database,
+                bookmarks=self.bookmarks(),
+                default_access_mode=mode.neo4j_access_mode(),
+                fetch_size=chunk_size,
+            ) as session,
+        ):
+            result = session.run(wrap_query(query, query_type), params)
+
+            chunker = RecordChunker(result.keys())
+            while records := result.fetch(chunk_size):
+                yield chunker.chunk(records)
+            if (empty_result := chunker.empty_result()) is not None:
+                yield empty_result
+
+            self._last_bookmarks = session.last_bookmarks()
+
+            result_summary = result.consume()
+            self._notification_classifier.handle(result_summary)
+
     # better retry mechanism than run_cypher. The neo4j driver handles retryable errors internally
     def run_retryable_cypher(
         self,
@@ -228,10 +338,10 @@ class Neo4jQueryRunner(QueryRunner):
             bookmark_manager = neo4j.GraphDatabase.bookmark_manager(self.bookmarks())
 
             result = self._driver.execute_query(
-                query_=self._wrap_query(query, query_type),
+                query_=wrap_query(query, query_type),
                 parameters_=params,
                 database_=database,
-                result_transformer_=neo4j.Result.to_df,
+                result_transformer_=_result_to_df,
                 bookmark_manager_=bookmark_manager,
                 routing_=routing,
             )
@@ -239,6 +349,9 @@ class Neo4jQueryRunner(QueryRunner):
             self._last_bookmarks = neo4j.Bookmarks.from_raw_values(bookmark_manager.get_bookmarks())
 
             return result
+        except CONNECTION_ERRORS:
+            self._invalidate_connectivity(database)
+            raise
         except Exception as e:
             raise e
 
@@ -251,7 +364,7 @@ class Neo4jQueryRunner(QueryRunner):
     ) -> Any:
         if params is None:
             params = CallParameters()
-        query = f"RETURN {endpoint}({params.placeholder_str()})"
+        query = function_call_query(endpoint, params)
 
         # we can use retryable cypher as we expect all gds functions to be idempotent
         return self.run_retryable_cypher(
@@ -272,9 +385,7 @@ class Neo4jQueryRunner(QueryRunner):
     ) -> DataFrame:
         if params is None:
             params = CallParameters()
-
-        yields_clause = "" if yields is None else " YIELD " + ", ".join(yields)
-        query = f"CALL {endpoint}({params.placeholder_str()}){yields_clause}"
+        query = procedure_call_query(endpoint, params, yields)
 
         def run_cypher_query() -> DataFrame:
             if retryable:
@@ -290,6 +401,24 @@ class Neo4jQueryRunner(QueryRunner):
         else:
             return run_cypher_query()
 
+    def call_procedure_chunks(
+        self,
+        endpoint: str,
+        query_type: QueryType = QueryType.USER_TRANSPILED,
+        params: CallParameters | None = None,
+        yields: list[str] | None = None,
+        database: str | None = None,
+        mode: QueryMode | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Iterator[DataFrame]:
+        # like `call_procedure`, the session defaults to write access, which routes the call to the cluster member
+        # holding the in-memory graph
+        if params is None:
+            params = CallParameters()
+        query = procedure_call_query(endpoint, params, yields)
+
+        return self.run_cypher_chunks(query, query_type, params, database, mode, chunk_size)
+
     def _resolve_show_progress(self, show_progress: bool) -> bool:
         return self._show_progress and show_progress
 
@@ -303,18 +432,13 @@ class Neo4jQueryRunner(QueryRunner):
             self._server_version = server_version
             return server_version
         except Exception as e:
-            if "Unknown function 'gds.version'" in str(e):
+            error = server_version_error(e, self._instance_description)
+            if isinstance(error, GdsNotFound):
                 # Some Python versions appear to not call __del__ of self._query_runner when an exception
                 # is raised, so we have to close the driver manually.
                 self.close()
 
-                raise GdsNotFound(
-                    f"""The Graph Data Science library is not correctly installed on the {self._instance_description}.
-                    Please refer to https://neo4j.com/docs/graph-data-science/current/installation/.
-                    """
-                )
-
-            raise UnableToConnectError(e)
+            raise error
 
     def encrypted(self) -> bool:
         return self._driver.encrypted
@@ -322,36 +446,6 @@ class Neo4jQueryRunner(QueryRunner):
     def driver_config(self) -> dict[str, Any]:
         return self._config
 
-    def _handle_notifications(self, result_summary: neo4j.ResultSummary) -> None:
-        if self._NEO4J_DRIVER_VERSION < SemanticVersion(6, 0, 0):
-            notifications = result_summary.notifications
-            if notifications:
-                for notification in notifications:
-                    self._forward_cypher_notification(notification)
-        if self._NEO4J_DRIVER_VERSION >= SemanticVersion(6, 0, 0):
-            status_objects = result_summary.gql_status_objects
-            for status in status_objects:
-                if status.raw_classification == "DEPRECATION" and not re.match(
-                    r"(.*returned by the procedure.*)|(.*procedure field deprecated.*)", status.status_description
-                ):
-                    warnings.warn(DeprecationWarning(status.status_description))
-
-    def _forward_cypher_notification(self, notification: dict[str, Any]) -> None:
-        # (see https://neo4j.com/docs/status-codes/current/notifications/ for more details)
-        severity = notification["severity"]
-        if severity == "WARNING":
-            if "deprecated field" in notification["description"] and "procedure" in notification["description"]:
-                # the client does not expose YIELD fields so we just skip these warnings for now
-                return
-
-            if "deprecated" in notification["description"]:
-                warning: Warning = DeprecationWarning(notification["description"])
-            else:
-                warning = RuntimeWarning(notification["description"])
-            warnings.warn(warning)
-        elif severity == "INFORMATION":
-            self._logger.info(notification)
-
     def set_database(self, database: str) -> None:
         self._database = database
 
@@ -393,6 +487,7 @@ class Neo4jQueryRunner(QueryRunner):
             bookmarks=self._bookmarks,
             show_progress=self._show_progress,
             instance_description=self._instance_description,
+            connectivity_ttl=self._connectivity_ttl,
         )
 
     @retry(retry=retry_if_exception(is_retryable_neo4j_exception), stop=stop_after_delay(60), wait=wait_fixed(2))
@@ -403,6 +498,10 @@ class Neo4jQueryRunner(QueryRunner):
     def verify_authentication(self) -> None:
         self._driver.verify_authentication()
 
+    def connectivity_stats(self) -> ConnectivityStats:
+        """Counts the connectivity verifications done and skipped before queries, and the connection errors seen."""
+        return self._connectivity.stats()
+
     def _verify_connectivity(
         self, database: str | None, retry_config: Neo4jQueryRunner.ConnectivityRetriesConfig
     ) -> None:
@@ -410,69 +509,131 @@ class Neo4jQueryRunner(QueryRunner):
         if database is None:
             database = self._database
 
-        exception = None
-        retrys = 0
-        while retrys < retry_config.max_retries:
-            try:
-                if self._NEO4J_DRIVER_VERSION < SemanticVersion(6, 0, 0):
-                    warnings.filterwarnings(
-                        "ignore",
-                        category=neo4j.ExperimentalWarning,
-                        message=(
-                            r"^All configuration key-word arguments to verify_connectivity\(\) are experimental. "
-                            "They might be changed or removed in any future version without prior notice.$"
-                        ),
-                    )
-                else:
-                    warnings.filterwarnings(
-                        "ignore",
-                        category=neo4j.warnings.PreviewWarning,  # type: ignore[attr-defined]
-                        message=(r"^Passing key-word arguments to verify_connectivity\(\) is a preview feature.*"),
-                    )
+        if self._connectivity.is_verified(database):
+            return
 
+        attempts = ConnectivityAttempts(retry_config, self._logger, self._instance_description)
+        while attempts.next():
+            try:
                 self._driver.verify_connectivity(database=database)
-                break
             except neo4j.exceptions.DriverError as e:
-                exception = e
-                if retrys % retry_config.warn_interval == 0:
-                    self._logger.warning(f"Unable to connect to the {self._instance_description}. Trying again...")
+                time.sleep(attempts.failed(e))
+            else:
+                self._connectivity.mark_verified(database)
+                return
+
+    @contextmanager
+    def _invalidate_connectivity_on_error(self, database: str | None) -> Iterator[None]:
+        try:
+            yield
+        except CONNECTION_ERRORS:
+            self._invalidate_connectivity(database)
+            raise
 
-                time.sleep(retry_config.wait_time)
-                retrys += 1
+    def _invalidate_connectivity(self, database: str | None) -> None:
+        self._connectivity.invalidate(database)
 
-                continue
+    class ConnectivityRetriesConfig(NamedTuple):
+        max_retries: int = 600
+        wait_time: int = 1
+        warn_interval: int = 10
 
-        if retrys == retry_config.max_retries:
-            raise UnableToConnectError(f"Unable to connect to the {self._instance_description}") from exception
 
-    def __configure_warnings_filter(self) -> None:
-        notifications_logger = logging.getLogger("neo4j.notifications")
-        # the client does not expose YIELD fields so we just skip these warnings for now
-        notifications_logger.addFilter(
-            lambda record: (
-                "The query used a deprecated field from a procedure" in record.msg and "by 'gds." in record.msg
-            )
-        )
-        notifications_logger.addFilter(
-            lambda record: "The procedure has a deprecated field" in record.msg and "gds." in record.msg
+def _result_to_df(result: neo4j.Result) -> DataFrame:
+    return records_to_pandas(result.keys(), result)
+
+
+# The helpers below hold the logic shared by the synchronous and the async query runner, which only differ in the
+# driver I/O.
+
+
+def db_driver_config(config: dict[str, Any] | None, aura_ds: bool) -> dict[str, Any]:
+    if config is None:
+        config = {}
+
+    config["user_agent"] = f"neo4j-graphdatascience-v{__version__}"
+
+    if aura_ds:
+        Neo4jQueryRunner._configure_aura(config)
+
+    return config
+
+
+def wrap_query(query: str, query_type: QueryType) -> neo4j.Query:
+    return neo4j.Query(
+        text=query,  # type: ignore[assignment]
+        metadata={"app": f"gds-v{__version__}", "type": query_type.value},
+    )
+
+
+def procedure_call_query(endpoint: str, params: CallParameters, yields: list[str] | None) -> str:
+    yields_clause = "" if yields is None else " YIELD " + ", ".join(yields)
+    return f"CALL {endpoint}({params.placeholder_str()}){yields_clause}"
+
+
+def function_call_query(endpoint: str, params: CallParameters) -> str:
+    return f"RETURN {endpoint}({params.placeholder_str()})"
+
+
+def server_version_error(error: Exception, instance_description: str) -> GdsNotFound | UnableToConnectError:
+    """Translates the error of calling `gds.version` to the error to raise. The driver should be closed for GdsNotFound."""
+    if "Unknown function 'gds.version'" in str(error):
+        return GdsNotFound(
+            f"""The Graph Data Science library is not correctly installed on the {instance_description}.
+                    Please refer to https://neo4j.com/docs/graph-data-science/current/installation/.
+                    """
         )
+
+    return UnableToConnectError(error)
+
+
+class ConnectivityAttempts:
+    """Counts the attempts to verify the connectivity. The runners only differ in how they call the driver and wait."""
+
+    def __init__(
+        self,
+        retry_config: Neo4jQueryRunner.ConnectivityRetriesConfig,
+        logger: logging.Logger,
+        instance_description: str,
+    ):
+        self._retry_config = retry_config
+        self._logger = logger
+        self._instance_description = instance_description
+        self._retries = 0
+        self._error: Exception | None = None
+
+    def next(self) -> bool:
+        """Prepares the next attempt. Raises an `UnableToConnectError` once all retries failed."""
+        if self._retries >= self._retry_config.max_retries:
+            raise UnableToConnectError(f"Unable to connect to the {self._instance_description}") from self._error
+
+        ignore_verify_connectivity_warnings()
+        return True
+
+    def failed(self, error: Exception) -> float:
+        """Records a failed attempt and returns the seconds to wait before the next one."""
+        self._error = error
+        if self._retries % self._retry_config.warn_interval == 0:
+            self._logger.warning(f"Unable to connect to the {self._instance_description}. Trying again...")
+        self._retries += 1
+
+        return self._retry_config.wait_time
+
+
+def ignore_verify_connectivity_warnings() -> None:
+    # passing the database to verify_connectivity is not yet a stable feature of the driver
+    if Neo4jQueryRunner._NEO4J_DRIVER_VERSION < SemanticVersion(6, 0, 0):
         warnings.filterwarnings(
             "ignore",
-            message=r"^pandas support is experimental and might be changed or removed in future versions$",
+            category=neo4j.ExperimentalWarning,
+            message=(
+                r"^All configuration key-word arguments to verify_connectivity\(\) are experimental. "
+                "They might be changed or removed in any future version without prior notice.$"
+            ),
         )
-        # neo4j 2025.04
-        warnings.filterwarnings("ignore", message=r".*The procedure has a deprecated field.*by 'gds.*")
-        # neo4j driver 6.0
-        warnings.filterwarnings("ignore", message=r".*returned by the procedure.* is deprecated.*")
-        warnings.filterwarnings("ignore", message=r".*procedure field deprecated..*")
-
-    def _wrap_query(self, query: str, query_type: QueryType) -> neo4j.Query:
-        return neo4j.Query(
-            text=query,  # type: ignore[assignment]
-            metadata={"app": f"gds-v{__version__}", "type": query_type.value},
+    else:
+        warnings.filterwarnings(
+            "ignore",
+            category=neo4j.warnings.PreviewWarning,  # type: ignore[attr-defined]
+            message=(r"^Passing key-word arguments to verify_connectivity\(\) is a preview feature.*"),
         )
-
-    class ConnectivityRetriesConfig(NamedTuple):
-        max_retries: int = 600
-        wait_time: int = 1
-        warn_interval: int = 10
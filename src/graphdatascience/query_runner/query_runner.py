@@ -1,13 +1,20 @@
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, Generator, Iterable, Iterator
 
 from pandas import DataFrame
 
 from graphdatascience.call_parameters import CallParameters
+from graphdatascience.query_runner.bulk_procedure_executor import (
+    DEFAULT_MAX_CONCURRENT_CALLS,
+    BulkCallResult,
+    BulkProcedureExecutor,
+)
 from graphdatascience.query_runner.query_mode import QueryMode
 from graphdatascience.query_runner.query_type import QueryType
 from graphdatascience.versions import ServerVersion
 
+DEFAULT_CHUNK_SIZE = 10_000
+
 
 class QueryRunner(ABC):
     @abstractmethod
@@ -55,6 +62,64 @@ class QueryRunner(ABC):
     ) -> DataFrame:
         pass
 
+    def run_cypher_chunks(
+        self,
+        query: str,
+        query_type: QueryType,
+        params: dict[str, Any] | None = None,
+        database: str | None = None,
+        mode: QueryMode | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Iterator[DataFrame]:
+        """
+        Yields the result of the query as DataFrames of at most `chunk_size` rows.
+
+        Query runners which cannot stream the result yield it as a single DataFrame.
+        """
+        yield self.run_cypher(query, query_type, params, database, mode)
+
+    def call_procedure_chunks(
+        self,
+        endpoint: str,
+        query_type: QueryType = QueryType.USER_TRANSPILED,
+        params: CallParameters | None = None,
+        yields: list[str] | None = None,
+        database: str | None = None,
+        mode: QueryMode | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> Iterator[DataFrame]:
+        """
+        Like `call_procedure`, but yields the result in chunks as `run_cypher_chunks` does.
+
+        Without a `mode`, the procedure runs with the same access mode as a call of `call_procedure` without one.
+        """
+        if mode is None:
+            yield self.call_procedure(endpoint, query_type, params, yields, database)
+        else:
+            yield self.call_procedure(endpoint, query_type, params, yields, database, mode)
+
+    def call_procedure_bulk(
+        self,
+        endpoint: str,
+        params: Iterable[CallParameters],
+        query_type: QueryType = QueryType.USER_TRANSPILED,
+        yields: list[str] | None = None,
+        database: str | None = None,
+        mode: QueryMode = QueryMode.READ,
+        retryable: bool = False,
+        ordered: bool = True,
+        max_concurrent_calls: int = DEFAULT_MAX_CONCURRENT_CALLS,
+        show_progress: bool = True,
+    ) -> Generator[BulkCallResult, None, None]:
+        """
+        Calls the procedure once per parameter set, running up to `max_concurrent_calls` calls at once.
+
+        The results are yielded in the order of the parameters, or as the calls complete if `ordered` is False. A
+        failing call is reported in its `BulkCallResult` instead of stopping the other calls.
+        """
+        executor = BulkProcedureExecutor(self, max_concurrent_calls, show_progress)
+        return executor.run(endpoint, params, query_type, yields, database, mode, retryable, ordered)
+
     @abstractmethod
     def server_version(self) -> ServerVersion:
         pass
@@ -94,6 +159,9 @@ class QueryRunner(ABC):
     def set_show_progress(self, show_progress: bool) -> None:
         pass
 
+    def _resolve_show_progress(self, show_progress: bool) -> bool:
+        return show_progress
+
     @abstractmethod
     def cloneWithoutRouting(self, host: str, port: int) -> "QueryRunner":
         pass
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+from itertools import repeat
+from typing import Any, Iterable, Sequence
+
+import pandas
+import pyarrow
+from pandas import DataFrame
+
+# types which Arrow converts to the same pandas values as the driver, other values stay Python objects in pandas
+_PRIMITIVE_TYPES = (bool, int, float, str)
+
+
+class RecordColumnBuilder:
+    """
+    Collects Bolt records column by column and converts each column to Arrow in one step.
+
+    `neo4j.Result.to_df` creates the DataFrame from one Python list per record, which pandas has to transpose and
+    type-infer value by value. Here, the values of every batch of records are appended to per-column lists, and each
+    column is converted by Arrow into a typed array in one call. Columns of primitive values become typed pandas columns, other values such
+    as lists, maps, nodes or temporal values are kept as Python objects, just as `to_df` keeps them.
+
+    Parameters
+    ----------
+    keys
+        The column names of the result.
+    """
+
+    def __init__(self, keys: Sequence[str]):
+        self._keys = list(keys)
+        self._columns: list[list[Any]] = [[] for _ in self._keys]
+
+    def extend(self, records: Iterable[tuple[Any, ...]]) -> None:
+        """Appends records, which are tuples of values in the order of the keys, such as `neo4j.Record`."""
+        rows = list(records)
+        for index, column in enumerate(self._columns):
+            # `neo4j.Record` overrides item access and iteration in Python, the tuple slot reads the value directly
+            column.extend(map(tuple.__getitem__, rows, repeat(index)))
+
+    def num_rows(self) -> int:
+        return len(self._columns[0]) if self._columns else 0
+
+    def to_arrow(self) -> pyarrow.Table:
+        """
+        Returns the collected records as an Arrow table.
+
+        Raises a ValueError for columns which Arrow cannot represent, such as graph entities.
+        """
+        arrays = []
+        for key, column in zip(self._keys, self._columns):
+            try:
+                arrays.append(pyarrow.array(column))
+            except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError) as e:
+                raise ValueError(f"The column '{key}' cannot be converted to Arrow: {e}") from e
+        return pyarrow.table(arrays, names=self._keys)
+
+    def to_pandas(self) -> DataFrame:
+        """Returns the collected records as a DataFrame with the same values and dtypes as `neo4j.Result.to_df`."""
+        return DataFrame(
+            {key: self._to_series(column) for key, column in zip(self._keys, self._columns)}, columns=self._keys
+        )
+
+    def clear(self) -> None:
+        self._columns = [[] for _ in self._keys]
+
+    @staticmethod
+    def _to_series(column: list[Any]) -> pandas.Series:
+        if _is_primitive(column):
+            try:
+                series: pandas.Series = pyarrow.array(column).to_pandas()
+                return series
+            except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError):
+                # mixed primitives, such as strings and numbers
+                pass
+        return pandas.Series(column, dtype=object if not column else None)
+
+
+class RecordChunker:
+    """
+    Converts the batches of records fetched for a chunked result to DataFrames.
+
+    A result without records is still represented by one empty DataFrame with the result columns.
+
+    Parameters
+    ----------
+    keys
+        The column names of the result.
+    """
+
+    def __init__(self, keys: Sequence[str]):
+        self._builder = RecordColumnBuilder(keys)
+        self._num_chunks = 0
+
+    def chunk(self, records: Iterable[tuple[Any, ...]]) -> DataFrame:
+        self._builder.extend(records)
+        df = self._builder.to_pandas()
+        self._builder.clear()
+        self._num_chunks += 1
+        return df
+
+    def empty_result(self) -> DataFrame | None:
+        """Returns the empty DataFrame to yield if no chunk was converted, otherwise None."""
+        return self._builder.to_pandas() if self._num_chunks == 0 else None
+
+
+def _is_primitive(column: list[Any]) -> bool:
+    first = next((value for value in column if value is not None), None)
+    if not isinstance(first, _PRIMITIVE_TYPES):
+        return False
+    # booleans with missing values are objects in pandas, also when converted by Arrow
+    return type(first) is not bool or None not in column
+
+
+def records_to_pandas(keys: Sequence[str], records: Iterable[tuple[Any, ...]]) -> DataFrame:
+    builder = RecordColumnBuilder(keys)
+    builder.extend(records)
+    return builder.to_pandas()
@@ -1,4 +1,7 @@
+import collections
+import itertools
 import logging
+import time
 import typing
 
 import tenacity.wait
@@ -21,12 +24,101 @@ def before_log(
     return log_it
 
 
+# Wait for 0.02 s in the very beginning (to speed up tests)
+# Wait for 0.1 s in the first 10 seconds
+# Then increase exponentially to a max of 5 seconds
+_JOB_WAIT_DELAYS = [0.02] + [0.1 for _ in range(100)] + [1.0, 2.0, 4.0, 5.0]
+
+
 def job_wait_strategy() -> tenacity.wait.wait_base:
-    # Wait for 0.02 s in the very beginning (to speed up tests)
-    # Wait for 0.1 s in the first 10 seconds
-    # Then increase exponentially to a max of 5 seconds
-    return wait_chain(
-        *[wait_fixed(0.02)]
-        + [wait_fixed(0.1) for j in range(100)]
-        + [wait_fixed(1), wait_fixed(2), wait_fixed(4), wait_fixed(5)]
-    )
+    return wait_chain(*[wait_fixed(delay) for delay in _JOB_WAIT_DELAYS])
+
+
+def job_wait_delays() -> typing.Iterator[float]:
+    """The delays of `job_wait_strategy` between consecutive status checks of a job, repeating the last one."""
+    yield from _JOB_WAIT_DELAYS
+    yield from itertools.repeat(_JOB_WAIT_DELAYS[-1])
+
+
+class AdaptivePollSchedule:
+    """
+    Schedules the status checks of a job from the progress it reports.
+
+    The completion time is extrapolated from how fast the progress advanced over the last samples, and the next
+    check is scheduled halfway to the predicted completion. Checks thereby become denser as the job approaches its
+    end, while long-running jobs are checked rarely. The delays stay between `min_delay` and `max_delay`.
+    While the progress is unknown or has not advanced yet, the delays of `job_wait_strategy` are used.
+
+    Parameters
+    ----------
+    min_delay
+        The shortest delay between two checks, also used once the predicted completion time has passed.
+    max_delay
+        The longest delay between two checks.
+    """
+
+    _SAMPLE_WINDOW = 5
+
+    def __init__(
+        self,
+        min_delay: float = 0.1,
+        max_delay: float = 30.0,
+        clock: typing.Callable[[], float] = time.monotonic,
+    ):
+        if not 0 < min_delay <= max_delay:
+            raise ValueError(f"Expected 0 < min_delay <= max_delay, but got {min_delay} and {max_delay}.")
+
+        self._min_delay = min_delay
+        self._max_delay = max_delay
+        self._clock = clock
+        self._fallback_delays = job_wait_delays()
+        self._samples: collections.deque[tuple[float, float]] = collections.deque(maxlen=self._SAMPLE_WINDOW)
+
+    def next_delay(self, progress: float | None) -> float:
+        """
+        Returns the seconds until the next status check, given the progress between 0 and 1 reported by the last
+        check, or None if the progress is unknown.
+        """
+        fallback = min(next(self._fallback_delays), self._max_delay)
+        if progress is None or progress < 0:
+            return fallback
+
+        now = self._clock()
+        if self._samples and progress < self._samples[-1][1]:
+            # the job moved on to a task with its own progress
+            self._samples.clear()
+        self._samples.append((now, min(progress, 1.0)))
+
+        oldest_time, oldest_progress = self._samples[0]
+        if now <= oldest_time or progress <= oldest_progress:
+            return fallback
+
+        rate = (progress - oldest_progress) / (now - oldest_time)
+        remaining = (1.0 - min(progress, 1.0)) / rate
+        return min(self._max_delay, max(self._min_delay, remaining / 2))
+
+
+class _WaitForPredictedCompletion(tenacity.wait.wait_base):
+    def __init__(self, progress_of: typing.Callable[[typing.Any], float | None], schedule: AdaptivePollSchedule):
+        self._progress_of = progress_of
+        self._schedule = schedule
+
+    def __call__(self, retry_state: RetryCallState) -> float:
+        outcome = retry_state.outcome
+        progress = None
+        if outcome is not None and not outcome.failed:
+            progress = self._progress_of(outcome.result())
+        return self._schedule.next_delay(progress)
+
+
+def adaptive_job_wait_strategy(
+    progress_of: typing.Callable[[typing.Any], float | None],
+    min_delay: float = 0.1,
+    max_delay: float = 30.0,
+) -> tenacity.wait.wait_base:
+    """
+    A wait strategy which schedules the next status check of a job with an `AdaptivePollSchedule`.
+
+    `progress_of` extracts the progress between 0 and 1 from the status returned by the previous attempt.
+    """
+    return _WaitForPredictedCompletion(progress_of, AdaptivePollSchedule(min_delay, max_delay))
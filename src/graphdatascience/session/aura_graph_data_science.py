@@ -1,12 +1,14 @@
 from __future__ import annotations
 
-from typing import Any, Tuple
+import threading
+from typing import Any, Callable, ParamSpec, Tuple, TypeVar
 
 from pandas import DataFrame
 
 from graphdatascience.arrow_client.arrow_authentication import ArrowAuthentication
 from graphdatascience.arrow_client.arrow_endpoint_version import ArrowEndpointVersion
 from graphdatascience.arrow_client.authenticated_flight_client import AuthenticatedArrowClient
+from graphdatascience.arrow_client.result_cache import ResultCache
 from graphdatascience.arrow_client.v2.gds_arrow_client import GdsArrowClient
 from graphdatascience.error.standalone_session_error import NotAvailableInStandaloneSessions
 from graphdatascience.procedure_surface.api import ConfigEndpoints
@@ -121,6 +123,7 @@ from graphdatascience.procedure_surface.arrow.community.triangle_count_arrow_end
 from graphdatascience.procedure_surface.arrow.community.triangles_arrow_endpoints import TrianglesArrowEndpoints
 from graphdatascience.procedure_surface.arrow.community.wcc_arrow_endpoints import WccArrowEndpoints
 from graphdatascience.procedure_surface.arrow.config_arrow_endpoints import ConfigArrowEndpoints
+from graphdatascience.procedure_surface.arrow.job_futures import JobFuture, JobFutureExecutor
 from graphdatascience.procedure_surface.arrow.jobs_arrow_endpoints import JobsArrowEndpoints
 from graphdatascience.procedure_surface.arrow.list_progress_arrow_endpoint import ListProgressArrowEndpoint
 from graphdatascience.procedure_surface.arrow.model.model_catalog_arrow_endpoints import (
@@ -185,6 +188,9 @@ from graphdatascience.session.session_lifecycle_manager import LifecycleManager
 
 SUPPORTED_CLIENT_ARROW_VERSIONS = {ArrowEndpointVersion.V2}
 
+P = ParamSpec("P")
+T = TypeVar("T")
+
 
 class AuraGraphDataScience:
     """
@@ -203,6 +209,7 @@ class AuraGraphDataScience:
         arrow_client_options: dict[str, Any] | None = None,
         bookmarks: Any | None = None,
         show_progress: bool = True,
+        result_cache: ResultCache | None = None,
     ) -> AuraGraphDataScience:
         authenticated_arrow_client = AuthenticatedArrowClient(
             session_connection_info,
@@ -211,6 +218,8 @@ class AuraGraphDataScience:
             arrow_client_options=arrow_client_options,
             health_check=session_lifecycle_manager,
         )
+        if result_cache is not None:
+            result_cache.attach(authenticated_arrow_client)
 
         db_query_runner: Neo4jQueryRunner | None = None
         if db_endpoint is not None:
@@ -249,6 +258,14 @@ class AuraGraphDataScience:
             self._write_protocol = WriteProtocol.select(authenticated_arrow_client, db_query_runner)
         self._session_lifecycle_manager = session_lifecycle_manager
         self._show_progress = show_progress
+        self._job_executor: JobFutureExecutor | None = None
+        self._job_executor_lock = threading.Lock()
+
+    def result_cache(self) -> ResultCache | None:
+        """
+        Returns the cache for results of finished jobs, if one was configured when the session was created.
+        """
+        return ResultCache.of(self._authenticated_arrow_client)
 
     @property
     def graph(self) -> CatalogArrowEndpoints:
@@ -769,6 +786,34 @@ class AuraGraphDataScience:
         self._verify_session_connectivity()
         self._verify_db_connectivity()
 
+    def submit(self, fn: Callable[P, T], /, *args: P.args, **kwargs: P.kwargs) -> JobFuture[T]:
+        """
+        Runs an endpoint call in the background and returns a `concurrent.futures.Future` of its result.
+
+        Any `stream`, `mutate`, `write` or `stats` method can be submitted, so that many calls run concurrently and
+        can be gathered with `concurrent.futures.as_completed`. Cancelling the future also cancels the jobs of the
+        call on the session. A running call then completes with a `CancelledError` once it notices the cancellation.
+
+        Parameters
+        ----------
+        fn
+            The endpoint method to call, such as `gds.bellman_ford.stream`.
+        *args
+            The positional arguments of the call.
+        **kwargs
+            The keyword arguments of the call.
+
+        Returns
+        -------
+        JobFuture
+            The future of the result of the call.
+        """
+        with self._job_executor_lock:
+            if self._job_executor is None:
+                self._job_executor = JobFutureExecutor(self._authenticated_arrow_client)
+            executor = self._job_executor
+        return executor.submit(fn, *args, **kwargs)
+
     def run_cypher(
         self,
         query: str,
@@ -899,6 +944,11 @@ class AuraGraphDataScience:
         """
         Close the GraphDataScience object and release any resources held by it.
         """
+        with self._job_executor_lock:
+            executor, self._job_executor = self._job_executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+        ResultCache.detach(self._authenticated_arrow_client)
         self._authenticated_arrow_client.close()
         if self._db_query_runner:
             self._db_query_runner.close()
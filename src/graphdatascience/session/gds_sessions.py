@@ -8,6 +8,7 @@ from datetime import datetime, timedelta, timezone
 from typing import Any
 
 from graphdatascience.arrow_client.arrow_authentication import ArrowAuthentication
+from graphdatascience.arrow_client.result_cache import ResultCache
 from graphdatascience.procedure_surface.utils.config_converter import ConfigConverter
 from graphdatascience.query_runner.db_environment_resolver import DbEnvironmentResolver
 from graphdatascience.query_runner.neo4j_query_runner import Neo4jQueryRunner
@@ -176,6 +177,7 @@ class GdsSessions:
         neo4j_driver_config: dict[str, Any] | None = None,
         arrow_client_options: dict[str, Any] | None = None,
         show_progress: bool = True,
+        result_cache: ResultCache | None = None,
     ) -> AuraGraphDataScience:
         """
         Retrieves an existing session with the given session name and database connection,
@@ -194,6 +196,7 @@ class GdsSessions:
             neo4j_driver_config (dict[str, Any] | None): Optional configuration for the Neo4j driver to the Neo4j DBMS. Only relevant if `db_connection` is specified..
             arrow_client_options (dict[str, Any] | None): Optional configuration for the Arrow Flight client.
             show_progress (bool): Whether the returned client should print its own job-progress bars (projection, algorithm execution, ...). Defaults to True.
+            result_cache (ResultCache | None): Optional cache for the results of finished jobs, so that reading a result again does not download it again.
         Returns:
             AuraGraphDataScience: The session.
         """
@@ -264,6 +267,7 @@ class GdsSessions:
             db_runner,
             arrow_client_options,
             show_progress,
+            result_cache,
         )
 
     def delete(self, *, session_name: str | None = None, session_id: str | None = None) -> bool:
@@ -418,6 +422,7 @@ class GdsSessions:
         db_runner: Neo4jQueryRunner | None,
         arrow_client_options: dict[str, Any] | None = None,
         show_progress: bool = True,
+        result_cache: ResultCache | None = None,
     ) -> AuraGraphDataScience:
         return AuraGraphDataScience.create(
             (session_host, session_port),
@@ -426,4 +431,5 @@ class GdsSessions:
             session_lifecycle_manager=SessionLifecycleManager(session_id, self._aura_api),
             arrow_client_options=arrow_client_options,
             show_progress=show_progress,
+            result_cache=result_cache,
         )
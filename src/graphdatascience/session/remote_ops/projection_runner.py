@@ -1,16 +1,17 @@
-from concurrent.futures.thread import ThreadPoolExecutor
+from dataclasses import dataclass
 from logging import DEBUG, getLogger
 from typing import Any
 
 from pyarrow import ArrowKeyError
-from tenacity import Retrying, retry, retry_if_result
+from tenacity import retry, retry_if_result
 
 from graphdatascience.arrow_client.authenticated_flight_client import AuthenticatedArrowClient
+from graphdatascience.arrow_client.v2.api_types import JobStatus
 from graphdatascience.arrow_client.v2.job_client import JobClient
 from graphdatascience.progress.progress_bar import TqdmProgressBar
 from graphdatascience.query_runner import QueryRunner
 from graphdatascience.query_runner.termination_flag import TerminationFlag
-from graphdatascience.retry_utils.retry_utils import before_log, job_wait_strategy
+from graphdatascience.retry_utils.retry_utils import adaptive_job_wait_strategy, before_log
 from graphdatascience.session.remote_ops.project_protocols import ProjectProtocol
 from graphdatascience.session.remote_ops.status import Status
 
@@ -94,65 +95,106 @@ class ProjectionRunner:
         return result["result"]  # type: ignore
 
     def _await_result(self, job_id: str, query_runner: QueryRunner, show_progress: bool) -> dict[str, Any]:
-        if show_progress:
-            executor = ThreadPoolExecutor(max_workers=1)
-            progress_future = executor.submit(self._poll_progress, job_id)
+        """
+        Polls the projection until it is done, in a single loop on the calling thread.
 
-        try:
-            return self._poll_until_done(job_id, query_runner)
-        finally:
-            if show_progress:
-                try:
-                    progress_future.result(timeout=10)
-                except Exception:
-                    pass
-                finally:
-                    executor.shutdown(wait=False)
-
-    def _poll_until_done(self, job_id: str, query_runner: QueryRunner) -> dict[str, Any]:
-        def is_not_done(r: dict[str, Any]) -> bool:
-            status: str = r["status"]
-            return status != Status.DONE.name
+        Once the projection job is known to the Arrow server, each check only reads its status there, which also
+        feeds the progress bar. The DBMS status, which carries the result, is only read when the job finished on the
+        Arrow server, while the job is not known there, and every few checks to notice failures on the DBMS side.
+        """
+        job = _ProjectionJob(self._arrow_client, job_id, show_progress)
+        checks = 0
 
         @retry(
             reraise=True,
             before=before_log(f"Awaiting completion for job {job_id}", getLogger(), DEBUG),
-            retry=retry_if_result(is_not_done),
-            wait=job_wait_strategy(),
+            retry=retry_if_result(lambda status: not status.done()),
+            wait=adaptive_job_wait_strategy(lambda status: status.progress()),
         )
-        def poll() -> dict[str, Any]:
+        def poll() -> _ProjectionStatus:
+            nonlocal checks
             self._termination_flag.assert_running()
-            return self._project_protocol.get_status(job_id, query_runner)
-
+            job_status = job.status()
+            check_dbms = job_status is None or job_status.succeeded() or job_status.aborted()
+            checks += 1
+            if not check_dbms and checks % _DBMS_CHECK_INTERVAL != 0:
+                return _ProjectionStatus(None, job_status)
+            return _ProjectionStatus(self._project_protocol.get_status(job_id, query_runner), job_status)
+
+        succeeded = False
         try:
-            return poll()
+            status = poll()
+            succeeded = True
+            assert status.result is not None
+            return status.result
         finally:
+            job.finish(succeeded)
             query_runner.close()
 
-    def _poll_progress(self, job_id: str) -> None:
-        progress_bar: TqdmProgressBar | None = None
-        job_client = JobClient()
-
-        for attempt in Retrying(retry=retry_if_result(lambda _: True), wait=job_wait_strategy(), reraise=True):
-            with attempt:
-                self._termination_flag.assert_running()
-
-                try:
-                    job_status = job_client.get_job_status(self._arrow_client, job_id)
-                except ArrowKeyError:
-                    continue
-
-                if job_status.succeeded() or job_status.aborted():
-                    if progress_bar:
-                        progress_bar.finish(success=job_status.succeeded())
-                    return
-
-                if progress_bar is None:
-                    base_task = job_status.base_task()
-                    if base_task:
-                        progress_bar = TqdmProgressBar(
-                            task_name=base_task,
-                            relative_progress=job_status.progress_percent(),
-                        )
-                if progress_bar:
-                    progress_bar.update(job_status.status, job_status.progress_percent(), job_status.sub_tasks())
+
+# while the Arrow server reports the projection job as running, the DBMS status is only read on every n-th check
+_DBMS_CHECK_INTERVAL = 10
+
+
+@dataclass
+class _ProjectionStatus:
+    result: dict[str, Any] | None
+    job_status: JobStatus | None
+
+    def done(self) -> bool:
+        return self.result is not None and self.result["status"] == Status.DONE.name
+
+    def progress(self) -> float | None:
+        if self.job_status is not None and self.job_status.progress_known():
+            return self.job_status.progress
+        if self.result is None:
+            return None
+        # the DBMS status only reports a progress in some protocol versions
+        progress: float | None = self.result.get("progress")
+        return progress
+
+
+class _ProjectionJob:
+    """
+    Reads the status of the projection job on the Arrow server and shows its progress. Failing to read it never fails
+    the projection, the completion is then read from the DBMS.
+    """
+
+    def __init__(self, arrow_client: AuthenticatedArrowClient, job_id: str, show_progress: bool):
+        self._arrow_client = arrow_client
+        self._job_id = job_id
+        self._show_progress = show_progress
+        self._progress_bar: TqdmProgressBar | None = None
+        self._enabled = True
+
+    def status(self) -> JobStatus | None:
+        if not self._enabled:
+            return None
+
+        try:
+            job_status = JobClient.get_job_status(self._arrow_client, self._job_id)
+        except ArrowKeyError:
+            # the job is not known to the Arrow server before the projection started sending data
+            return None
+        except Exception as e:
+            getLogger("gds_arrow_client").debug(f"Stopped reading the status of projection {self._job_id}: {e}")
+            self._enabled = False
+            return None
+
+        if self._show_progress:
+            self._update_progress_bar(job_status)
+        return job_status
+
+    def finish(self, success: bool) -> None:
+        if self._progress_bar:
+            self._progress_bar.finish(success=success)
+
+    def _update_progress_bar(self, job_status: JobStatus) -> None:
+        if self._progress_bar is None:
+            base_task = job_status.base_task()
+            if base_task:
+                self._progress_bar = TqdmProgressBar(
+                    task_name=base_task, relative_progress=job_status.progress_percent()
+                )
+        if self._progress_bar:
+            self._progress_bar.update(job_status.status, job_status.progress_percent(), job_status.sub_tasks())
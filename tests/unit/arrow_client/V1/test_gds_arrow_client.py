@@ -2,6 +2,7 @@ import json
 import re
 from typing import Any, Generator, TypeAlias
 
+import pandas as pd
 import pyarrow as pa
 import pytest
 from pyarrow.flight import (
@@ -13,6 +14,7 @@ from pyarrow.flight import (
     GeneratorStream,
     Ticket,
 )
+from pytest_mock import MockerFixture
 
 from graphdatascience.arrow_client.arrow_authentication import UsernamePasswordAuthentication
 from graphdatascience.arrow_client.authenticated_flight_client import AuthenticatedArrowClient
@@ -427,3 +429,26 @@ def assert_ticket(ticket: Ticket, expected_body: dict[str, Any]) -> None:
     parsed = json.loads(ticket.ticket.decode())
     assert parsed["name"] == "GET_COMMAND"
     assert parsed["body"] == expected_body
+
+
+@pytest.mark.parametrize("keep_dictionaries", [False, True])
+def test_get_result_with_dictionary_encoded_column(keep_dictionaries: bool, mocker: MockerFixture) -> None:
+    table = pa.table({"relationshipType": pa.array(["R", "S", "R"]).dictionary_encode(), "weight": [1.0, 2.0, 3.0]})
+    get = mocker.Mock()
+    get.read_all.return_value = table
+
+    result = GdsArrowClient(mocker.Mock(), keep_dictionaries=keep_dictionaries)._fetch_get_result(get)
+
+    assert result["relationshipType"].tolist() == ["R", "S", "R"]
+    assert isinstance(result["relationshipType"].dtype, pd.CategoricalDtype) == keep_dictionaries
+
+
+@pytest.mark.parametrize("keep_dictionaries", [False, True])
+def test_get_result_with_dictionary_encoded_list_column(keep_dictionaries: bool, mocker: MockerFixture) -> None:
+    labels = pa.DictionaryArray.from_arrays(pa.array([0, 1, 0]), pa.array([["A"], ["A", "B"]]))
+    get = mocker.Mock()
+    get.read_all.return_value = pa.table({"nodeId": [0, 1, 2], "labels": labels})
+
+    result = GdsArrowClient(mocker.Mock(), keep_dictionaries=keep_dictionaries)._fetch_get_result(get)
+
+    assert [list(value) for value in result["labels"]] == [["A"], ["A", "B"], ["A"]]
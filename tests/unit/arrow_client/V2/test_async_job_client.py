@@ -0,0 +1,149 @@
+import asyncio
+import threading
+from typing import Any
+
+import pyarrow as pa
+import pytest
+from pytest_mock import MockerFixture
+
+from graphdatascience.arrow_client.v2.api_types import JobIdConfig, JobStatus
+from graphdatascience.arrow_client.v2.async_job_client import AsyncJobClient
+from tests.unit.arrow_client.arrow_test_utils import ArrowTestResult
+
+
+def _status(status: str, job_id: str = "job-1") -> list[ArrowTestResult]:
+    return [ArrowTestResult(JobStatus(jobId=job_id, progress=0.5, status=status, description="").dump_camel())]
+
+
+def _job_id(job_id: str) -> list[ArrowTestResult]:
+    return [ArrowTestResult(JobIdConfig(jobId=job_id).dump_camel())]
+
+
+def test_run_job_and_wait(mocker: MockerFixture) -> None:
+    mock_client = mocker.Mock()
+    mock_client.do_action_with_retry.side_effect = [_job_id("job-1"), _status("RUNNING"), _status("Done")]
+
+    job_id = asyncio.run(AsyncJobClient(mock_client).run_job_and_wait("v2/test.endpoint", {"param": 1}))
+
+    assert job_id == "job-1"
+    mock_client.do_action_with_retry.assert_any_call("v2/test.endpoint", {"param": 1})
+    assert mock_client.do_action_with_retry.call_count == 3
+
+
+def test_wait_returns_aborted_status(mocker: MockerFixture) -> None:
+    mock_client = mocker.Mock()
+    mock_client.do_action_with_retry.return_value = _status("Aborted")
+
+    status = asyncio.run(AsyncJobClient(mock_client).wait("job-1"))
+
+    assert status.aborted()
+
+
+def test_wait_for_expected_status(mocker: MockerFixture) -> None:
+    mock_client = mocker.Mock()
+    mock_client.do_action_with_retry.side_effect = [_status("RUNNING"), _status("RELATIONSHIP_LOADING")]
+
+    status = asyncio.run(AsyncJobClient(mock_client).wait("job-1", expected_status="RELATIONSHIP_LOADING"))
+
+    assert status.status == "RELATIONSHIP_LOADING"
+
+
+def test_waits_for_many_jobs_concurrently(mocker: MockerFixture) -> None:
+    mock_client = mocker.Mock()
+    polls: dict[str, int] = {}
+    lock = threading.Lock()
+
+    def do_action(endpoint: str, payload: dict[str, Any]) -> list[ArrowTestResult]:
+        job_id = payload["jobId"]
+        with lock:
+            polls[job_id] = polls.get(job_id, 0) + 1
+            return _status("Done" if polls[job_id] == 3 else "RUNNING", job_id)
+
+    mock_client.do_action_with_retry.side_effect = do_action
+
+    async def wait_all() -> list[JobStatus]:
+        client = AsyncJobClient(mock_client)
+        return await asyncio.gather(*(client.wait(f"job-{i}") for i in range(20)))
+
+    statuses = asyncio.run(wait_all())
+
+    assert all(status.succeeded() for status in statuses)
+    assert polls == {f"job-{i}": 3 for i in range(20)}
+
+
+def test_cancelling_wait_cancels_the_job(mocker: MockerFixture) -> None:
+    mock_client = mocker.Mock()
+
+    def do_action(endpoint: str, payload: dict[str, Any]) -> list[ArrowTestResult]:
+        return _status("RUNNING") if endpoint == "v2/jobs.status" else []
+
+    mock_client.do_action_with_retry.side_effect = do_action
+
+    async def cancel_wait() -> None:
+        task = asyncio.create_task(AsyncJobClient(mock_client).wait("job-1"))
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(cancel_wait())
+
+    mock_client.do_action_with_retry.assert_called_with("v2/jobs.cancel", {"jobId": "job-1"})
+
+
+def test_cancelling_wait_keeps_job_if_disabled(mocker: MockerFixture) -> None:
+    mock_client = mocker.Mock()
+    mock_client.do_action_with_retry.return_value = _status("RUNNING")
+
+    async def cancel_wait() -> None:
+        task = asyncio.create_task(AsyncJobClient(mock_client).wait("job-1", cancel_on_cancellation=False))
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(cancel_wait())
+
+    endpoints = {call.args[0] for call in mock_client.do_action_with_retry.call_args_list}
+    assert endpoints == {"v2/jobs.status"}
+
+
+def test_summary(mocker: MockerFixture) -> None:
+    mock_client = mocker.Mock()
+    mock_client.do_action_with_retry.return_value = [ArrowTestResult({"nodeCount": 42})]
+
+    assert asyncio.run(AsyncJobClient(mock_client).summary("job-1")) == {"nodeCount": 42}
+
+
+def test_stream(mocker: MockerFixture) -> None:
+    mock_client = mocker.Mock()
+    mock_client.do_action_with_retry.return_value = _job_id("export-job")
+    first = pa.record_batch({"nodeId": [0, 1]})
+    second = pa.record_batch({"nodeId": [2]})
+    reader = mocker.Mock()
+    reader.schema = first.schema
+    reader.read_chunk.side_effect = [mocker.Mock(data=first), mocker.Mock(data=second), StopIteration()]
+    mock_client.get_stream.return_value = reader
+
+    table = asyncio.run(AsyncJobClient(mock_client).stream("g", "job-1", output_format="arrow"))
+
+    assert table.column("nodeId").to_pylist() == [0, 1, 2]
+    mock_client.do_action_with_retry.assert_called_once_with("v2/results.stream", {"graphName": "g", "jobId": "job-1"})
+    reader.cancel.assert_not_called()
+
+
+def test_abandoned_stream_batches_cancel_the_stream(mocker: MockerFixture) -> None:
+    mock_client = mocker.Mock()
+    mock_client.do_action_with_retry.return_value = _job_id("export-job")
+    reader = mocker.Mock()
+    reader.read_chunk.return_value = mocker.Mock(data=pa.record_batch({"nodeId": [0]}))
+    mock_client.get_stream.return_value = reader
+
+    async def read_first() -> pa.RecordBatch:
+        batches = AsyncJobClient(mock_client).stream_batches("g", "job-1")
+        first = await anext(batches)
+        await batches.aclose()  # type: ignore
+        return first
+
+    assert asyncio.run(read_first()).num_rows == 1
+    reader.cancel.assert_called_once()
@@ -4,10 +4,14 @@ from typing import Any, Callable
 
 import pandas as pd
 import pyarrow as pa
+import pytest
+from pyarrow import flight
 from pytest_mock import MockerFixture
 
 from graphdatascience.arrow_client.authenticated_flight_client import AuthenticatedArrowClient
+from graphdatascience.arrow_client.batch_sizing import BatchByteBudget
 from graphdatascience.arrow_client.v2.gds_arrow_client import GdsArrowClient
+from graphdatascience.query_runner.termination_flag import TerminationFlag
 
 
 class ImmediateRetryConfig:
@@ -23,8 +27,9 @@ class ImmediateRetryConfig:
 
 
 class StubWriter:
-    def __init__(self) -> None:
+    def __init__(self, event_log: list[str] | None = None) -> None:
         self.batches: list[pa.RecordBatch] = []
+        self._event_log = event_log
 
     def __enter__(self) -> StubWriter:
         return self
@@ -34,6 +39,8 @@ class StubWriter:
 
     def write_batch(self, batch: pa.RecordBatch) -> None:
         self.batches.append(batch)
+        if self._event_log is not None:
+            self._event_log.append("write")
 
 
 class StubAckReader:
@@ -45,6 +52,18 @@ class StubAckReader:
         self._ack_log.append(self._label)
 
 
+class BrokenAckReader:
+    """Acknowledges `healthy_reads` batches and then fails like a broken stream."""
+
+    def __init__(self, healthy_reads: int) -> None:
+        self._healthy_reads = healthy_reads
+
+    def read(self) -> None:
+        if self._healthy_reads == 0:
+            raise flight.FlightUnavailableError("connection reset")
+        self._healthy_reads -= 1
+
+
 def test_upload_nodes_uses_one_do_put_per_dataframe_schema(mocker: MockerFixture) -> None:
     arrow_client = mocker.Mock(spec=AuthenticatedArrowClient)
     arrow_client._retry_config = ImmediateRetryConfig()
@@ -94,3 +113,117 @@ def test_upload_relationships_accumulates_progress_across_dataframes(mocker: Moc
     )
 
     assert progress == [2, 1, 1]
+
+
+def test_upload_keeps_multiple_batches_in_flight(mocker: MockerFixture) -> None:
+    arrow_client = mocker.Mock(spec=AuthenticatedArrowClient)
+    arrow_client._retry_config = ImmediateRetryConfig()
+
+    events: list[str] = []
+    arrow_client.do_put_with_retry.side_effect = (
+        lambda descriptor, schema: (StubWriter(events), StubAckReader(events, "ack"))  # noqa: ARG005
+    )
+
+    progress: list[int] = []
+    nodes = pd.DataFrame({"nodeId": [0, 1, 2, 3, 4]})
+
+    GdsArrowClient(arrow_client, max_in_flight_batches=2).upload_nodes(
+        "job-123", nodes, batch_size=2, progress_callback=lambda num_rows: progress.append(num_rows)
+    )
+
+    assert events == ["write", "write", "ack", "write", "ack", "ack"]
+    assert progress == [2, 2, 1]
+
+
+def test_upload_with_byte_budget_sizes_batches_by_bytes(mocker: MockerFixture) -> None:
+    arrow_client = mocker.Mock(spec=AuthenticatedArrowClient)
+    arrow_client._retry_config = ImmediateRetryConfig()
+
+    writers: list[StubWriter] = []
+
+    def do_put_with_retry(descriptor: Any, schema: pa.Schema) -> tuple[StubWriter, StubAckReader]:  # noqa: ARG001
+        writers.append(StubWriter())
+        return writers[-1], StubAckReader([], "ack")
+
+    arrow_client.do_put_with_retry.side_effect = do_put_with_retry
+
+    edges = pd.DataFrame({"sourceNodeId": range(100), "targetNodeId": range(100)})
+    features = pd.DataFrame({"nodeId": range(100), "embedding": [[0.5] * 64] * 100})
+
+    budget = BatchByteBudget(target_bytes=1024, min_bytes=1024)
+    GdsArrowClient(arrow_client).upload_relationships("job-123", edges, batch_size=budget)
+    GdsArrowClient(arrow_client).upload_nodes("job-123", features, batch_size=budget)
+
+    edge_batch_sizes = [batch.num_rows for batch in writers[0].batches]
+    feature_batch_sizes = [batch.num_rows for batch in writers[1].batches]
+    assert edge_batch_sizes == [64, 36]
+    assert max(feature_batch_sizes) == 1
+
+
+def test_upload_resumes_from_last_acknowledged_batch(mocker: MockerFixture) -> None:
+    arrow_client = mocker.Mock(spec=AuthenticatedArrowClient)
+    writers = [StubWriter(), StubWriter()]
+    arrow_client.do_put_with_retry.side_effect = [
+        (writers[0], BrokenAckReader(1)),
+        (writers[1], StubAckReader([], "ack")),
+    ]
+
+    progress: list[int] = []
+    nodes = pd.DataFrame({"nodeId": [0, 1, 2, 3, 4]})
+
+    GdsArrowClient(arrow_client, max_in_flight_batches=2).upload_nodes(
+        "job-123", nodes, batch_size=1, progress_callback=lambda num_rows: progress.append(num_rows)
+    )
+
+    assert [batch["nodeId"][0].as_py() for batch in writers[0].batches] == [0, 1, 2]
+    # batch 0 was acknowledged before the stream broke, batches 1 and 2 are sent again
+    assert [batch["nodeId"][0].as_py() for batch in writers[1].batches] == [1, 2, 3, 4]
+    assert sum(progress) == 5
+
+
+def test_upload_resends_batch_whose_write_failed(mocker: MockerFixture) -> None:
+    arrow_client = mocker.Mock(spec=AuthenticatedArrowClient)
+    broken_writer = StubWriter()
+    broken_writer.write_batch = mocker.Mock(side_effect=flight.FlightTimedOutError("deadline exceeded"))  # type: ignore[method-assign]
+    writer = StubWriter()
+    arrow_client.do_put_with_retry.side_effect = [
+        (broken_writer, StubAckReader([], "ack")),
+        (writer, StubAckReader([], "ack")),
+    ]
+
+    GdsArrowClient(arrow_client).upload_nodes("job-123", pd.DataFrame({"nodeId": [0, 1]}), batch_size=1)
+
+    assert [batch["nodeId"][0].as_py() for batch in writer.batches] == [0, 1]
+
+
+def test_upload_gives_up_after_max_resumes(mocker: MockerFixture) -> None:
+    arrow_client = mocker.Mock(spec=AuthenticatedArrowClient)
+    arrow_client.do_put_with_retry.side_effect = lambda descriptor, schema: (StubWriter(), BrokenAckReader(0))  # noqa: ARG005
+
+    with pytest.raises(flight.FlightUnavailableError, match="connection reset"):
+        GdsArrowClient(arrow_client, max_in_flight_batches=1, max_upload_resumes=2).upload_nodes(
+            "job-123", pd.DataFrame({"nodeId": [0, 1]}), batch_size=1
+        )
+
+    assert arrow_client.do_put_with_retry.call_count == 3
+
+
+@pytest.mark.parametrize("abort_on_termination", [True, False])
+def test_terminated_upload_aborts_the_job_unless_the_caller_does(
+    mocker: MockerFixture, abort_on_termination: bool
+) -> None:
+    arrow_client = mocker.Mock(spec=AuthenticatedArrowClient)
+    arrow_client.do_put_with_retry.side_effect = lambda descriptor, schema: (StubWriter(), StubAckReader([], "ack"))  # noqa: ARG005
+    termination_flag = TerminationFlag.create()
+    termination_flag.set()
+
+    with pytest.raises(RuntimeError, match="aborted via termination flag"):
+        GdsArrowClient(arrow_client).upload_nodes(
+            "job-123",
+            pd.DataFrame({"nodeId": [0, 1]}),
+            termination_flag=termination_flag,
+            abort_on_termination=abort_on_termination,
+        )
+
+    aborts = [call for call in arrow_client.do_action_with_retry.call_args_list if call.args[0] == "v2/jobs.cancel"]
+    assert len(aborts) == (1 if abort_on_termination else 0)
@@ -1,5 +1,7 @@
 from io import StringIO
+from typing import Generator, cast
 
+import pyarrow as pa
 import pytest
 from pytest_mock import MockerFixture
 
@@ -152,9 +154,10 @@ def test_wait_for_job_waits_for_aborted(mocker: MockerFixture) -> None:
 
     mock_client.do_action_with_retry = do_action_with_retry
 
-    JobClient().wait_for_job(mock_client, job_id, show_progress=False)
+    final_status = JobClient().wait_for_job(mock_client, job_id, show_progress=False)
 
     assert mock_client.do_action_with_retry.call_count == 2
+    assert final_status.aborted()
 
 
 def test_wait_for_job_stops_on_interrupt(mocker: MockerFixture) -> None:
@@ -238,3 +241,50 @@ def test_get_summary(mocker: MockerFixture) -> None:
         "v2/results.summary", JobIdConfig(jobId=job_id).dump_camel()
     )
     assert result == expected_summary
+
+
+def test_get_stream_batches_yields_batches_as_they_arrive(mocker: MockerFixture) -> None:
+    mock_client = mocker.Mock()
+    first = pa.record_batch({"nodeId": [0, 1]})
+    second = pa.record_batch({"nodeId": [2]})
+
+    reader = mocker.Mock()
+    reader.read_chunk.side_effect = [mocker.Mock(data=first), mocker.Mock(data=second), StopIteration()]
+    mock_client.get_stream.return_value = reader
+
+    batches = JobClient.get_stream_batches(mock_client, "export-job")
+
+    mock_client.get_stream.assert_called_once()
+    reader.read_chunk.assert_not_called()
+
+    assert list(batches) == [first, second]
+    reader.cancel.assert_not_called()
+
+
+def test_get_stream_batches_cancels_abandoned_stream(mocker: MockerFixture) -> None:
+    mock_client = mocker.Mock()
+    reader = mocker.Mock()
+    reader.read_chunk.return_value = mocker.Mock(data=pa.record_batch({"nodeId": [0]}))
+    mock_client.get_stream.return_value = reader
+
+    batches = cast(Generator[pa.RecordBatch, None, None], JobClient.get_stream_batches(mock_client, "export-job"))
+    next(batches)
+    batches.close()
+
+    reader.cancel.assert_called_once()
+
+
+def test_get_stream_reader_exposes_schema_before_reading(mocker: MockerFixture) -> None:
+    mock_client = mocker.Mock()
+    batch = pa.record_batch({"nodeId": [0, 1]})
+
+    reader = mocker.Mock()
+    reader.schema = batch.schema
+    reader.read_chunk.side_effect = [mocker.Mock(data=batch), StopIteration()]
+    mock_client.get_stream.return_value = reader
+
+    batch_reader = JobClient.get_stream_reader(mock_client, "export-job")
+
+    assert batch_reader.schema == batch.schema
+    reader.read_chunk.assert_not_called()
+    assert batch_reader.read_all().num_rows == 2
@@ -0,0 +1,131 @@
+import gc
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from pytest_mock import MockerFixture
+
+from graphdatascience.arrow_client.authenticated_flight_client import AuthenticatedArrowClient
+from graphdatascience.arrow_client.v2.api_types import JobStatus
+from graphdatascience.arrow_client.v2.job_client import JobClient
+from graphdatascience.arrow_client.v2.job_poller import JobPoller
+
+
+class StatusServer:
+    """Reports each job as running for the given number of status requests."""
+
+    def __init__(self, polls_until_done: int, waiters_before_first_poll: int = 0):
+        self.polls_until_done = polls_until_done
+        self.waiters_before_first_poll = waiters_before_first_poll
+        self.poller: JobPoller | None = None
+        self.requests: dict[str, int] = {}
+        self.threads: set[str] = set()
+        self._lock = threading.Lock()
+
+    def status(self, client: object, job_id: str) -> JobStatus:
+        # let all waiters register before the job can finish
+        for _ in range(500):
+            if self.poller is None or self.waiter_count(job_id) >= self.waiters_before_first_poll:
+                break
+            threading.Event().wait(0.01)
+
+        with self._lock:
+            self.requests[job_id] = self.requests.get(job_id, 0) + 1
+            self.threads.add(threading.current_thread().name)
+            done = self.requests[job_id] >= self.polls_until_done
+        return JobStatus(jobId=job_id, progress=0.5, status="Done" if done else "RUNNING", description="")
+
+    def waiter_count(self, job_id: str) -> int:
+        assert self.poller is not None
+        with self.poller._lock:
+            job = self.poller._jobs.get(job_id)
+            return len(job.waiters) if job else 0
+
+
+def _wait(poller: JobPoller, job_id: str) -> JobStatus:
+    waiter = poller.register(job_id, lambda status: status.succeeded())
+    try:
+        while True:
+            status = waiter.next_status(timeout=5)
+            assert status is not None
+            if waiter.is_finished(status):
+                return status
+    finally:
+        waiter.close()
+
+
+def test_polls_many_jobs_from_one_thread(mocker: MockerFixture) -> None:
+    server = StatusServer(polls_until_done=3)
+    client = mocker.Mock()
+    poller = JobPoller(client, server.status)
+
+    with ThreadPoolExecutor(10) as executor:
+        statuses = list(executor.map(lambda i: _wait(poller, f"job-{i}"), range(10)))
+
+    assert all(status.succeeded() for status in statuses)
+    assert server.requests == {f"job-{i}": 3 for i in range(10)}
+    assert all(name.startswith("gds-job") for name in server.threads)
+    assert poller.polled_jobs() == []
+
+
+def test_waiters_of_the_same_job_share_status_requests(mocker: MockerFixture) -> None:
+    server = StatusServer(polls_until_done=5, waiters_before_first_poll=4)
+    client = mocker.Mock()
+    poller = JobPoller(client, server.status)
+    server.poller = poller
+
+    with ThreadPoolExecutor(4) as executor:
+        statuses = list(executor.map(lambda _: _wait(poller, "job-1"), range(4)))
+
+    assert all(status.succeeded() for status in statuses)
+    assert server.requests == {"job-1": 5}
+
+
+def test_delivers_polling_errors_to_waiters(mocker: MockerFixture) -> None:
+    def failing_status(client: object, job_id: str) -> JobStatus:
+        raise RuntimeError("status failed")
+
+    client = mocker.Mock()
+    poller = JobPoller(client, failing_status)
+
+    with pytest.raises(RuntimeError, match="status failed"):
+        _wait(poller, "job-1")
+    assert poller.polled_jobs() == []
+
+
+def test_stops_polling_jobs_without_waiters(mocker: MockerFixture) -> None:
+    server = StatusServer(polls_until_done=1_000_000)
+    client = mocker.Mock()
+    poller = JobPoller(client, server.status)
+
+    waiter = poller.register("job-1", lambda status: status.succeeded())
+    assert waiter.next_status(timeout=5) is not None
+    waiter.close()
+
+    assert poller.polled_jobs() == []
+
+
+def test_wait_for_job_uses_shared_poller(mocker: MockerFixture) -> None:
+    server = StatusServer(polls_until_done=2, waiters_before_first_poll=3)
+    client = mocker.Mock()
+    server.poller = JobPoller.shared(client, server.status)
+
+    with ThreadPoolExecutor(3) as executor:
+        list(executor.map(lambda _: JobClient().wait_for_job(client, "job-1", show_progress=False), range(3)))
+
+    assert server.requests == {"job-1": 2}
+    assert JobPoller.shared(client, server.status).polled_jobs() == []
+
+
+def test_shared_poller_does_not_keep_its_client_alive() -> None:
+    server = StatusServer(polls_until_done=1)
+    client = AuthenticatedArrowClient(("localhost", 8491))
+    _wait(JobPoller.shared(client, server.status), "job-1")
+
+    client_ref = weakref.ref(client)
+    client.close()
+    del client
+    gc.collect()
+
+    assert client_ref() is None
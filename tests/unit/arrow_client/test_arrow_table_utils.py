@@ -0,0 +1,64 @@
+import numpy as np
+import pandas as pd
+import pyarrow
+import pytest
+
+from graphdatascience.arrow_client.arrow_table_utils import convert_table, dictionary_encode_columns, table_to_pandas
+
+TABLE = pyarrow.table({"nodeId": pyarrow.array([0, 1], pyarrow.int64()), "embedding": [[0.5, 1.0], [1.5, 2.0]]})
+
+
+def test_convert_table_to_arrow() -> None:
+    assert convert_table(TABLE, "arrow") is TABLE
+
+
+def test_convert_table_to_pandas() -> None:
+    result = convert_table(TABLE, "pandas")
+
+    assert isinstance(result, pd.DataFrame)
+    assert result["nodeId"].dtype == pd.ArrowDtype(pyarrow.int64())
+
+
+def test_convert_table_to_numpy() -> None:
+    result = convert_table(TABLE, "numpy")
+
+    assert isinstance(result, dict)
+    assert list(result.keys()) == ["nodeId", "embedding"]
+    np.testing.assert_array_equal(result["nodeId"], np.array([0, 1]))
+    assert result["embedding"].dtype == object
+
+
+def test_convert_table_rejects_unknown_format() -> None:
+    with pytest.raises(ValueError, match="Unsupported output format 'polars'"):
+        convert_table(TABLE, "polars")  # type: ignore[arg-type]
+
+
+def test_table_to_pandas_keeps_dictionaries_as_categorical() -> None:
+    table = pyarrow.table({"label": pyarrow.array(["A", "B", "A"]).dictionary_encode(), "score": [1, 2, 3]})
+
+    result = table_to_pandas(table, keep_dictionaries=True)
+
+    assert isinstance(result["label"].dtype, pd.CategoricalDtype)
+    assert list(result["label"].cat.categories) == ["A", "B"]
+    assert result["score"].dtype == pd.ArrowDtype(pyarrow.int64())
+
+
+def test_table_to_pandas_decodes_dictionaries_of_lists() -> None:
+    labels = pyarrow.DictionaryArray.from_arrays(pyarrow.array([0, 0, 1]), pyarrow.array([["A", "B"], ["C"]]))
+    table = pyarrow.table({"labels": labels, "type": pyarrow.array(["R", "S", "R"]).dictionary_encode()})
+
+    result = table_to_pandas(table, keep_dictionaries=True)
+
+    assert result["labels"].dtype == pd.ArrowDtype(pyarrow.list_(pyarrow.string()))
+    assert [list(value) for value in result["labels"]] == [["A", "B"], ["A", "B"], ["C"]]
+    assert isinstance(result["type"].dtype, pd.CategoricalDtype)
+
+
+def test_dictionary_encode_columns_skips_missing_and_encoded_columns() -> None:
+    encoded = pyarrow.array(["A", "B"]).dictionary_encode()
+    table = pyarrow.table({"label": encoded, "type": ["R", "R"]})
+
+    result = dictionary_encode_columns(table, ["label", "type", "missing"])
+
+    assert result.schema.field("label").type == encoded.type
+    assert pyarrow.types.is_dictionary(result.schema.field("type").type)
@@ -1,11 +1,18 @@
+from typing import Any
+
 import certifi
+import pyarrow as pa
 import pytest
-from pyarrow.flight import FlightUnavailableError
+from pyarrow.flight import FlightDescriptor, FlightServerBase, FlightUnavailableError, Ticket
 from pytest_mock import MockerFixture
 
 from graphdatascience.arrow_client.arrow_authentication import ArrowAuthentication
 from graphdatascience.arrow_client.arrow_info import ArrowInfo
-from graphdatascience.arrow_client.authenticated_flight_client import AuthenticatedArrowClient, ConnectionInfo
+from graphdatascience.arrow_client.authenticated_flight_client import (
+    AuthenticatedArrowClient,
+    ConnectionInfo,
+    IpcCompression,
+)
 from graphdatascience.arrow_client.server_health_check import ServerHealthCheck
 from graphdatascience.retry_utils.retry_config import ExponentialWaitConfig, RetryConfigV2
 from graphdatascience.session.aura_api import AuraApi
@@ -143,3 +150,96 @@ def test_pickle_roundtrip_keeps_health_check(retry_config_v2: RetryConfigV2) ->
     health_check = unpickled_client._health_check
     assert isinstance(health_check, SessionLifecycleManager)
     assert health_check.session_id == "session-0"
+
+
+class RecordingFlightServer(FlightServerBase):  # type: ignore
+    def __init__(self) -> None:
+        super().__init__("grpc://localhost:0")
+        self.uploaded: list[pa.Table] = []
+
+    def do_put(self, context: Any, descriptor: Any, reader: Any, writer: Any) -> None:
+        self.uploaded.append(reader.read_all())
+
+
+@pytest.mark.parametrize("compression", [None, "lz4", "zstd"])
+def test_do_put_with_ipc_compression(compression: IpcCompression | None, retry_config_v2: RetryConfigV2) -> None:
+    table = pa.table({"nodeId": list(range(1000)), "labels": ["Person"] * 1000})
+
+    with RecordingFlightServer() as server:
+        with AuthenticatedArrowClient(
+            ("localhost", server.port), retry_config=retry_config_v2, ipc_compression=compression
+        ) as client:
+            put_stream, _ = client.do_put_with_retry(FlightDescriptor.for_command(b"upload"), table.schema)
+            with put_stream:
+                put_stream.write_table(table)
+
+        assert server.uploaded == [table]
+
+
+def test_ipc_compression_options(retry_config_v2: RetryConfigV2) -> None:
+    client = AuthenticatedArrowClient(("localhost", 8491), retry_config=retry_config_v2, ipc_compression="zstd")
+
+    write_options = client._ipc_write_options()
+    assert write_options is not None
+    assert write_options.compression == "zstd"
+    assert AuthenticatedArrowClient(("localhost", 8491), retry_config=retry_config_v2)._ipc_write_options() is None
+
+
+def test_ipc_compression_requires_available_codec(retry_config_v2: RetryConfigV2, mocker: MockerFixture) -> None:
+    codec = mocker.patch("graphdatascience.arrow_client.authenticated_flight_client.Codec")
+    codec.is_available.return_value = False
+
+    with pytest.raises(ValueError, match="The compression codec 'lz4' is not available"):
+        AuthenticatedArrowClient(("localhost", 8491), retry_config=retry_config_v2, ipc_compression="lz4")
+
+
+def test_retry_only_evicts_the_failing_pooled_client(retry_config_v2: RetryConfigV2, mocker: MockerFixture) -> None:
+    clients = [mocker.Mock(), mocker.Mock()]
+    clients[0].do_action.side_effect = FlightUnavailableError("Flight server is unavailable")
+    clients[1].do_action.return_value = iter(["done"])
+    mocker.patch.object(AuthenticatedArrowClient, "_instantiate_flight_client", side_effect=clients)
+
+    client = AuthenticatedArrowClient(("localhost", 8491), retry_config=retry_config_v2, client_pool_size=2)
+
+    # two concurrent calls fill the pool
+    with client._client_pool.lease() as first, client._client_pool.lease() as second:
+        assert [first, second] == clients
+
+    assert client.do_action_with_retry("v2/test.endpoint", {}) == ["done"]
+    clients[0].close.assert_called_once()
+    clients[1].close.assert_not_called()
+    assert client._client_pool.size() == 1
+
+
+def test_overlapping_streams_use_different_pooled_clients(
+    retry_config_v2: RetryConfigV2, mocker: MockerFixture
+) -> None:
+    mocker.patch.object(AuthenticatedArrowClient, "_instantiate_flight_client", side_effect=lambda: mocker.Mock())
+    client = AuthenticatedArrowClient(("localhost", 8491), retry_config=retry_config_v2, client_pool_size=3)
+
+    streams = [client.get_stream(Ticket(b"job")) for _ in range(3)]
+
+    assert len({id(stream._lease.client) for stream in streams}) == 3
+    assert client._client_pool.size() == 3
+
+    # a stream read completely returns its client to the pool
+    streams[0].read_all()
+    assert client.get_stream(Ticket(b"job"))._lease.client is streams[0]._lease.client
+
+
+def test_upload_stream_keeps_its_client_leased_until_closed(
+    retry_config_v2: RetryConfigV2, mocker: MockerFixture
+) -> None:
+    flight_client = mocker.Mock()
+    flight_client.do_put.return_value = (mocker.MagicMock(), mocker.Mock())
+    mocker.patch.object(AuthenticatedArrowClient, "_instantiate_flight_client", return_value=flight_client)
+    client = AuthenticatedArrowClient(("localhost", 8491), retry_config=retry_config_v2)
+
+    put_stream, _ = client.do_put_with_retry(FlightDescriptor.for_command(b"upload"), pa.schema([]))
+    client._client_pool.evict(flight_client)
+    flight_client.close.assert_not_called()
+
+    with put_stream:
+        pass
+
+    flight_client.close.assert_called_once()
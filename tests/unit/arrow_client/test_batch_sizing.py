@@ -0,0 +1,71 @@
+import pyarrow as pa
+import pytest
+
+from graphdatascience.arrow_client.batch_sizing import BatchByteBudget, BatchSizer
+
+
+def test_fixed_number_of_rows() -> None:
+    table = pa.table({"nodeId": list(range(5))})
+
+    batches = list(BatchSizer(2).batches(table))
+
+    assert [batch.num_rows for batch in batches] == [2, 2, 1]
+    assert pa.Table.from_batches(batches) == table
+
+
+def test_byte_budget_adapts_to_row_size() -> None:
+    # 8 bytes per row
+    edges = pa.table({"sourceNodeId": pa.array(range(1000), pa.int64())})
+    # 8 bytes for the id, 256 * 8 bytes for the feature list and 4 bytes for the list offset per row
+    features = pa.table(
+        {
+            "nodeId": pa.array(range(1000), pa.int64()),
+            "embedding": pa.array([[0.5] * 256] * 1000, pa.list_(pa.float64())),
+        }
+    )
+
+    sizer = BatchSizer(BatchByteBudget(target_bytes=4000, min_bytes=1000))
+
+    assert [batch.num_rows for batch in sizer.batches(edges)] == [500, 500]
+    feature_batches = list(sizer.batches(features))
+    assert {batch.num_rows for batch in feature_batches} == {1}
+    assert len(feature_batches) == 1000
+
+
+def test_empty_table_has_no_batches() -> None:
+    table = pa.table({"nodeId": pa.array([], pa.int64())})
+
+    assert list(BatchSizer(BatchByteBudget()).batches(table)) == []
+
+
+def test_byte_budget_is_tuned_from_ack_latency() -> None:
+    table = pa.table({"nodeId": pa.array(range(10_000), pa.int64())})
+    sizer = BatchSizer(BatchByteBudget(target_bytes=8000, target_ack_latency=1.0, min_bytes=2000, max_bytes=16000))
+
+    batches = sizer.batches(table)
+    assert next(batches).num_rows == 1000
+
+    sizer.acknowledged(5.0)
+    assert next(batches).num_rows == 500
+    sizer.acknowledged(5.0)
+    sizer.acknowledged(5.0)
+    assert next(batches).num_rows == 250
+
+    sizer.acknowledged(0.7)
+    assert next(batches).num_rows == 250
+
+    for _ in range(10):
+        sizer.acknowledged(0.1)
+    assert next(batches).num_rows == 2000
+
+
+def test_fixed_number_of_rows_ignores_ack_latency() -> None:
+    sizer = BatchSizer(3)
+    sizer.acknowledged(100.0)
+
+    assert [batch.num_rows for batch in sizer.batches(pa.table({"nodeId": list(range(4))}))] == [3, 1]
+
+
+def test_invalid_byte_budget() -> None:
+    with pytest.raises(ValueError, match="min_bytes <= target_bytes <= max_bytes"):
+        BatchByteBudget(target_bytes=10, min_bytes=100)
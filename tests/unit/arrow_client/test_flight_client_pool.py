@@ -0,0 +1,118 @@
+import threading
+
+import pytest
+from pytest_mock import MockerFixture
+
+from graphdatascience.arrow_client.flight_client_pool import FlightClientPool
+
+
+def test_call_checkout_reuses_idle_client(mocker: MockerFixture) -> None:
+    pool = FlightClientPool(mocker.Mock, max_size=3)
+
+    with pool.lease() as first:
+        pass
+    with pool.lease() as second:
+        pass
+
+    assert first is second
+    assert pool.size() == 1
+
+
+def test_call_checkout_creates_clients_for_concurrent_calls_up_to_max_size(mocker: MockerFixture) -> None:
+    pool = FlightClientPool(mocker.Mock, max_size=2)
+
+    with pool.lease() as first, pool.lease() as second, pool.lease() as third:
+        assert first is not second
+        # the pool is full, so the third call shares the least busy client
+        assert third in (first, second)
+
+    assert pool.size() == 2
+
+
+def test_thread_checkout_binds_each_thread_to_its_own_client(mocker: MockerFixture) -> None:
+    pool = FlightClientPool(mocker.Mock, max_size=4, checkout="thread")
+    leased: dict[str, list[object]] = {}
+    # both threads are alive when the second one leases, as only running threads keep their client
+    both_leased = threading.Barrier(2)
+
+    def lease_twice(name: str) -> None:
+        with pool.lease() as client:
+            leased[name] = [client]
+        both_leased.wait()
+        with pool.lease() as client:
+            leased[name].append(client)
+
+    threads = [threading.Thread(target=lease_twice, args=(name,)) for name in ("a", "b")]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert leased["a"][0] is leased["a"][1]
+    assert leased["b"][0] is leased["b"][1]
+    assert leased["a"][0] is not leased["b"][0]
+
+
+def test_thread_checkout_releases_the_binding_of_finished_threads(mocker: MockerFixture) -> None:
+    pool = FlightClientPool(mocker.Mock, max_size=4, checkout="thread")
+    leased: list[object] = []
+
+    def lease_once() -> None:
+        with pool.lease() as client:
+            leased.append(client)
+
+    # the finished threads stay referenced, so their bindings must not count once they are no longer alive
+    threads = [threading.Thread(target=lease_once) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+        thread.join()
+
+    assert all(client is leased[0] for client in leased)
+    assert pool.size() == 1
+
+
+def test_evicted_client_is_closed_and_replaced(mocker: MockerFixture) -> None:
+    pool = FlightClientPool(mocker.Mock, max_size=2, checkout="thread")
+
+    with pool.lease() as broken:
+        pool.evict(broken)
+
+    broken.close.assert_called_once()  # type: ignore[attr-defined]
+    with pool.lease() as replacement:
+        assert replacement is not broken
+    assert pool.size() == 1
+
+
+def test_close_closes_all_clients(mocker: MockerFixture) -> None:
+    pool = FlightClientPool(mocker.Mock, max_size=2)
+    with pool.lease() as first, pool.lease() as second:
+        pass
+
+    pool.close()
+
+    first.close.assert_called_once()  # type: ignore[attr-defined]
+    second.close.assert_called_once()  # type: ignore[attr-defined]
+    assert pool.size() == 0
+
+
+def test_rejects_empty_pool(mocker: MockerFixture) -> None:
+    with pytest.raises(ValueError, match="must be at least 1"):
+        FlightClientPool(mocker.Mock, max_size=0)
+
+
+def test_evicted_client_is_closed_once_its_last_lease_is_released(mocker: MockerFixture) -> None:
+    pool = FlightClientPool(mocker.Mock, max_size=1)
+    first_lease = pool.checkout()
+    second_lease = pool.checkout()
+    broken = first_lease.client
+    assert second_lease.client is broken
+
+    pool.evict(broken)
+    first_lease.release()
+    first_lease.release()
+    broken.close.assert_not_called()  # type: ignore[attr-defined]
+
+    second_lease.release()
+    broken.close.assert_called_once()  # type: ignore[attr-defined]
+    with pool.lease() as replacement:
+        assert replacement is not broken
@@ -0,0 +1,149 @@
+import threading
+from pathlib import Path
+
+import pyarrow
+import pytest
+from pytest_mock import MockerFixture
+
+from graphdatascience.arrow_client.result_cache import ResultCache
+from graphdatascience.arrow_client.v2.api_types import JobIdConfig
+from graphdatascience.arrow_client.v2.job_client import JobClient
+from tests.unit.arrow_client.arrow_test_utils import ArrowTestResult
+
+
+def _table(num_rows: int) -> pyarrow.Table:
+    return pyarrow.table({"nodeId": pyarrow.array(range(num_rows), pyarrow.int64())})
+
+
+def test_get_and_put() -> None:
+    cache = ResultCache()
+    table = _table(3)
+
+    assert cache.get("g", "job-1") is None
+    cache.put("g", "job-1", table)
+
+    assert cache.memory_bytes() == table.nbytes
+    assert cache.get("g", "job-1") is table
+
+
+def test_evicts_least_recently_used_results() -> None:
+    cache = ResultCache(max_bytes=_table(10).nbytes * 2)
+    cache.put("g", "job-1", _table(10))
+    cache.put("g", "job-2", _table(10))
+    cache.get("g", "job-1")
+
+    cache.put("g", "job-3", _table(10))
+
+    assert ("g", "job-1") in cache
+    assert ("g", "job-2") not in cache
+    assert ("g", "job-3") in cache
+    assert cache.memory_bytes() == _table(10).nbytes * 2
+
+
+def test_spills_evicted_results_to_ipc_files(tmp_path: Path) -> None:
+    cache = ResultCache(max_bytes=_table(10).nbytes, spill_directory=tmp_path)
+    cache.put("g", "job-1", _table(10))
+    cache.put("g", "job-2", _table(10))
+
+    assert len(list(tmp_path.rglob("*.arrow"))) == 1
+    assert cache.memory_bytes() == _table(10).nbytes
+
+    spilled = cache.get("g", "job-1")
+    assert spilled is not None
+    assert spilled.equals(_table(10))
+
+    cache.invalidate(job_id="job-1")
+    assert list(tmp_path.rglob("*.arrow")) == []
+
+
+def test_spilled_result_is_readable_while_invalidated_concurrently(tmp_path: Path, mocker: MockerFixture) -> None:
+    cache = ResultCache(max_bytes=_table(10).nbytes, spill_directory=tmp_path)
+    cache.put("g", "job-1", _table(10))
+    cache.put("g", "job-2", _table(10))
+    memory_map = pyarrow.memory_map
+
+    def invalidate_before_mapping(path: str) -> pyarrow.MemoryMappedFile:
+        invalidation = threading.Thread(target=cache.invalidate, kwargs={"job_id": "job-1"})
+        invalidation.start()
+        # the invalidation can only remove the spill file before it is mapped if `get` does not hold the lock
+        invalidation.join(timeout=0.2)
+        return memory_map(path)
+
+    mocker.patch("graphdatascience.arrow_client.result_cache.pyarrow.memory_map", side_effect=invalidate_before_mapping)
+
+    spilled = cache.get("g", "job-1")
+
+    assert spilled is not None
+    assert spilled.equals(_table(10))
+
+
+def test_close_and_detach_delete_spilled_results(tmp_path: Path, mocker: MockerFixture) -> None:
+    cache = ResultCache(max_bytes=0, spill_directory=tmp_path)
+    cache.put("g", "job-1", _table(10))
+    assert len(list(tmp_path.rglob("*.arrow"))) == 1
+
+    cache.close()
+    assert list(tmp_path.iterdir()) == []
+
+    client = mocker.Mock()
+    cache.attach(client)
+    cache.put("g", "job-2", _table(10))
+    assert len(list(tmp_path.rglob("*.arrow"))) == 1
+
+    ResultCache.detach(client)
+    assert ("g", "job-2") not in cache
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_invalidate_by_graph() -> None:
+    cache = ResultCache()
+    cache.put("g", "job-1", _table(1))
+    cache.put("other", "job-2", _table(1))
+    cache.put_summary("job-1", {"nodeCount": 1})
+    cache.put_summary("job-2", {"nodeCount": 2})
+
+    cache.invalidate(graph_name="g")
+
+    assert ("g", "job-1") not in cache
+    assert ("other", "job-2") in cache
+    assert cache.get_summary("job-1") is None
+    assert cache.get_summary("job-2") == {"nodeCount": 2}
+
+    cache.clear()
+    assert ("other", "job-2") not in cache
+    assert cache.memory_bytes() == 0
+
+
+def test_negative_budget() -> None:
+    with pytest.raises(ValueError, match="must not be negative"):
+        ResultCache(max_bytes=-1)
+
+
+def test_job_client_reads_results_once(mocker: MockerFixture) -> None:
+    client = mocker.Mock()
+    client.do_action_with_retry.return_value = [ArrowTestResult(JobIdConfig(jobId="export-job").dump_camel())]
+    client.get_stream.return_value.read_all.return_value = _table(3)
+    ResultCache().attach(client)
+
+    first = JobClient.stream_results(client, "g", "job-1")
+    second = JobClient.stream_result_table(client, "g", "job-1")
+    batches = list(JobClient.stream_result_batches(client, "g", "job-1"))
+
+    assert first["nodeId"].tolist() == [0, 1, 2]
+    assert second.num_rows == 3
+    assert sum(batch.num_rows for batch in batches) == 3
+    client.do_action_with_retry.assert_called_once_with("v2/results.stream", {"graphName": "g", "jobId": "job-1"})
+    client.get_stream.assert_called_once()
+
+    ResultCache.detach(client)
+    assert ResultCache.of(client) is None
+
+
+def test_job_client_caches_summaries(mocker: MockerFixture) -> None:
+    client = mocker.Mock()
+    client.do_action_with_retry.return_value = [ArrowTestResult({"nodeCount": 42})]
+    ResultCache().attach(client)
+
+    assert JobClient.get_summary(client, "job-1") == {"nodeCount": 42}
+    assert JobClient.get_summary(client, "job-1") == {"nodeCount": 42}
+    client.do_action_with_retry.assert_called_once()
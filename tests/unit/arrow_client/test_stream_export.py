@@ -0,0 +1,76 @@
+from pathlib import Path
+from typing import Iterator
+
+import pyarrow
+import pyarrow.dataset
+import pyarrow.parquet
+import pytest
+
+from graphdatascience.arrow_client.stream_export import export_stream, map_stream
+
+SCHEMA = pyarrow.schema([("nodeId", pyarrow.int64()), ("label", pyarrow.string())])
+
+
+def _reader(*batches: dict[str, list[object]]) -> pyarrow.RecordBatchReader:
+    def generate() -> Iterator[pyarrow.RecordBatch]:
+        for batch in batches:
+            yield pyarrow.record_batch(batch, schema=SCHEMA)
+
+    return pyarrow.RecordBatchReader.from_batches(SCHEMA, generate())
+
+
+def test_export_to_parquet_writes_a_row_group_per_batch(tmp_path: Path) -> None:
+    path = tmp_path / "nodes.parquet"
+
+    written = export_stream(_reader({"nodeId": [0, 1], "label": ["A", "B"]}, {"nodeId": [2], "label": ["A"]}), path)
+
+    assert written == 3
+    parquet_file = pyarrow.parquet.ParquetFile(path)
+    assert parquet_file.num_row_groups == 2
+    assert parquet_file.read().column("nodeId").to_pylist() == [0, 1, 2]
+
+
+def test_export_to_ipc(tmp_path: Path) -> None:
+    path = tmp_path / "nodes.arrow"
+
+    written = export_stream(_reader({"nodeId": [0, 1], "label": ["A", "B"]}), path, "ipc")
+
+    assert written == 2
+    with pyarrow.memory_map(str(path)) as source:
+        assert pyarrow.ipc.open_file(source).read_all().column("label").to_pylist() == ["A", "B"]
+
+
+def test_export_empty_stream_keeps_schema(tmp_path: Path) -> None:
+    path = tmp_path / "empty.parquet"
+
+    assert export_stream(_reader(), path) == 0
+    assert pyarrow.parquet.read_schema(path).names == ["nodeId", "label"]
+
+
+def test_export_to_partitioned_dataset(tmp_path: Path) -> None:
+    written = export_stream(
+        _reader({"nodeId": [0, 1], "label": ["A", "B"]}, {"nodeId": [2], "label": ["A"]}),
+        tmp_path / "nodes",
+        "dataset",
+        partition_by=["label"],
+    )
+
+    assert written == 3
+    assert sorted(p.name for p in (tmp_path / "nodes").iterdir()) == ["label=A", "label=B"]
+    dataset = pyarrow.dataset.dataset(tmp_path / "nodes", partitioning="hive")
+    assert sorted(dataset.to_table(filter=pyarrow.dataset.field("label") == "A")["nodeId"].to_pylist()) == [0, 2]
+
+
+def test_export_rejects_partitioning_of_single_files(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="Partitioning is only supported for the 'dataset' format"):
+        export_stream(_reader(), tmp_path / "nodes.parquet", "parquet", partition_by=["label"])
+
+
+def test_map_stream_maps_schema_and_batches() -> None:
+    mapped = map_stream(
+        _reader({"nodeId": [0], "label": ["A"]}, {"nodeId": [1], "label": ["B"]}),
+        lambda table: table.rename_columns({"label": "nodeLabel"}),
+    )
+
+    assert mapped.schema.names == ["nodeId", "nodeLabel"]
+    assert mapped.read_all().column("nodeLabel").to_pylist() == ["A", "B"]
@@ -0,0 +1,97 @@
+import pyarrow
+import pytest
+from pytest_mock import MockerFixture
+
+from graphdatascience.arrow_client.batch_sizing import BatchByteBudget, BatchSizer
+from graphdatascience.arrow_client.upload_ack_window import UploadAckWindow
+
+
+def _batch(num_rows: int) -> pyarrow.RecordBatch:
+    return pyarrow.record_batch({"nodeId": list(range(num_rows))})
+
+
+def test_acks_are_read_once_the_window_is_full(mocker: MockerFixture) -> None:
+    ack_stream = mocker.Mock()
+    progress: list[int] = []
+    window = UploadAckWindow(ack_stream, max_in_flight=3, progress_callback=lambda num_rows: progress.append(num_rows))
+
+    window.sent(_batch(10))
+    window.sent(_batch(20))
+    assert ack_stream.read.call_count == 0
+    assert progress == []
+
+    window.sent(_batch(30))
+    assert ack_stream.read.call_count == 1
+    assert progress == [10]
+
+    window.drain()
+    assert ack_stream.read.call_count == 3
+    assert progress == [10, 20, 30]
+
+
+def test_window_of_one_acknowledges_every_batch(mocker: MockerFixture) -> None:
+    ack_stream = mocker.Mock()
+    progress: list[int] = []
+    window = UploadAckWindow(ack_stream, max_in_flight=1, progress_callback=lambda num_rows: progress.append(num_rows))
+
+    window.sent(_batch(5))
+    assert progress == [5]
+    window.sent(_batch(7))
+    assert progress == [5, 7]
+
+
+def test_ack_errors_are_propagated(mocker: MockerFixture) -> None:
+    ack_stream = mocker.Mock()
+    ack_stream.read.side_effect = RuntimeError("rejected batch")
+    progress: list[int] = []
+    window = UploadAckWindow(ack_stream, max_in_flight=2, progress_callback=lambda num_rows: progress.append(num_rows))
+
+    window.sent(_batch(5))
+    with pytest.raises(RuntimeError, match="rejected batch"):
+        window.drain()
+    assert progress == []
+
+
+def test_rejects_empty_window(mocker: MockerFixture) -> None:
+    with pytest.raises(ValueError, match="must be at least 1"):
+        UploadAckWindow(mocker.Mock(), max_in_flight=0, progress_callback=lambda num_rows: None)
+
+
+def test_unacknowledged_batches_are_retained_in_order(mocker: MockerFixture) -> None:
+    ack_stream = mocker.Mock()
+    ack_stream.read.side_effect = [None, ConnectionError("stream broken")]
+    progress: list[int] = []
+    window = UploadAckWindow(ack_stream, max_in_flight=3, progress_callback=lambda num_rows: progress.append(num_rows))
+
+    window.sent(_batch(1))
+    window.sent(_batch(2))
+    window.sent(_batch(3))
+    assert [batch.num_rows for batch in window.unacknowledged()] == [2, 3]
+
+    with pytest.raises(ConnectionError):
+        window.drain()
+    assert [batch.num_rows for batch in window.unacknowledged()] == [2, 3]
+    assert progress == [1]
+
+
+def test_full_window_at_constant_server_latency_keeps_the_byte_budget(mocker: MockerFixture) -> None:
+    # the server needs 0.5 seconds per batch and processes the batches in order
+    server_latency = 0.5
+    clock = [0.0]
+    acks_at: list[float] = []
+    mocker.patch("graphdatascience.arrow_client.upload_ack_window.time.monotonic", side_effect=lambda: clock[0])
+
+    def read() -> None:
+        clock[0] = max(clock[0], acks_at.pop(0))
+
+    ack_stream = mocker.Mock()
+    ack_stream.read.side_effect = read
+    sizer = BatchSizer(BatchByteBudget(target_bytes=8000, target_ack_latency=0.6, min_bytes=1000, max_bytes=8000))
+    window = UploadAckWindow(ack_stream, 8, lambda num_rows: None, sizer.acknowledged)
+
+    for _ in range(50):
+        acks_at.append(max(clock[0], acks_at[-1] if acks_at else 0.0) + server_latency)
+        window.sent(_batch(10))
+    window.drain()
+
+    assert sizer._current_bytes == 8000
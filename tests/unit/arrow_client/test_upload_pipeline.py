@@ -0,0 +1,114 @@
+import threading
+from typing import Any, Iterator
+
+import pandas
+import pyarrow
+import pytest
+
+from graphdatascience.arrow_client.arrow_table_utils import table_from_pandas
+from graphdatascience.arrow_client.batch_sizing import BatchByteBudget, BatchSizer
+from graphdatascience.arrow_client.upload_pipeline import pandas_chunks, pandas_upload_batches, prefetch
+
+
+def test_pandas_upload_batches() -> None:
+    df = pandas.DataFrame({"nodeId": range(7), "name": [f"n{i}" for i in range(7)]})
+
+    batches = list(pandas_upload_batches(df, BatchSizer(2), chunk_rows=3, max_queued_chunks=1))
+
+    assert [batch.num_rows for batch in batches] == [2, 1, 2, 1, 1]
+    assert pyarrow.Table.from_batches(batches).column("nodeId").to_pylist() == list(range(7))
+    # the schema is the same for every batch, including large strings downcast for pandas 3
+    assert {batch.schema.field("name").type for batch in batches} == {pyarrow.string()}
+
+
+def test_pandas_upload_batches_apply_the_tuned_byte_budget_to_the_next_batch() -> None:
+    df = pandas.DataFrame({"nodeId": pandas.array(range(1000), dtype="int64")})
+    sizer = BatchSizer(BatchByteBudget(target_bytes=800, target_ack_latency=1.0, min_bytes=400, max_bytes=800))
+
+    batches = pandas_upload_batches(df, sizer, chunk_rows=1000)
+    first = next(batches)
+    # a slow acknowledgement halves the budget for the rest of the chunk which is already converted
+    sizer.acknowledged(5.0)
+    second = next(batches)
+
+    assert (first.num_rows, second.num_rows) == (100, 50)
+    assert first.num_rows + second.num_rows + sum(batch.num_rows for batch in batches) == 1000
+
+
+def test_pandas_chunks_share_schema_and_metadata() -> None:
+    df = pandas.DataFrame({"value": [1, None, None, 2]}, dtype=object)
+
+    chunks = list(pandas_chunks(df, chunk_rows=2))
+
+    assert len(chunks) == 2
+    assert chunks[1].schema.equals(chunks[0].schema, check_metadata=True)
+
+
+@pytest.mark.parametrize(
+    ("values", "expected_type"),
+    [
+        ([None, None, "a", "b"], pyarrow.string()),
+        # the first chunk only holds empty lists
+        ([[], [], [1.5], [2.0]], pyarrow.list_(pyarrow.float64())),
+        # the first chunk only holds ints
+        ([1, 2, 3.5, 4], pyarrow.float64()),
+    ],
+)
+def test_pandas_chunks_infer_types_from_the_whole_column(values: list[Any], expected_type: pyarrow.DataType) -> None:
+    df = pandas.DataFrame({"value": pandas.Series(values, dtype=object)})
+
+    chunks = list(pandas_chunks(df, chunk_rows=2))
+
+    assert len(chunks) == 2
+    assert {chunk.schema.field("value").type for chunk in chunks} == {expected_type}
+    assert chunks[1].schema.equals(chunks[0].schema, check_metadata=True)
+    assert pyarrow.concat_tables(chunks).equals(table_from_pandas(df).cast(chunks[0].schema))
+
+
+def test_prefetch_produces_ahead_of_the_consumer() -> None:
+    produced: list[int] = []
+    consumed = threading.Event()
+
+    def items() -> Iterator[int]:
+        for i in range(3):
+            produced.append(i)
+            yield i
+
+    iterator = prefetch(items(), max_queued=2)
+    assert next(iterator) == 0
+    # the remaining items are produced while the first one is being consumed
+    for _ in range(100):
+        if len(produced) == 3:
+            consumed.set()
+            break
+        threading.Event().wait(0.01)
+
+    assert consumed.is_set()
+    assert list(iterator) == [1, 2]
+
+
+def test_prefetch_raises_errors_of_the_producer() -> None:
+    def items() -> Iterator[int]:
+        yield 1
+        raise ValueError("conversion failed")
+
+    iterator = prefetch(items(), max_queued=1)
+
+    assert next(iterator) == 1
+    with pytest.raises(ValueError, match="conversion failed"):
+        next(iterator)
+
+
+def test_prefetch_stops_producer_when_closed() -> None:
+    produced: list[int] = []
+
+    def items() -> Iterator[int]:
+        for i in range(100):
+            produced.append(i)
+            yield i
+
+    iterator = prefetch(items(), max_queued=1)
+    assert next(iterator) == 0
+    iterator.close()  # type: ignore
+
+    assert len(produced) < 100
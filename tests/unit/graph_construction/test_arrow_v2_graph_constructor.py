@@ -0,0 +1,111 @@
+import threading
+from pathlib import Path
+from typing import Any
+
+import pyarrow
+import pyarrow.parquet
+import pytest
+from pandas import DataFrame
+from pyarrow import RecordBatchReader
+from pytest_mock import MockerFixture
+
+from graphdatascience.graph_construction.arrow_v2_graph_constructor import ArrowV2GraphConstructor
+
+MODULE = "graphdatascience.graph_construction.arrow_v2_graph_constructor"
+
+
+def test_uploads_partitions_on_concurrent_streams(mocker: MockerFixture) -> None:
+    gds_arrow_client = mocker.patch(f"{MODULE}.GdsArrowClient").return_value
+    gds_arrow_client.create_graph.return_value = "job-1"
+    mocker.patch(f"{MODULE}.JobClient")
+
+    uploaded_nodes: list[list[int]] = []
+    uploaded_rels: list[list[int]] = []
+    threads: set[int] = set()
+    barrier = threading.Barrier(2, timeout=5)
+
+    def upload_nodes(job_id: str, df: DataFrame, **kwargs: Any) -> None:
+        # both streams need to be open at the same time to pass the barrier
+        barrier.wait()
+        threads.add(threading.get_ident())
+        uploaded_nodes.append(df["nodeId"].tolist())
+        kwargs["progress_callback"](len(df))
+
+    def upload_relationships(job_id: str, df: DataFrame, **kwargs: Any) -> None:
+        uploaded_rels.append(df["sourceNodeId"].tolist())
+        kwargs["progress_callback"](len(df))
+
+    gds_arrow_client.upload_nodes.side_effect = upload_nodes
+    gds_arrow_client.upload_relationships.side_effect = upload_relationships
+
+    # partitions hold ten batches each
+    nodes = DataFrame({"nodeId": range(20)})
+    rels = DataFrame({"sourceNodeId": range(15), "targetNodeId": range(15)})
+
+    constructor = ArrowV2GraphConstructor(mocker.Mock(), "g", batch_size=1, show_progress=False, upload_concurrency=2)
+    constructor.run([nodes], [rels])
+
+    assert sorted(uploaded_nodes) == [list(range(10)), list(range(10, 20))]
+    assert len(threads) == 2
+    assert sorted(uploaded_rels) == [list(range(10)), list(range(10, 15))]
+    gds_arrow_client.node_load_done.assert_called_once_with("job-1")
+    gds_arrow_client.relationship_load_done.assert_called_once_with("job-1")
+    gds_arrow_client.abort_job.assert_not_called()
+
+
+def test_aborts_construction_if_one_stream_fails(mocker: MockerFixture) -> None:
+    gds_arrow_client = mocker.patch(f"{MODULE}.GdsArrowClient").return_value
+    gds_arrow_client.create_graph.return_value = "job-1"
+    mocker.patch(f"{MODULE}.JobClient")
+
+    started = threading.Event()
+    stopped = threading.Event()
+
+    def upload_nodes(job_id: str, df: DataFrame, **kwargs: Any) -> None:
+        if df["nodeId"].iloc[0] == 0:
+            # fail only once the other stream is running, otherwise it would be cancelled before it starts
+            started.wait(5)
+            raise RuntimeError("stream failed")
+        started.set()
+        # the other stream keeps sending until it observes the failure
+        for _ in range(500):
+            if kwargs["termination_flag"].is_set():
+                stopped.set()
+                return
+            threading.Event().wait(0.01)
+
+    gds_arrow_client.upload_nodes.side_effect = upload_nodes
+
+    constructor = ArrowV2GraphConstructor(mocker.Mock(), "g", batch_size=1, show_progress=False, upload_concurrency=2)
+
+    with pytest.raises(RuntimeError, match="stream failed"):
+        constructor.run([DataFrame({"nodeId": range(20)})], [])
+
+    assert stopped.is_set()
+    # the streams which observe the failure leave aborting the job to the constructor
+    assert all(not call.kwargs["abort_on_termination"] for call in gds_arrow_client.upload_nodes.call_args_list)
+    gds_arrow_client.abort_job.assert_called_once_with("job-1")
+    gds_arrow_client.node_load_done.assert_not_called()
+
+
+def test_uploads_arrow_file_partitions_as_readers(mocker: MockerFixture, tmp_path: Path) -> None:
+    gds_arrow_client = mocker.patch(f"{MODULE}.GdsArrowClient").return_value
+    gds_arrow_client.create_graph.return_value = "job-1"
+    mocker.patch(f"{MODULE}.JobClient")
+
+    uploaded: list[list[int]] = []
+
+    def upload_nodes(job_id: str, data: RecordBatchReader, **kwargs: Any) -> None:
+        uploaded.append(data.read_all().column("nodeId").to_pylist())
+
+    gds_arrow_client.upload_nodes.side_effect = upload_nodes
+
+    path = tmp_path / "nodes.parquet"
+    pyarrow.parquet.write_table(pyarrow.table({"nodeId": range(3)}), path)
+
+    constructor = ArrowV2GraphConstructor(mocker.Mock(), "g", show_progress=False)
+    constructor.run([path], [])
+
+    assert uploaded == [[0, 1, 2]]
+    gds_arrow_client.upload_relationships.assert_not_called()
+    gds_arrow_client.relationship_load_done.assert_called_once_with("job-1")
@@ -0,0 +1,99 @@
+from pathlib import Path
+
+import pyarrow
+import pyarrow.dataset
+import pyarrow.parquet
+import pytest
+from pandas import DataFrame
+from pyarrow import RecordBatchReader
+
+from graphdatascience.graph_construction.construct_input import (
+    input_partitions,
+    normalize_inputs,
+    read_input,
+)
+
+
+def _read_ids(data: DataFrame | RecordBatchReader) -> list[int]:
+    if isinstance(data, DataFrame):
+        return data["nodeId"].tolist()
+    return data.read_all().column("nodeId").to_pylist()  # type: ignore
+
+
+def test_normalize_inputs() -> None:
+    df = DataFrame({"nodeId": [1]})
+
+    assert normalize_inputs(None) == []
+    assert normalize_inputs("nodes.parquet") == ["nodes.parquet"]
+    assert normalize_inputs([df]) == [df]
+
+
+def test_dataframe_partitions() -> None:
+    partitions = input_partitions(DataFrame({"nodeId": range(5)}), lambda df: 2)
+
+    assert [p.num_rows for p in partitions] == [2, 2, 1]
+    assert [_read_ids(p.read()) for p in partitions] == [[0, 1], [2, 3], [4]]
+
+
+def test_parquet_file_is_read_lazily(tmp_path: Path) -> None:
+    path = tmp_path / "nodes.parquet"
+    pyarrow.parquet.write_table(pyarrow.table({"nodeId": range(4)}), path)
+
+    partitions = input_partitions(path, lambda df: 2)
+
+    assert [p.num_rows for p in partitions] == [4]
+    data = partitions[0].read()
+    assert isinstance(data, RecordBatchReader)
+    assert _read_ids(data) == [0, 1, 2, 3]
+
+
+def test_partitioned_dataset_has_a_partition_per_file(tmp_path: Path) -> None:
+    table = pyarrow.table({"nodeId": range(6), "labels": ["A", "B"] * 3})
+    pyarrow.dataset.write_dataset(
+        table, tmp_path, format="parquet", partitioning=["labels"], partitioning_flavor="hive"
+    )
+
+    partitions = input_partitions(str(tmp_path), lambda df: 2)
+
+    assert sorted(p.num_rows or 0 for p in partitions) == [3, 3]
+    tables = [p.read().read_all() for p in partitions]  # type: ignore
+    # the partition column is restored from the directory names
+    labels = {tuple(t.column("labels").to_pylist()) for t in tables}
+    assert labels == {("A", "A", "A"), ("B", "B", "B")}
+
+
+def test_ipc_file_is_split_into_batch_ranges(tmp_path: Path) -> None:
+    path = tmp_path / "nodes.arrow"
+    schema = pyarrow.schema([("nodeId", pyarrow.int64())])
+    with pyarrow.ipc.new_file(path, schema) as writer:
+        for i in range(12):
+            writer.write_batch(pyarrow.record_batch([pyarrow.array([2 * i, 2 * i + 1])], schema=schema))
+
+    partitions = input_partitions(path, lambda df: 2)
+
+    assert [p.num_rows for p in partitions] == [20, 4]
+    assert _read_ids(partitions[1].read()) == [20, 21, 22, 23]
+    assert _read_ids(partitions[0].read()) == list(range(20))
+
+
+def test_reader_is_a_single_partition_of_unknown_size() -> None:
+    reader = RecordBatchReader.from_batches(
+        pyarrow.schema([("nodeId", pyarrow.int64())]), iter([pyarrow.record_batch({"nodeId": [1, 2]})])
+    )
+
+    partitions = input_partitions(reader, lambda df: 1)
+
+    assert [p.num_rows for p in partitions] == [None]
+    assert partitions[0].read() is reader
+
+
+def test_read_input(tmp_path: Path) -> None:
+    path = tmp_path / "nodes.parquet"
+    pyarrow.parquet.write_table(pyarrow.table({"nodeId": [1, 2]}), path)
+
+    assert read_input(path)["nodeId"].tolist() == [1, 2]
+
+
+def test_unsupported_input() -> None:
+    with pytest.raises(ValueError, match="Unsupported construct input"):
+        input_partitions(42, lambda df: 1)  # type: ignore
@@ -0,0 +1,47 @@
+import numpy as np
+import pyarrow
+from pytest_mock import MockerFixture
+
+from graphdatascience.procedure_surface.api.job_handle import JobHandle
+
+RESULT = pyarrow.table({"sourceNodeId": [0, 1], "targetNodeId": [1, 2], "relationshipType": ["R", "R"]})
+
+
+def _finished_handle(mocker: MockerFixture, endpoint: str) -> JobHandle:
+    handle = JobHandle(mocker.Mock(), None, "job-1", "g", show_progress=False, endpoint=endpoint)
+    mocker.patch("graphdatascience.arrow_client.v2.job_client.JobClient.start_export_result", return_value="export")
+    mocker.patch.object(handle, "_ensure_done")
+    return handle
+
+
+def test_stream_as_arrow_applies_endpoint_mapper(mocker: MockerFixture) -> None:
+    handle = _finished_handle(mocker, "v2/similarity.knn")
+    mocker.patch("graphdatascience.arrow_client.v2.job_client.JobClient.get_stream_table", return_value=RESULT)
+
+    result = handle.stream(output_format="arrow")
+
+    assert isinstance(result, pyarrow.Table)
+    assert result.column_names == ["node1", "node2"]
+
+
+def test_stream_as_numpy(mocker: MockerFixture) -> None:
+    handle = _finished_handle(mocker, "v2/pathfinding.maxFlow")
+    mocker.patch("graphdatascience.arrow_client.v2.job_client.JobClient.get_stream_table", return_value=RESULT)
+
+    result = handle.stream(output_format="numpy")
+
+    assert list(result.keys()) == ["source", "target"]
+    np.testing.assert_array_equal(result["target"], np.array([1, 2]))
+
+
+def test_stream_batches_as_arrow(mocker: MockerFixture) -> None:
+    handle = _finished_handle(mocker, "v2/similarity.knn")
+    mocker.patch(
+        "graphdatascience.arrow_client.v2.job_client.JobClient.get_stream_batches",
+        return_value=iter(RESULT.to_batches(max_chunksize=1)),
+    )
+
+    tables = list(handle.stream_batches(output_format="arrow"))
+
+    assert [table.num_rows for table in tables] == [1, 1]
+    assert all(table.column_names == ["node1", "node2"] for table in tables)
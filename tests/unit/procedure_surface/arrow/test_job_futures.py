@@ -0,0 +1,156 @@
+import threading
+from concurrent.futures import CancelledError, ThreadPoolExecutor, as_completed, wait
+from typing import Any, Iterator
+from unittest import mock
+
+import pytest
+
+from graphdatascience.arrow_client.authenticated_flight_client import AuthenticatedArrowClient
+from graphdatascience.arrow_client.v2.job_client import JobClient
+from graphdatascience.procedure_surface.arrow.job_futures import JobFutureExecutor
+from graphdatascience.session import AuraGraphDataScience
+from graphdatascience.session.session_lifecycle_manager import Noop
+from tests.unit.arrow_client.arrow_test_utils import ArrowTestResult
+
+
+class FakeJobServer:
+    """Jobs finish once released, or are aborted once cancelled."""
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.started: list[str] = []
+        self.released: set[str] = set()
+        self.cancelled: list[str] = []
+
+    def do_action_with_retry(self, endpoint: str, payload: dict[str, Any]) -> Iterator[ArrowTestResult]:
+        with self.lock:
+            if endpoint == "v2/jobs.status":
+                job_id = payload["jobId"]
+                status = "Aborted" if job_id in self.cancelled else "Done" if job_id in self.released else "Running"
+                return iter([ArrowTestResult({"jobId": job_id, "status": status, "progress": -1, "description": ""})])
+            if endpoint == "v2/jobs.cancel":
+                self.cancelled.append(payload["jobId"])
+                return iter([])
+
+            job_id = f"job-{len(self.started)}"
+            self.started.append(job_id)
+            if payload.get("finishImmediately"):
+                self.released.add(job_id)
+            return iter([ArrowTestResult({"jobId": job_id})])
+
+    def client(self) -> AuthenticatedArrowClient:
+        client = mock.Mock(spec=AuthenticatedArrowClient)
+        client.do_action_with_retry.side_effect = self.do_action_with_retry
+        return client
+
+
+def run_algorithm(client: AuthenticatedArrowClient, source: int, finish_immediately: bool = True) -> int:
+    JobClient.run_job_and_wait(client, "v2/pathfinding.test", {"finishImmediately": finish_immediately}, False)
+    return source
+
+
+def test_futures_complete_with_the_results_of_the_calls() -> None:
+    client = FakeJobServer().client()
+
+    with JobFutureExecutor(client, max_concurrent_calls=4) as executor:
+        futures = [executor.submit(run_algorithm, client, source) for source in range(20)]
+        results = sorted(future.result() for future in as_completed(futures, timeout=10))
+
+    assert results == list(range(20))
+    assert all(len(future.job_ids()) == 1 for future in futures)
+
+
+def test_future_raises_the_error_of_the_call() -> None:
+    def failing() -> None:
+        raise ValueError("broken config")
+
+    with JobFutureExecutor(FakeJobServer().client()) as executor:
+        future = executor.submit(failing)
+
+        with pytest.raises(ValueError, match="broken config"):
+            future.result(timeout=10)
+
+
+def test_cancelling_a_running_call_cancels_its_job() -> None:
+    server = FakeJobServer()
+    client = server.client()
+
+    with JobFutureExecutor(client) as executor:
+        future = executor.submit(run_algorithm, client, 1, finish_immediately=False)
+        while not future.job_ids():
+            threading.Event().wait(0.01)
+
+        # a running future cannot be cancelled, but its call is stopped at the next wait for its job
+        assert not future.cancel()
+        assert wait([future], timeout=10).done == {future}
+        assert isinstance(future.exception(timeout=10), CancelledError)
+        with pytest.raises(CancelledError):
+            future.result(timeout=10)
+
+    assert server.cancelled == future.job_ids()
+
+
+def test_cancelling_a_pending_call_does_not_start_it() -> None:
+    server = FakeJobServer()
+    client = server.client()
+    blocker = threading.Event()
+
+    with JobFutureExecutor(client, max_concurrent_calls=1) as executor:
+        executor.submit(blocker.wait)
+        pending = executor.submit(run_algorithm, client, 1)
+
+        assert pending.cancel()
+        assert pending.cancelled()
+        blocker.set()
+
+    assert server.started == []
+
+
+def test_session_submits_endpoint_calls() -> None:
+    client = FakeJobServer().client()
+    gds = AuraGraphDataScience(client, db_query_runner=None, session_lifecycle_manager=Noop(), show_progress=False)
+
+    future = gds.submit(run_algorithm, client, 7)
+
+    assert future.result(timeout=10) == 7
+    gds.close()
+
+
+def test_failed_server_cancel_still_stops_the_call() -> None:
+    server = FakeJobServer()
+    client = server.client()
+
+    def do_action(endpoint: str, payload: dict[str, Any]) -> Iterator[ArrowTestResult]:
+        if endpoint == "v2/jobs.cancel":
+            raise RuntimeError("cancel failed")
+        return server.do_action_with_retry(endpoint, payload)
+
+    client.do_action_with_retry.side_effect = do_action  # type: ignore[attr-defined]
+
+    with JobFutureExecutor(client) as executor:
+        future = executor.submit(run_algorithm, client, 1, finish_immediately=False)
+        while not future.job_ids():
+            threading.Event().wait(0.01)
+
+        assert not future.cancel()
+        assert not future.cancelled()
+        # the call still stops at its next wait for the job
+        with pytest.raises(CancelledError):
+            future.result(timeout=10)
+
+
+def test_concurrent_submits_share_one_executor() -> None:
+    client = FakeJobServer().client()
+    gds = AuraGraphDataScience(client, db_query_runner=None, session_lifecycle_manager=Noop(), show_progress=False)
+    barrier = threading.Barrier(8)
+
+    def submit() -> Any:
+        barrier.wait()
+        gds.submit(run_algorithm, client, 1).result(timeout=10)
+        return gds._job_executor
+
+    with ThreadPoolExecutor(8) as pool:
+        executors = list(pool.map(lambda _: submit(), range(8)))
+
+    assert len({id(executor) for executor in executors}) == 1
+    gds.close()
@@ -0,0 +1,147 @@
+import threading
+from typing import Any
+from unittest import mock
+
+import pytest
+
+from graphdatascience.arrow_client.authenticated_flight_client import AuthenticatedArrowClient
+from graphdatascience.arrow_client.v2.api_types import JobStatus
+from graphdatascience.procedure_surface.arrow.job_scheduler import JobScheduler
+from graphdatascience.procedure_surface.arrow.jobs_arrow_endpoints import JobsArrowEndpoints
+
+JOB_CLIENT = "graphdatascience.procedure_surface.arrow.job_scheduler.JobClient"
+MUTATION_RUNNER = "graphdatascience.procedure_surface.arrow.job_scheduler.MutationRunner.run_mutation"
+
+
+class FakeJobs:
+    def __init__(self, failing_endpoint: str | None = None) -> None:
+        self.failing_endpoint = failing_endpoint
+        self.lock = threading.Lock()
+        self.started: list[str] = []
+        self.finished: list[str] = []
+        self.running = 0
+        self.max_running = 0
+        self.endpoints: dict[str, str] = {}
+        self.configs: dict[str, dict[str, Any]] = {}
+
+    def run_job(self, client: Any, endpoint: str, config: dict[str, Any]) -> str:
+        with self.lock:
+            job_id = f"job-{len(self.started)}"
+            self.started.append(endpoint)
+            self.endpoints[job_id] = endpoint
+            self.configs[endpoint] = config
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        return job_id
+
+    def wait_for_job(self, client: Any, job_id: str, **kwargs: Any) -> JobStatus:
+        threading.Event().wait(0.05)
+        with self.lock:
+            self.running -= 1
+            self.finished.append(self.endpoints[job_id])
+
+        status = "Aborted" if self.endpoints[job_id] == self.failing_endpoint else "Done"
+        return JobStatus(jobId=job_id, status=status, progress=1.0, description="")
+
+    def get_summary(self, client: Any, job_id: str) -> dict[str, Any]:
+        return {"endpoint": self.endpoints[job_id], "configuration": {"jobId": job_id, "writeConcurrency": 4}}
+
+
+def _scheduler(fake: FakeJobs, max_concurrent_jobs: int = 4) -> tuple[JobScheduler, Any]:
+    graph = mock.Mock()
+    graph.name.return_value = "g"
+    scheduler = JobScheduler(mock.Mock(spec=AuthenticatedArrowClient), graph, max_concurrent_jobs)
+
+    job_client = mock.patch(JOB_CLIENT)
+    patched = job_client.start()
+    patched.run_job.side_effect = fake.run_job
+    patched.return_value.wait_for_job.side_effect = fake.wait_for_job
+    patched.get_job_status.side_effect = AssertionError("the final status is returned by wait_for_job")
+    patched.get_summary.side_effect = fake.get_summary
+    return scheduler, job_client
+
+
+def test_runs_steps_after_their_dependencies() -> None:
+    fake = FakeJobs()
+    scheduler, job_client = _scheduler(fake)
+    try:
+        scheduler.add("wcc", "v2/community.wcc").add("pr", "v2/centrality.pageRank")
+        scheduler.add("louvain", "v2/community.louvain", depends_on=["wcc", "pr"])
+        summaries = scheduler.run()
+    finally:
+        job_client.stop()
+
+    assert set(fake.started[:2]) == {"v2/community.wcc", "v2/centrality.pageRank"}
+    assert fake.started[2] == "v2/community.louvain"
+    assert fake.finished[-1] == "v2/community.louvain"
+    assert summaries["louvain"] == {"endpoint": "v2/community.louvain", "configuration": {"jobId": "job-2"}}
+    assert fake.configs["v2/community.wcc"] == {"graphName": "g"}
+
+
+def test_respects_the_concurrency_budget() -> None:
+    fake = FakeJobs()
+    scheduler, job_client = _scheduler(fake, max_concurrent_jobs=2)
+    try:
+        for i in range(6):
+            scheduler.add(f"step-{i}", f"v2/endpoint-{i}")
+        scheduler.run()
+    finally:
+        job_client.stop()
+
+    assert len(fake.finished) == 6
+    assert fake.max_running == 2
+
+
+def test_chains_mutate_steps() -> None:
+    fake = FakeJobs()
+    scheduler, job_client = _scheduler(fake)
+    try:
+        with mock.patch(MUTATION_RUNNER, return_value={"nodePropertiesWritten": 3}) as run_mutation:
+            scheduler.add("frp", "v2/embeddings.fastrp", {"embedding_dimension": 8}, mutate_property="emb")
+            scheduler.add("knn", "v2/similarity.knn", {"node_properties": ["emb"]}, depends_on=["frp"])
+            summaries = scheduler.run()
+    finally:
+        job_client.stop()
+
+    run_mutation.assert_called_once_with("job-0", mutate_property="emb", mutate_relationship_type=None)
+    assert summaries["frp"] == {"nodePropertiesWritten": 3}
+    assert fake.configs["v2/embeddings.fastrp"] == {"graphName": "g", "embeddingDimension": 8}
+    assert fake.configs["v2/similarity.knn"]["nodeProperties"] == ["emb"]
+
+
+def test_stops_on_failure_and_cancels_running_jobs() -> None:
+    fake = FakeJobs(failing_endpoint="v2/fails")
+    scheduler, job_client = _scheduler(fake, max_concurrent_jobs=1)
+    try:
+        scheduler.add("fails", "v2/fails").add("after", "v2/after", depends_on=["fails"])
+        with pytest.raises(RuntimeError, match="was aborted"):
+            scheduler.run()
+    finally:
+        job_client.stop()
+
+    assert fake.started == ["v2/fails"]
+
+
+def test_rejects_invalid_workflows() -> None:
+    scheduler, job_client = _scheduler(FakeJobs())
+    job_client.stop()
+
+    with pytest.raises(ValueError, match="already exists"):
+        scheduler.add("a", "v2/a").add("a", "v2/a")
+
+    scheduler.add("b", "v2/b", depends_on=["c"]).add("c", "v2/c", depends_on=["b"])
+    with pytest.raises(ValueError, match="form a cycle"):
+        scheduler.run()
+
+    scheduler.add("d", "v2/d", depends_on=["missing"])
+    with pytest.raises(ValueError, match="unknown steps"):
+        scheduler.run()
+
+
+def test_jobs_endpoints_create_scheduler() -> None:
+    graph = mock.Mock()
+    graph.name.return_value = "g"
+    scheduler = JobsArrowEndpoints(mock.Mock(spec=AuthenticatedArrowClient)).scheduler(graph, max_concurrent_jobs=3)
+
+    assert isinstance(scheduler, JobScheduler)
+    assert scheduler.steps() == []
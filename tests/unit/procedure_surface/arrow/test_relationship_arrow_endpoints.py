@@ -0,0 +1,44 @@
+from pathlib import Path
+
+import pandas
+import pyarrow
+import pyarrow.parquet
+from pytest_mock import MockerFixture
+
+from graphdatascience.arrow_client.authenticated_flight_client import AuthenticatedArrowClient
+from graphdatascience.procedure_surface.arrow.catalog.relationship_arrow_endpoints import RelationshipArrowEndpoints
+
+
+def test_stream_to_file_writes_mapped_relationships(mocker: MockerFixture, tmp_path: Path) -> None:
+    result = pyarrow.table({"sourceNodeId": [0, 1], "targetNodeId": [1, 2], "relationshipType": ["R", "S"]})
+    run_job = mocker.patch("graphdatascience.arrow_client.v2.job_client.JobClient.run_job", return_value="job-1")
+    mocker.patch(
+        "graphdatascience.arrow_client.v2.job_client.JobClient.stream_result_reader",
+        return_value=pyarrow.RecordBatchReader.from_batches(result.schema, result.to_batches(max_chunksize=1)),
+    )
+    graph = mocker.Mock()
+    graph.name.return_value = "g"
+
+    endpoints = RelationshipArrowEndpoints(mocker.Mock(spec=AuthenticatedArrowClient), None)
+    written = endpoints.stream_to_file(
+        graph, tmp_path / "rels", file_format="dataset", partition_by=["relationshipType"]
+    )
+
+    assert written == 2
+    assert run_job.call_args.args[1] == "v2/graph.relationships.stream"
+    assert sorted(p.name for p in (tmp_path / "rels").iterdir()) == ["relationshipType=R", "relationshipType=S"]
+    assert sorted(pyarrow.parquet.read_table(tmp_path / "rels")["sourceNodeId"].to_pylist()) == [0, 1]
+
+
+def test_stream_with_categorical_relationship_types(mocker: MockerFixture) -> None:
+    result = pyarrow.table({"sourceNodeId": [0, 1, 2], "targetNodeId": [1, 2, 0], "relationshipType": ["R", "S", "R"]})
+    mocker.patch("graphdatascience.arrow_client.v2.job_client.JobClient.run_job", return_value="job-1")
+    mocker.patch("graphdatascience.arrow_client.v2.job_client.JobClient.stream_result_table", return_value=result)
+    graph = mocker.Mock()
+    graph.name.return_value = "g"
+
+    endpoints = RelationshipArrowEndpoints(mocker.Mock(spec=AuthenticatedArrowClient), None)
+    relationships = endpoints.stream(graph, keep_dictionaries=True)
+
+    assert isinstance(relationships["relationshipType"].dtype, pandas.CategoricalDtype)
+    assert relationships.by_rel_type() == {"R": [[0, 2], [1, 0]], "S": [[1], [2]]}
@@ -1,9 +1,17 @@
 from typing import Any, cast
 
+import pyarrow
 import pytest
-from pandas import DataFrame
+from pandas import ArrowDtype, DataFrame
 
-from graphdatascience.procedure_surface.arrow.stream_result_mapper import aggregate_traversal_rels, apply_stream_mapper
+from graphdatascience.procedure_surface.arrow.stream_result_mapper import (
+    _ARROW_STREAM_MAPPERS,
+    _STREAM_MAPPERS,
+    aggregate_traversal_rels,
+    apply_arrow_stream_mapper,
+    apply_stream_mapper,
+    supports_chunked_stream,
+)
 
 
 @pytest.mark.parametrize(
@@ -53,3 +61,87 @@ def test_aggregate_traversal_rels() -> None:
     assert actual.shape[0] == 1
     assert actual["sourceNode"].iat[0] == 0
     assert cast("Any", actual["nodeIds"].iat[0]).tolist() == [2, 1, 3]
+
+
+@pytest.mark.parametrize(
+    ("endpoint", "expected"),
+    [
+        ("v2/community.louvain", True),
+        ("v2/similarity.knn", True),
+        ("v2/graph.nodeProperties.stream", True),
+        ("v2/pathfinding.singleSource.dijkstra", False),
+        ("v2/pathfinding.topologicalSort", False),
+        ("v2/pathfinding.bfs", False),
+    ],
+)
+def test_supports_chunked_stream(endpoint: str, expected: bool) -> None:
+    assert supports_chunked_stream(endpoint) == expected
+
+
+RELATIONSHIP_RESULT = pyarrow.table(
+    {
+        "sourceNodeId": pyarrow.array([0, 0, 0], pyarrow.int64()),
+        "targetNodeId": pyarrow.array([3, 1, 2], pyarrow.int64()),
+        "relationshipType": ["REL", "REL", "REL"],
+        "index": pyarrow.array([2, 0, 1], pyarrow.int64()),
+        "cost": [1.0, 2.0, 3.0],
+    }
+)
+
+
+@pytest.mark.parametrize(
+    ("endpoint", "input"),
+    [
+        ("v2/similarity.knn", RELATIONSHIP_RESULT.drop_columns(["index"])),
+        ("v2/pathfinding.sourceTarget.dijkstra", RELATIONSHIP_RESULT.drop_columns(["index"])),
+        ("v2/pathfinding.maxFlow", RELATIONSHIP_RESULT),
+        ("v2/pathfinding.allShortestPaths", RELATIONSHIP_RESULT),
+        ("v2/pathfinding.steinerTree", RELATIONSHIP_RESULT),
+        ("v2/pathfinding.topologicalSort", pyarrow.table({"nodeId": [5, 6, 7], "index": [2, 0, 1]})),
+        ("v2/pathfinding.bfs", RELATIONSHIP_RESULT),
+        ("v2/community.conductance", pyarrow.table({"communityId": [0], "conductance": [0.5]})),
+        ("v2/community.cliquecounting", pyarrow.table({"nodeId": [0], "cliqueCount": [[1, 2]]})),
+        ("v2/community.louvain", pyarrow.table({"nodeId": [0], "communityId": [1]})),
+    ],
+)
+def test_apply_arrow_stream_mapper_matches_pandas_mapper(endpoint: str, input: pyarrow.Table) -> None:
+    expected = apply_stream_mapper(endpoint, input.to_pandas(types_mapper=ArrowDtype))
+    actual = apply_arrow_stream_mapper(endpoint, input)
+
+    assert actual.column_names == list(expected.columns)
+    assert actual.to_pylist() == [
+        {k: v.tolist() if hasattr(v, "tolist") else v for k, v in row.items()} for row in expected.to_dict("records")
+    ]
+
+
+def test_aggregate_traversal_rels_from_empty_table() -> None:
+    actual = apply_arrow_stream_mapper("v2/pathfinding.dfs", RELATIONSHIP_RESULT.slice(0, 0))
+
+    assert actual.column_names == ["sourceNode", "nodeIds"]
+    assert actual.num_rows == 0
+
+
+# holds every column renamed, dropped or read by one of the mappers
+MAPPED_RESULT = RELATIONSHIP_RESULT.append_column("communityId", pyarrow.array([0, 1, 1], pyarrow.int64()))
+MAPPED_RESULT = MAPPED_RESULT.append_column("community", pyarrow.array([[0], [1], [1, 2]]))
+MAPPED_RESULT = MAPPED_RESULT.append_column("cliqueCount", pyarrow.array([[1], [2], [3]]))
+MAPPED_RESULT = MAPPED_RESULT.append_column("labels", pyarrow.array([["A"], ["B"], []]))
+MAPPED_RESULT = MAPPED_RESULT.append_column("scaledProperties", pyarrow.array([[0.5], [1.0], [0.0]]))
+
+# the other mappers number the rows themselves or do not expect an index column
+INDEXED_RESULT_ENDPOINTS = {"v2/pathfinding.topologicalSort", "v2/pathfinding.bfs", "v2/pathfinding.dfs"}
+
+
+def test_arrow_stream_mappers_cover_the_pandas_mappers() -> None:
+    assert _ARROW_STREAM_MAPPERS.keys() == _STREAM_MAPPERS.keys()
+
+
+@pytest.mark.parametrize("endpoint", sorted(_STREAM_MAPPERS))
+def test_arrow_stream_mapper_yields_the_columns_of_the_pandas_mapper(endpoint: str) -> None:
+    input = MAPPED_RESULT if endpoint in INDEXED_RESULT_ENDPOINTS else MAPPED_RESULT.drop_columns(["index"])
+
+    expected = apply_stream_mapper(endpoint, input.to_pandas(types_mapper=ArrowDtype))
+    actual = apply_arrow_stream_mapper(endpoint, input)
+
+    assert actual.column_names == list(expected.columns)
+    assert actual.num_rows == len(expected)
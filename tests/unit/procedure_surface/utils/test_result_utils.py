@@ -8,7 +8,9 @@ from pandas import DataFrame
 from graphdatascience import ServerVersion
 from graphdatascience.procedure_surface.utils.result_utils import (
     join_db_node_properties,
+    transpose_property_column_chunks,
     transpose_property_columns,
+    transpose_relationship_property_column_chunks,
     transpose_relationship_property_columns,
 )
 from graphdatascience.query_runner import QueryRunner
@@ -166,3 +168,55 @@ def test_join_db_node_properties_partial_match(mock_query_runner: QueryRunner) -
     expected_output = pd.DataFrame({"nodeId": [1, 3], "property1": ["value1", np.nan], "property2": ["valueA", np.nan]})
 
     pd.testing.assert_frame_equal(expected_output, output)
+
+
+def test_transpose_property_column_chunks_matches_transposing_the_whole_result() -> None:
+    result = DataFrame(
+        {
+            "nodeId": [1, 1, 2, 2, 3, 3],
+            "nodeProperty": ["propB", "propA", "propB", "propA", "propB", "propA"],
+            "propertyValue": [10, 20, 30, 40, 50, 60],
+            "nodeLabels": [["Label1"], ["Label1"], ["Label2"], ["Label2"], ["Label1"], ["Label1"]],
+        }
+    )
+    # the properties of node 2 are split between chunks
+    chunks = [result.iloc[:3], result.iloc[3:4], result.iloc[4:]]
+
+    for list_node_labels in [False, True]:
+        pd.testing.assert_frame_equal(
+            transpose_property_column_chunks(chunks, list_node_labels),
+            transpose_property_columns(result, list_node_labels),
+        )
+
+
+def test_transpose_property_column_chunks_empty() -> None:
+    result = DataFrame(columns=["nodeId", "nodeProperty", "propertyValue"])
+
+    transposed_result = transpose_property_column_chunks([result], list_node_labels=False)
+
+    assert transposed_result.empty
+    assert list(transposed_result.columns) == ["nodeId"]
+
+
+def test_transpose_relationship_property_column_chunks() -> None:
+    result = DataFrame(
+        {
+            "sourceNodeId": [0, 0, 1, 1],
+            "targetNodeId": [1, 1, 2, 2],
+            "relationshipType": ["REL", "REL", "REL", "REL"],
+            "relationshipProperty": ["weight", "cost", "weight", "cost"],
+            "propertyValue": [1.0, 10.0, 2.0, 20.0],
+        }
+    )
+    chunks = [result.iloc[:1], result.iloc[1:]]
+
+    pd.testing.assert_frame_equal(
+        transpose_relationship_property_column_chunks(chunks, ["weight", "cost"]),
+        transpose_relationship_property_columns(result, ["weight", "cost"]),
+    )
+    pd.testing.assert_frame_equal(
+        transpose_relationship_property_column_chunks(
+            [chunk.drop(columns="relationshipProperty") for chunk in chunks], ["weight"]
+        ),
+        transpose_relationship_property_columns(result.drop(columns="relationshipProperty"), ["weight"]),
+    )
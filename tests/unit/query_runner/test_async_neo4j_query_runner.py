@@ -0,0 +1,133 @@
+import asyncio
+from typing import Any
+from unittest import mock
+
+import neo4j
+import pytest
+from pandas import DataFrame
+
+from graphdatascience.call_parameters import CallParameters
+from graphdatascience.error.gds_not_installed import GdsNotFound
+from graphdatascience.error.unable_to_connect import UnableToConnectError
+from graphdatascience.query_runner.async_neo4j_query_runner import AsyncNeo4jQueryRunner
+from graphdatascience.query_runner.query_type import QueryType
+
+
+def _query_runner(rows: list[list[Any]], columns: list[str]) -> tuple[AsyncNeo4jQueryRunner, mock.MagicMock]:
+    def run(*args: Any, **kwargs: Any) -> mock.MagicMock:
+        records = [neo4j.Record(zip(columns, row)) for row in rows]  # type: ignore[no-untyped-call]
+
+        async def fetch(n: int) -> list[Any]:
+            fetched = records[:n]
+            del records[:n]
+            return fetched
+
+        result = mock.MagicMock()
+        result.keys.return_value = columns
+        result.__aiter__.return_value = list(records)
+        result.fetch.side_effect = fetch
+        result.consume = mock.AsyncMock(return_value=mock.Mock(notifications=None, gql_status_objects=[]))
+        return result
+
+    driver = mock.MagicMock(spec=neo4j.AsyncDriver)
+    driver.verify_connectivity = mock.AsyncMock()
+    session = driver.session.return_value.__aenter__.return_value
+    session.run = mock.AsyncMock(side_effect=run)
+    session.last_bookmarks = mock.AsyncMock(return_value=None)
+
+    return AsyncNeo4jQueryRunner(driver, "neo4j", database="neo4j"), driver
+
+
+def test_run_cypher() -> None:
+    query_runner, driver = _query_runner([[1, "a"], [2, "b"]], ["id", "name"])
+
+    df = asyncio.run(query_runner.run_cypher("MATCH (n) RETURN n", QueryType.USER_DIRECTED))
+
+    assert df.equals(DataFrame({"id": [1, 2], "name": ["a", "b"]}))
+    driver.verify_connectivity.assert_awaited_once_with(database="neo4j")
+
+
+def test_concurrent_procedure_calls_share_the_driver() -> None:
+    query_runner, driver = _query_runner([["g"]], ["graphName"])
+
+    async def call_all() -> list[DataFrame]:
+        return await asyncio.gather(
+            *[
+                query_runner.call_procedure("gds.graph.list", params=CallParameters(graph_name=f"g{i}"))
+                for i in range(10)
+            ]
+        )
+
+    results = asyncio.run(call_all())
+
+    assert all(df.equals(DataFrame({"graphName": ["g"]})) for df in results)
+    assert driver.session.call_count == 10
+    assert (
+        query_runner.connectivity_stats().verifications + query_runner.connectivity_stats().skipped_verifications == 10
+    )
+
+
+def test_run_cypher_chunks() -> None:
+    query_runner, _ = _query_runner([[i] for i in range(5)], ["id"])
+
+    async def collect() -> list[DataFrame]:
+        return [
+            chunk async for chunk in query_runner.run_cypher_chunks("RETURN 1", QueryType.USER_DIRECTED, chunk_size=2)
+        ]
+
+    assert [len(chunk) for chunk in asyncio.run(collect())] == [2, 2, 1]
+
+
+def test_run_cypher_chunks_yields_the_columns_of_an_empty_result() -> None:
+    query_runner, _ = _query_runner([], ["id", "name"])
+
+    async def collect() -> list[DataFrame]:
+        return [chunk async for chunk in query_runner.run_cypher_chunks("RETURN 1", QueryType.USER_DIRECTED)]
+
+    chunks = asyncio.run(collect())
+
+    assert len(chunks) == 1
+    assert chunks[0].empty
+    assert list(chunks[0].columns) == ["id", "name"]
+
+
+def test_server_version_translates_errors_like_the_sync_runner() -> None:
+    driver = mock.MagicMock(spec=neo4j.AsyncDriver)
+    driver.execute_query = mock.AsyncMock(side_effect=neo4j.exceptions.ClientError("Unknown function 'gds.version'"))
+    query_runner = AsyncNeo4jQueryRunner(driver, "neo4j", auto_close=True)
+
+    with pytest.raises(GdsNotFound, match="not correctly installed on the Neo4j DBMS"):
+        asyncio.run(query_runner.server_version())
+    driver.close.assert_awaited_once()
+
+    driver.execute_query.side_effect = neo4j.exceptions.ServiceUnavailable("down")
+    with pytest.raises(UnableToConnectError):
+        asyncio.run(query_runner.server_version())
+
+
+def test_blocking_query_runner_runs_queries_on_the_event_loop() -> None:
+    query_runner, driver = _query_runner([[i] for i in range(3)], ["id"])
+
+    async def call_from_thread() -> tuple[DataFrame, list[DataFrame]]:
+        blocking = query_runner.blocking()
+        df = await asyncio.to_thread(blocking.call_procedure, "gds.graph.list")
+        chunks = await asyncio.to_thread(
+            lambda: list(blocking.run_cypher_chunks("RETURN 1", QueryType.USER_DIRECTED, chunk_size=2))
+        )
+        return df, chunks
+
+    df, chunks = asyncio.run(call_from_thread())
+
+    assert df.equals(DataFrame({"id": [0, 1, 2]}))
+    assert [len(chunk) for chunk in chunks] == [2, 1]
+    assert driver.session.call_count == 2
+
+
+def test_blocking_query_runner_fails_on_the_event_loop_thread() -> None:
+    query_runner, _ = _query_runner([], ["id"])
+
+    async def call_on_loop() -> None:
+        query_runner.blocking().run_cypher("RETURN 1", QueryType.USER_DIRECTED)
+
+    with pytest.raises(RuntimeError, match="cannot be used on the thread of its event loop"):
+        asyncio.run(call_on_loop())
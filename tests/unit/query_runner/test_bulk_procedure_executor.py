@@ -0,0 +1,114 @@
+import threading
+import time
+from typing import Any
+from unittest import mock
+
+import neo4j
+import pytest
+from pandas import DataFrame
+
+from graphdatascience.call_parameters import CallParameters
+from graphdatascience.query_runner.bulk_procedure_executor import BulkProcedureExecutor
+from graphdatascience.query_runner.neo4j_query_runner import Neo4jQueryRunner
+
+PROGRESS_BAR = "graphdatascience.query_runner.bulk_procedure_executor.TqdmProgressBar"
+
+
+def _query_runner() -> mock.Mock:
+    def call_procedure(endpoint: str, query_type: Any, params: CallParameters, *args: Any, **kwargs: Any) -> DataFrame:
+        time.sleep(params["delay"])
+        if params["source"] < 0:
+            raise RuntimeError(f"Invalid source {params['source']}")
+        return DataFrame({"source": [params["source"]]})
+
+    query_runner = mock.Mock(spec=Neo4jQueryRunner)
+    query_runner.call_procedure.side_effect = call_procedure
+    query_runner._resolve_show_progress.side_effect = lambda show_progress: show_progress
+    return query_runner
+
+
+def _params(sources: list[int]) -> list[CallParameters]:
+    # earlier calls take longer, so that they complete in reverse order
+    return [CallParameters(source=source, delay=0.01 * (len(sources) - i)) for i, source in enumerate(sources)]
+
+
+def test_results_are_yielded_in_order() -> None:
+    executor = BulkProcedureExecutor(_query_runner(), max_concurrent_calls=4, show_progress=False)
+
+    results = list(executor.run("gds.shortestPath.dijkstra.stream", _params(list(range(10)))))
+
+    assert [result.index for result in results] == list(range(10))
+    assert [result.result["source"][0] for result in results if result.result is not None] == list(range(10))
+
+
+def test_results_are_yielded_as_completed() -> None:
+    executor = BulkProcedureExecutor(_query_runner(), max_concurrent_calls=4, show_progress=False)
+
+    results = list(executor.run("gds.graph.filter", _params(list(range(4))), ordered=False))
+
+    assert [result.index for result in results] == [3, 2, 1, 0]
+
+
+def test_failing_calls_are_reported_per_item() -> None:
+    executor = BulkProcedureExecutor(_query_runner(), max_concurrent_calls=2, show_progress=False)
+
+    results = list(executor.run("gds.shortestPath.dijkstra.stream", _params([1, -1, 2])))
+
+    assert [result.ok() for result in results] == [True, False, True]
+    assert isinstance(results[1].error, RuntimeError)
+    assert results[1].result is None
+    assert results[1].params["source"] == -1
+
+
+def test_concurrent_calls_are_bounded() -> None:
+    running = 0
+    max_running = 0
+    lock = threading.Lock()
+
+    def call_procedure(*args: Any, **kwargs: Any) -> DataFrame:
+        nonlocal running, max_running
+        with lock:
+            running += 1
+            max_running = max(max_running, running)
+        time.sleep(0.005)
+        with lock:
+            running -= 1
+        return DataFrame()
+
+    query_runner = mock.Mock(spec=Neo4jQueryRunner)
+    query_runner.call_procedure.side_effect = call_procedure
+    query_runner._resolve_show_progress.side_effect = lambda show_progress: show_progress
+    executor = BulkProcedureExecutor(query_runner, max_concurrent_calls=3, show_progress=False)
+
+    results = list(executor.run("gds.graph.filter", [CallParameters(i=i) for i in range(30)]))
+
+    assert len(results) == 30
+    assert max_running <= 3
+
+
+def test_closing_early_skips_the_remaining_calls() -> None:
+    query_runner = _query_runner()
+    executor = BulkProcedureExecutor(query_runner, max_concurrent_calls=1, show_progress=False)
+
+    results = executor.run("gds.graph.filter", [CallParameters(source=i, delay=0) for i in range(100)])
+    next(results)
+    results.close()
+
+    assert query_runner.call_procedure.call_count < 100
+
+
+def test_invalid_concurrency() -> None:
+    with pytest.raises(ValueError, match="at least 1"):
+        BulkProcedureExecutor(_query_runner(), max_concurrent_calls=0)
+
+
+@pytest.mark.parametrize("runner_show_progress", [True, False])
+def test_progress_follows_the_setting_of_the_query_runner(runner_show_progress: bool) -> None:
+    query_runner = Neo4jQueryRunner(mock.MagicMock(spec=neo4j.Driver), "neo4j", show_progress=runner_show_progress)
+    query_runner.call_procedure = mock.Mock(return_value=DataFrame())  # type: ignore[method-assign]
+
+    with mock.patch(PROGRESS_BAR) as progress_bar:
+        results = list(query_runner.call_procedure_bulk("gds.graph.filter", [CallParameters(i=i) for i in range(3)]))
+
+    assert len(results) == 3
+    assert progress_bar.called == runner_show_progress
@@ -0,0 +1,58 @@
+import logging
+import warnings
+from unittest import mock
+
+import pytest
+
+from graphdatascience.query_runner.cypher_notifications import NotificationClassifier, install_notification_filters
+
+
+def _record(message: str) -> logging.LogRecord:
+    return logging.LogRecord("neo4j.notifications", logging.WARNING, __file__, 1, message, None, None)
+
+
+def test_filters_are_installed_once() -> None:
+    notifications_logger = logging.getLogger("neo4j.notifications")
+
+    with warnings.catch_warnings():
+        install_notification_filters()
+        filter_count, warning_filter_count = len(notifications_logger.filters), len(warnings.filters)
+
+        for _ in range(100):
+            install_notification_filters()
+
+        assert len(notifications_logger.filters) == filter_count
+        assert len(warnings.filters) == warning_filter_count
+
+
+def test_filters_are_installed_again_after_warning_filters_were_replaced() -> None:
+    with warnings.catch_warnings():
+        install_notification_filters()
+
+    with warnings.catch_warnings():
+        warnings.resetwarnings()
+        warnings.simplefilter("error")
+        install_notification_filters()
+
+        warnings.warn("pandas support is experimental and might be changed or removed in future versions")
+
+
+def test_only_deprecated_gds_field_notifications_are_dropped() -> None:
+    install_notification_filters()
+    notifications_logger = logging.getLogger("neo4j.notifications")
+
+    assert not notifications_logger.filter(
+        _record("The query used a deprecated field from a procedure. ('x' returned by 'gds.graph.list' is deprecated.)")
+    )
+    assert notifications_logger.filter(_record("The provided label is not in the database."))
+
+
+def test_classifier_warns_about_deprecations() -> None:
+    status = mock.Mock(raw_classification="DEPRECATION", status_description="The function is deprecated.")
+    field_status = mock.Mock(raw_classification="DEPRECATION", status_description="procedure field deprecated.")
+    summary = mock.Mock(gql_status_objects=[status, field_status], notifications=None)
+
+    with pytest.warns(DeprecationWarning, match="The function is deprecated.") as recorded:
+        NotificationClassifier(logging.getLogger()).handle(summary)
+
+    assert len(recorded) == 1
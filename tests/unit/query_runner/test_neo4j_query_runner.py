@@ -0,0 +1,152 @@
+from typing import Any
+from unittest import mock
+
+import neo4j
+import pytest
+from pandas import DataFrame
+
+from graphdatascience.call_parameters import CallParameters
+from graphdatascience.error.unable_to_connect import UnableToConnectError
+from graphdatascience.query_runner.neo4j_query_runner import ConnectivityAttempts, ConnectivityStats, Neo4jQueryRunner
+from graphdatascience.query_runner.query_type import QueryType
+
+
+def _query_runner(rows: list[list[Any]], columns: list[str]) -> tuple[Neo4jQueryRunner, mock.Mock]:
+    records = [neo4j.Record(zip(columns, row)) for row in rows]  # type: ignore[no-untyped-call]
+
+    def fetch(n: int) -> list[Any]:
+        fetched = records[:n]
+        del records[:n]
+        return fetched
+
+    result = mock.Mock()
+    result.keys.return_value = columns
+    result.fetch.side_effect = fetch
+    result.consume.return_value.notifications = None
+    result.consume.return_value.gql_status_objects = []
+
+    driver = mock.MagicMock(spec=neo4j.Driver)
+    session = driver.session.return_value.__enter__.return_value
+    session.run.return_value = result
+
+    query_runner = Neo4jQueryRunner(driver, "neo4j", database="neo4j")
+    query_runner._verify_connectivity = mock.Mock()  # type: ignore[method-assign]
+    return query_runner, driver
+
+
+def test_run_cypher_chunks_yields_chunks_of_the_fetch_size() -> None:
+    query_runner, driver = _query_runner([[i, f"n{i}"] for i in range(5)], ["id", "name"])
+
+    chunks = list(query_runner.run_cypher_chunks("MATCH (n) RETURN n", QueryType.USER_DIRECTED, chunk_size=2))
+
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    assert chunks[2].equals(DataFrame({"id": [4], "name": ["n4"]}))
+    assert driver.session.call_args.kwargs["fetch_size"] == 2
+
+
+def test_run_cypher_chunks_yields_the_columns_of_an_empty_result() -> None:
+    query_runner, _ = _query_runner([], ["id", "name"])
+
+    chunks = list(query_runner.run_cypher_chunks("MATCH (n) RETURN n", QueryType.USER_DIRECTED))
+
+    assert len(chunks) == 1
+    assert chunks[0].empty
+    assert list(chunks[0].columns) == ["id", "name"]
+
+
+def test_call_procedure_chunks_builds_the_procedure_call() -> None:
+    query_runner, driver = _query_runner([[1]], ["nodeId"])
+
+    chunks = list(
+        query_runner.call_procedure_chunks("gds.graph.nodeProperties.stream", params=CallParameters(graph_name="g"))
+    )
+
+    assert len(chunks) == 1
+    query = driver.session.return_value.__enter__.return_value.run.call_args.args[0]
+    assert query.text == "CALL gds.graph.nodeProperties.stream($graph_name)"
+    assert driver.session.call_args.kwargs["default_access_mode"] == neo4j.WRITE_ACCESS
+
+
+def test_run_cypher_chunks_rejects_invalid_chunk_size() -> None:
+    query_runner, _ = _query_runner([], [])
+
+    with pytest.raises(ValueError, match="at least 1"):
+        next(query_runner.run_cypher_chunks("RETURN 1", QueryType.USER_DIRECTED, chunk_size=0))
+
+
+def _verifying_query_runner(connectivity_ttl: float) -> tuple[Neo4jQueryRunner, mock.MagicMock]:
+    driver = mock.MagicMock(spec=neo4j.Driver)
+    result = driver.session.return_value.__enter__.return_value.run.return_value
+    result.keys.return_value = ["x"]
+    result.__iter__.side_effect = lambda: iter([])
+    result.consume.return_value.notifications = None
+    result.consume.return_value.gql_status_objects = []
+
+    return Neo4jQueryRunner(driver, "neo4j", database="neo4j", connectivity_ttl=connectivity_ttl), driver
+
+
+def test_connectivity_is_verified_once_within_the_ttl() -> None:
+    query_runner, driver = _verifying_query_runner(connectivity_ttl=60)
+
+    for _ in range(3):
+        query_runner.run_cypher("RETURN 1", QueryType.USER_DIRECTED)
+
+    driver.verify_connectivity.assert_called_once_with(database="neo4j")
+    assert query_runner.connectivity_stats() == ConnectivityStats(verifications=1, skipped_verifications=2)
+
+
+def test_connectivity_is_verified_again_after_the_ttl() -> None:
+    query_runner, driver = _verifying_query_runner(connectivity_ttl=60)
+
+    with mock.patch("graphdatascience.query_runner.neo4j_query_runner.time.monotonic", side_effect=[0, 10, 100, 100]):
+        query_runner.run_cypher("RETURN 1", QueryType.USER_DIRECTED)
+        query_runner.run_cypher("RETURN 1", QueryType.USER_DIRECTED)
+        query_runner.run_cypher("RETURN 1", QueryType.USER_DIRECTED)
+
+    assert driver.verify_connectivity.call_count == 2
+    assert query_runner.connectivity_stats() == ConnectivityStats(verifications=2, skipped_verifications=1)
+
+
+def test_connectivity_is_verified_again_after_a_connection_error() -> None:
+    query_runner, driver = _verifying_query_runner(connectivity_ttl=60)
+    session = driver.session.return_value.__enter__.return_value
+    result = session.run.return_value
+
+    query_runner.run_cypher("RETURN 1", QueryType.USER_DIRECTED)
+    session.run.side_effect = neo4j.exceptions.ServiceUnavailable("connection lost")
+    with pytest.raises(neo4j.exceptions.ServiceUnavailable):
+        query_runner.run_cypher("RETURN 1", QueryType.USER_DIRECTED)
+    session.run.side_effect = None
+    session.run.return_value = result
+    query_runner.run_cypher("RETURN 1", QueryType.USER_DIRECTED)
+
+    assert driver.verify_connectivity.call_count == 2
+    assert query_runner.connectivity_stats() == ConnectivityStats(
+        verifications=2, skipped_verifications=1, connection_errors=1
+    )
+
+
+def test_zero_ttl_verifies_before_every_query() -> None:
+    query_runner, driver = _verifying_query_runner(connectivity_ttl=0)
+
+    query_runner.run_cypher("RETURN 1", QueryType.USER_DIRECTED)
+    query_runner.run_cypher("RETURN 1", QueryType.USER_DIRECTED)
+
+    assert driver.verify_connectivity.call_count == 2
+
+
+def test_connectivity_attempts_raise_after_the_last_retry() -> None:
+    logger = mock.Mock()
+    attempts = ConnectivityAttempts(
+        Neo4jQueryRunner.ConnectivityRetriesConfig(max_retries=3, wait_time=2, warn_interval=2), logger, "database"
+    )
+    error = neo4j.exceptions.ServiceUnavailable("down")
+
+    waits = []
+    with pytest.raises(UnableToConnectError, match="Unable to connect to the database") as exc_info:
+        while attempts.next():
+            waits.append(attempts.failed(error))
+
+    assert waits == [2, 2, 2]
+    assert exc_info.value.__cause__ is error
+    assert logger.warning.call_count == 2
@@ -0,0 +1,66 @@
+from typing import Any
+
+import neo4j
+import pandas as pd
+import pyarrow as pa
+import pytest
+from neo4j.time import Date
+
+from graphdatascience.query_runner.record_columns import RecordColumnBuilder, records_to_pandas
+
+COLUMNS: dict[str, list[Any]] = {
+    "int": [1, 2, 3],
+    "intWithNull": [1, None, 3],
+    "float": [1.5, None, 2.0],
+    "mixedNumbers": [1, 2.5, None],
+    "string": ["a", None, "c"],
+    "bool": [True, False, True],
+    "boolWithNull": [True, None, False],
+    "list": [[1], [2, 3], None],
+    "map": [{"a": 1}, None, {"b": 2}],
+    "mixed": [1, "a", None],
+    "null": [None, None, None],
+    "date": [Date(2020, 1, 1), None, Date(2021, 1, 1)],
+}
+
+
+def _records(columns: dict[str, list[Any]]) -> list[neo4j.Record]:
+    return [neo4j.Record(zip(columns, row)) for row in zip(*columns.values())]  # type: ignore[no-untyped-call]
+
+
+def test_to_pandas_matches_the_driver_conversion() -> None:
+    records = _records(COLUMNS)
+
+    # what `neo4j.Result.to_df` does
+    expected = pd.DataFrame([record.values() for record in records], columns=list(COLUMNS))
+
+    pd.testing.assert_frame_equal(records_to_pandas(list(COLUMNS), records), expected)
+
+
+def test_to_pandas_of_empty_result_keeps_columns() -> None:
+    df = records_to_pandas(["a", "b"], [])
+
+    assert df.empty
+    assert list(df.columns) == ["a", "b"]
+
+
+def test_to_arrow_builds_typed_columns() -> None:
+    builder = RecordColumnBuilder(["nodeId", "score", "labels"])
+    builder.extend(_records({"nodeId": [0, 1], "score": [0.5, None], "labels": [["A"], ["A", "B"]]}))
+    builder.extend(_records({"nodeId": [2], "score": [1.0], "labels": [[]]}))
+
+    table = builder.to_arrow()
+
+    assert builder.num_rows() == 3
+    assert table.schema == pa.schema(
+        [("nodeId", pa.int64()), ("score", pa.float64()), ("labels", pa.list_(pa.string()))]
+    )
+    assert table.column("score").null_count == 1
+
+
+def test_to_arrow_rejects_values_without_arrow_type() -> None:
+    builder = RecordColumnBuilder(["date"])
+    builder.extend(_records({"date": [Date(2020, 1, 1)]}))
+
+    with pytest.raises(ValueError, match="column 'date' cannot be converted"):
+        builder.to_arrow()
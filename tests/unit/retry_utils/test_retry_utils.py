@@ -0,0 +1,75 @@
+import itertools
+
+import pytest
+
+from graphdatascience.retry_utils.retry_utils import AdaptivePollSchedule, job_wait_delays
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_job_wait_delays_repeat_the_last_delay() -> None:
+    delays = list(itertools.islice(job_wait_delays(), 110))
+
+    assert delays[0] == 0.02
+    assert delays[1:101] == [0.1] * 100
+    assert delays[101:] == [1.0, 2.0, 4.0] + [5.0] * 6
+
+
+def test_unknown_progress_uses_job_wait_delays() -> None:
+    schedule = AdaptivePollSchedule()
+
+    assert [schedule.next_delay(None) for _ in range(2)] == [0.02, 0.1]
+    assert schedule.next_delay(-1) == 0.1
+
+
+def test_schedules_halfway_to_predicted_completion() -> None:
+    clock = FakeClock()
+    schedule = AdaptivePollSchedule(min_delay=0.1, max_delay=30.0, clock=clock)
+
+    schedule.next_delay(0.0)
+    clock.now = 1.0
+    # 50% per second leaves one second, the next check is after half of it
+    assert schedule.next_delay(0.5) == pytest.approx(0.5)
+    clock.now = 1.5
+    assert schedule.next_delay(0.75) == pytest.approx(0.25)
+
+
+def test_long_jobs_are_polled_up_to_the_ceiling() -> None:
+    clock = FakeClock()
+    schedule = AdaptivePollSchedule(min_delay=0.1, max_delay=30.0, clock=clock)
+
+    schedule.next_delay(0.0)
+    clock.now = 60.0
+    assert schedule.next_delay(0.01) == 30.0
+
+
+def test_finished_progress_is_polled_at_the_floor() -> None:
+    clock = FakeClock()
+    schedule = AdaptivePollSchedule(min_delay=0.2, max_delay=30.0, clock=clock)
+
+    schedule.next_delay(0.5)
+    clock.now = 1.0
+    assert schedule.next_delay(1.0) == 0.2
+
+
+def test_progress_reset_restarts_the_estimate() -> None:
+    clock = FakeClock()
+    schedule = AdaptivePollSchedule(clock=clock)
+
+    schedule.next_delay(0.0)
+    clock.now = 1.0
+    schedule.next_delay(0.9)
+    clock.now = 2.0
+    # a new task started, so there is no rate to extrapolate yet
+    assert schedule.next_delay(0.1) == 0.1
+
+
+def test_invalid_bounds() -> None:
+    with pytest.raises(ValueError, match="min_delay <= max_delay"):
+        AdaptivePollSchedule(min_delay=2.0, max_delay=1.0)
@@ -1,22 +1,24 @@
 from unittest.mock import MagicMock
 
 import pytest
+from pyarrow import ArrowKeyError
 from pytest_mock import MockerFixture
 
 from graphdatascience.arrow_client.authenticated_flight_client import AuthenticatedArrowClient
+from graphdatascience.arrow_client.v2.api_types import JobStatus
 from graphdatascience.query_runner.query_runner import QueryRunner
 from graphdatascience.query_runner.termination_flag import TerminationFlagNoop
 from graphdatascience.session.remote_ops.project_protocols import ProjectProtocol
 from graphdatascience.session.remote_ops.projection_runner import ProjectionRunner
 from graphdatascience.session.remote_ops.status import Status
 
+JOB_STATUS = "graphdatascience.session.remote_ops.projection_runner.JobClient.get_job_status"
+
 
 @pytest.fixture(autouse=True)
-def stub_poll_progress(mocker: MockerFixture) -> None:
-    mocker.patch(
-        "graphdatascience.session.remote_ops.projection_runner.ProjectionRunner._poll_progress",
-        return_value=None,
-    )
+def stub_job_status(mocker: MockerFixture) -> MagicMock:
+    # the projection job is not known to the Arrow server unless a test says otherwise
+    return mocker.patch(JOB_STATUS, side_effect=ArrowKeyError("unknown job"))
 
 
 @pytest.fixture
@@ -160,3 +162,67 @@ def test_run_cypher_projection_closes_query_runner_on_error(arrow_client: MagicM
     # Current behavior: an exception during polling propagates without closing the projection runner.
     # If that changes, this assertion should be updated.
     projection_qr.close.assert_called()
+
+
+def test_completion_is_read_from_the_arrow_job_status(
+    arrow_client: MagicMock, projection_qr: MagicMock, stub_job_status: MagicMock, mocker: MockerFixture
+) -> None:
+    protocol = MagicMock(spec=ProjectProtocol)
+    protocol.start_cypher_projection.return_value = ("server-job", projection_qr)
+    protocol.get_status.side_effect = [
+        {"status": Status.RUNNING.name},
+        {"status": Status.DONE.name, "nodeCount": 7},
+    ]
+    stub_job_status.side_effect = [
+        ArrowKeyError("unknown job"),
+        JobStatus(jobId="my-job", status="Running", progress=0.5, description="Projecting"),
+        JobStatus(jobId="my-job", status="Done", progress=1.0, description="Projecting"),
+    ]
+    progress_bar = mocker.patch("graphdatascience.session.remote_ops.projection_runner.TqdmProgressBar")
+
+    runner = ProjectionRunner(protocol, arrow_client, TerminationFlagNoop())
+    result = runner.run_cypher_projection(graph_name="g", query="q", job_id="my-job")
+
+    assert result == {"status": Status.DONE.name, "nodeCount": 7}
+    # the DBMS is read while the job is unknown to the Arrow server and once it finished there, not while it runs
+    assert stub_job_status.call_count == 3
+    assert protocol.get_status.call_count == 2
+    progress_bar.return_value.update.assert_called_with("Done", 100.0, None)
+    progress_bar.return_value.finish.assert_called_once_with(success=True)
+
+
+def test_dbms_status_is_read_periodically_while_the_arrow_job_runs(
+    arrow_client: MagicMock, projection_qr: MagicMock, stub_job_status: MagicMock, mocker: MockerFixture
+) -> None:
+    protocol = MagicMock(spec=ProjectProtocol)
+    protocol.start_cypher_projection.return_value = ("server-job", projection_qr)
+    protocol.get_status.side_effect = RuntimeError("projection failed on the DBMS")
+    stub_job_status.side_effect = None
+    stub_job_status.return_value = JobStatus(jobId="my-job", status="Running", progress=-1, description="")
+    # skip the waits between the checks
+    mocker.patch("tenacity.nap.time.sleep")
+
+    runner = ProjectionRunner(protocol, arrow_client, TerminationFlagNoop())
+    with pytest.raises(RuntimeError, match="projection failed on the DBMS"):
+        runner.run_cypher_projection(graph_name="g", query="q", job_id="my-job", show_progress=False)
+
+    assert stub_job_status.call_count == 10
+    protocol.get_status.assert_called_once()
+
+
+def test_progress_errors_do_not_fail_the_projection(
+    arrow_client: MagicMock, projection_qr: MagicMock, stub_job_status: MagicMock
+) -> None:
+    protocol = MagicMock(spec=ProjectProtocol)
+    protocol.start_cypher_projection.return_value = ("server-job", projection_qr)
+    protocol.get_status.side_effect = [
+        {"status": Status.RUNNING.name},
+        {"status": Status.RUNNING.name},
+        {"status": Status.DONE.name},
+    ]
+    stub_job_status.side_effect = RuntimeError("connection lost")
+
+    runner = ProjectionRunner(protocol, arrow_client, TerminationFlagNoop())
+
+    assert runner.run_cypher_projection(graph_name="g", query="q", job_id="my-job") == {"status": Status.DONE.name}
+    assert stub_job_status.call_count == 1
@@ -9,6 +9,7 @@ from pytest_mock import MockerFixture
 
 from graphdatascience import GdsSessions
 from graphdatascience.arrow_client.arrow_authentication import ArrowAuthentication
+from graphdatascience.arrow_client.result_cache import ResultCache
 from graphdatascience.query_runner.neo4j_query_runner import Neo4jQueryRunner
 from graphdatascience.session import AuraGraphDataScience
 from graphdatascience.session.algorithm_category import AlgorithmCategory
@@ -302,6 +303,7 @@ class FakeGdsSessions(GdsSessions):
         db_runner: Neo4jQueryRunner | None,
         arrow_client_options: dict[str, Any] | None = None,
         show_progress: bool = True,
+        result_cache: ResultCache | None = None,
     ) -> AuraGraphDataScience:
         self.construct_client_calls.append(
             {
@@ -312,6 +314,7 @@ class FakeGdsSessions(GdsSessions):
                 "db_runner": db_runner,
                 "arrow_client_options": arrow_client_options,
                 "show_progress": show_progress,
+                "result_cache": result_cache,
             }
         )
         return mock.MagicMock(spec=AuraGraphDataScience)